@@ -0,0 +1,239 @@
+"""
+Article Streams
+Incremental readers and an append-only NDJSON writer for scraper output,
+plus a resumable import checkpoint, so files of any size are written and
+imported with constant memory
+"""
+
+import json
+import mmap
+import os
+
+CHUNK_SIZE = 64 * 1024
+_WHITESPACE = ' \t\r\n'
+
+
+class _Reader:
+    """Character buffer over a text file, refilled on demand"""
+
+    def __init__(self, f, chunk_size):
+        self.f = f
+        self.chunk_size = chunk_size
+        self.buffer = ''
+        self.pos = 0
+        self.eof = False
+
+    def fill(self):
+        """Read another chunk, dropping what has been consumed; False at EOF"""
+        if self.eof:
+            return False
+        chunk = self.f.read(self.chunk_size)
+        if not chunk:
+            self.eof = True
+            return False
+        self.buffer = self.buffer[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def skip(self, chars=_WHITESPACE):
+        """Skip characters in chars; return the next character ('' at EOF)"""
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in chars:
+                self.pos += 1
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self.fill():
+                return ''
+
+    def expect(self, char):
+        if self.skip() != char:
+            raise ValueError(f"expected {char!r} at offset {self.pos}")
+        self.pos += 1
+
+    def value(self, decoder):
+        """Decode the next complete JSON value, reading more input as needed"""
+        self.skip()
+        while True:
+            try:
+                value, end = decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                if not self.fill():
+                    raise
+                continue
+            # A number could continue into the next chunk
+            if end == len(self.buffer) and not self.eof and isinstance(value, (int, float)):
+                self.fill()
+                continue
+            self.pos = end
+            return value
+
+
+def iter_json_articles(path, key='articles', chunk_size=CHUNK_SIZE):
+    """
+    Yield the objects of the top-level `key` array of a JSON document one at
+    a time (e.g. crime_news_data.json), holding roughly one article in memory
+    """
+    decoder = json.JSONDecoder()
+    with open(path, 'r', encoding='utf-8') as f:
+        reader = _Reader(f, chunk_size)
+        reader.expect('{')
+        if reader.skip() == '}':
+            return
+
+        while True:
+            name = reader.value(decoder)
+            reader.expect(':')
+            if name != key:
+                reader.value(decoder)  # metadata etc.: small, decoded and dropped
+            else:
+                reader.expect('[')
+                if reader.skip() != ']':
+                    while True:
+                        yield reader.value(decoder)
+                        if reader.skip() == ',':
+                            reader.pos += 1
+                            continue
+                        break
+                reader.expect(']')
+
+            separator = reader.skip()
+            reader.pos += 1
+            if separator == '}':
+                return
+            if separator != ',':
+                raise ValueError(f"expected ',' or '}}' at offset {reader.pos - 1}")
+
+
+def iter_ndjson_articles(path):
+    """
+    Yield the articles of an NDJSON file (one JSON object per line) through
+    a read-only memory map. A final line cut short by a crash is skipped.
+    """
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            for line in iter(mm.readline, b''):
+                if not line.strip():
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    if line.endswith(b'\n'):
+                        raise
+                    return
+
+
+def is_ndjson(path):
+    return path.endswith(('.ndjson', '.jsonl'))
+
+
+def iter_articles(path):
+    """Stream articles from a scraper output file in either format"""
+    if is_ndjson(path):
+        return iter_ndjson_articles(path)
+    return iter_json_articles(path)
+
+
+def metadata_path(path):
+    """Sidecar file holding the run metadata of an NDJSON file"""
+    return f"{path}.meta.json"
+
+
+def read_metadata(path):
+    """Run metadata from an NDJSON file's sidecar ({} if there is none)"""
+    if not os.path.exists(metadata_path(path)):
+        return {}
+    with open(metadata_path(path), encoding='utf-8') as f:
+        return json.load(f)
+
+
+class NDJSONWriter:
+    """
+    Append-only article sink: each article is written as one JSON line and
+    flushed immediately, so a crash keeps everything found so far
+    """
+
+    def __init__(self, path, append=False):
+        self.path = path
+        self.count = 0
+        self._file = open(path, 'a' if append else 'w', encoding='utf-8')
+
+    def write(self, article):
+        self._file.write(json.dumps(article, ensure_ascii=False, separators=(',', ':')) + '\n')
+        self._file.flush()
+        self.count += 1
+
+    def write_metadata(self, metadata):
+        """Write the compact metadata sidecar (replacing any earlier one)"""
+        temp_path = f"{metadata_path(self.path)}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(metadata, f, ensure_ascii=False, separators=(',', ':'))
+        os.replace(temp_path, metadata_path(self.path))
+
+    def close(self):
+        if not self._file.closed:
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self._file.close()
+
+
+def batched(items, size):
+    """Lists of up to size items from any iterable"""
+    batch = []
+    for item in items:
+        batch.append(item)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+class ImportCheckpoint:
+    """
+    Records how many articles of a source file have been written, so an
+    interrupted import resumes after the last committed batch. The
+    checkpoint is ignored if the source file has changed since.
+    """
+
+    def __init__(self, source_path, path=None):
+        self.source_path = source_path
+        self.path = path or f"{source_path}.checkpoint"
+
+    def _fingerprint(self):
+        stat = os.stat(self.source_path)
+        return {'source': os.path.abspath(self.source_path), 'size': stat.st_size, 'mtime': stat.st_mtime}
+
+    def load(self):
+        """Number of articles already imported (0 if none or stale)"""
+        if not os.path.exists(self.path):
+            return 0
+        with open(self.path, encoding='utf-8') as f:
+            state = json.load(f)
+        if state.get('file') != self._fingerprint():
+            return 0
+        return state.get('done', 0)
+
+    def save(self, done, complete=False):
+        # Write then rename, so a crash never leaves a half-written checkpoint
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump({'file': self._fingerprint(), 'done': done, 'complete': complete}, f)
+        os.replace(temp_path, self.path)
+
+    def finish(self, done):
+        """Record that the whole source file has been imported"""
+        self.save(done, complete=True)
+
+    def is_imported(self):
+        """True if an import finished with the source file and it has not changed since"""
+        if not os.path.exists(self.path) or not os.path.exists(self.source_path):
+            return False
+        with open(self.path, encoding='utf-8') as f:
+            state = json.load(f)
+        return bool(state.get('complete')) and state.get('file') == self._fingerprint()
+
+    def clear(self):
+        if os.path.exists(self.path):
+            os.remove(self.path)
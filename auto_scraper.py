@@ -5,18 +5,75 @@ Runs periodically to fetch new crime news and update MongoDB
 
 import json
 import requests
-from bs4 import BeautifulSoup
 from datetime import datetime
 import pymongo
 import os
 from dotenv import load_dotenv
 import time
 
-import feedparser
 import hashlib
+from near_duplicate import DEFAULT_THRESHOLD, NearDuplicateIndex
+from keyword_matcher import KeywordMatcher
+from gazetteer import INDIA, coordinates
+from crime_geo import geojson_point
+from db_schema import ensure_indexes
+from hotspot_cells import CELLS_COLLECTION, ensure_materialized, record_crimes
+from feed_fetcher import FeedFetcher, print_cache_savings, print_feed_timings
+from feed_state import MongoFeedState
+from response_cache import bump_data_version
+from run_metrics import RunMetrics
 
 load_dotenv()
 
+TOI_RSS_URLS = [
+    'https://timesofindia.indiatimes.com/rssfeeds/-2128838597.cms',  # India News
+    'https://timesofindia.indiatimes.com/rssfeeds/1081479906.cms',  # Mumbai News
+    'https://timesofindia.indiatimes.com/rssfeeds/2647163.cms',     # Delhi News
+    'https://timesofindia.indiatimes.com/rssfeeds/1898055.cms'      # Bangalore News
+]
+
+HT_RSS_URLS = [
+    'https://www.hindustantimes.com/feeds/rss/india-news/rssfeed.xml',
+    'https://www.hindustantimes.com/feeds/rss/mumbai-news/rssfeed.xml',
+    'https://www.hindustantimes.com/feeds/rss/delhi-news/rssfeed.xml'
+]
+
+# Titles mentioning any of these are treated as crime news
+CRIME_FILTER_KEYWORDS = ['murder', 'rape', 'theft', 'robbery', 'assault', 'kidnap',
+                         'crime', 'arrested', 'police', 'killed', 'attack', 'molest']
+
+# Crime types in priority order (first match wins)
+CRIME_TYPE_KEYWORDS = {
+    'murder': ['murder', 'killed', 'homicide', 'stabbed', 'shot dead'],
+    'rape': ['rape', 'sexual assault', 'molest', 'harassment'],
+    'theft': ['theft', 'stolen', 'burglary', 'robbery', 'loot', 'robbed'],
+    'kidnapping': ['kidnap', 'abduct', 'missing'],
+    'extortion': ['extortion', 'blackmail', 'ransom']
+}
+
+# Major Indian cities and their notable areas (first match wins)
+INDIAN_LOCATIONS = [
+    # Mumbai areas
+    'Andheri', 'Bandra', 'Borivali', 'Churchgate', 'Colaba', 'Dadar', 'Goregaon',
+    'Juhu', 'Kandivali', 'Kurla', 'Malad', 'Mulund', 'Powai', 'Santacruz',
+    'Vile Parle', 'Worli', 'Ghatkopar', 'Vikhroli', 'Bhandup', 'Chembur',
+    # Major cities
+    'Mumbai', 'Delhi', 'Bangalore', 'Bengaluru', 'Chennai', 'Kolkata', 'Hyderabad',
+    'Pune', 'Ahmedabad', 'Surat', 'Jaipur', 'Lucknow', 'Kanpur', 'Nagpur',
+    'Indore', 'Thane', 'Bhopal', 'Visakhapatnam', 'Patna', 'Vadodara',
+    'Ghaziabad', 'Ludhiana', 'Agra', 'Nashik', 'Faridabad', 'Meerut',
+    'Rajkot', 'Kalyan', 'Vasai', 'Varanasi', 'Srinagar', 'Aurangabad',
+    'Dhanbad', 'Amritsar', 'Navi Mumbai', 'Allahabad', 'Ranchi', 'Howrah',
+    'Coimbatore', 'Jabalpur', 'Gwalior', 'Vijayawada', 'Jodhpur', 'Madurai',
+    'Raipur', 'Kota', 'Chandigarh', 'Guwahati', 'Noida', 'Gurugram', 'Gurgaon'
+]
+
+# All three keyword tables compiled into one single-pass matcher
+KEYWORDS = KeywordMatcher()
+KEYWORDS.add_group('filter', CRIME_FILTER_KEYWORDS)
+KEYWORDS.add_group('crime', CRIME_TYPE_KEYWORDS)
+KEYWORDS.add_group('location', INDIAN_LOCATIONS, whole_words=True)
+
 class AutoCrimeScraper:
     def __init__(self):
         # MongoDB connection
@@ -28,46 +85,90 @@ class AutoCrimeScraper:
         self.db = self.client["fir_data"]
         self.collection = self.db["crime_news"]
         
-        # Create unique index on URL to prevent duplicates
-        self.collection.create_index([("news_url", 1)], unique=True)
-        self.collection.create_index([("created_at", -1)])
+        # Indexes (unique news_url prevents duplicates; see db_schema.py)
+        ensure_indexes(self.db)
+        # Syndicated copies of a story carry different URLs; MinHash/LSH
+        # bands on the title let them be found with one indexed query
+        self.title_index = NearDuplicateIndex(
+            float(os.getenv("TITLE_DUPLICATE_THRESHOLD", DEFAULT_THRESHOLD))
+        )
+        
+        # Materialized hotspot grid, kept current as articles are saved
+        self.hotspot_cells = self.db[CELLS_COLLECTION]
+        ensure_materialized(self.collection, self.hotspot_cells)
         
         self.headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64)'}
+        # Per-stage timings and counts, every stage keyed by feed URL (see run_metrics.py)
+        self.metrics = RunMetrics('auto_scraper')
+        self.record_feeds = {}  # news_url -> feed URL, for the 'inserted' counter
+        
+        # Feeds are downloaded concurrently; the cron runtime is mostly network wait
+        self.fetcher = FeedFetcher(
+            max_workers=int(os.getenv('FEED_MAX_WORKERS', 8)),
+            per_host=int(os.getenv('FEED_PER_HOST', 2)),
+            timeout=float(os.getenv('FEED_TIMEOUT', 15)),
+            deadline=float(os.getenv('FEED_DEADLINE', 60)),
+            headers=self.headers,
+            # Stored in Mongo because the Actions runner is fresh every run
+            state=MongoFeedState(self.db["feed_state"])
+        )
         
         print(f"✅ Connected to MongoDB. Current records: {self.collection.count_documents({})}")
     
-    def scrape_times_of_india_rss(self):
+    def fetch_feeds(self, rss_urls):
+        """Download feeds concurrently and report per-feed timings"""
+        start = time.monotonic()
+        feeds = self.fetcher.fetch_all(rss_urls)
+        for url, result in feeds.items():
+            self.metrics.add_time('fetch', result['elapsed'] - result['parse_elapsed'], url)
+            if result['feed'] is not None:
+                self.metrics.add_time('parse', result['parse_elapsed'], url)
+            self.metrics.count('bytes', result['bytes'], url)
+            self.metrics.count('entries', len(result['entries']), url)
+            if result['error']:
+                self.metrics.count('errors', 1, url)
+            if result['not_modified']:
+                self.metrics.count('not_modified', 1, url)
+        print_feed_timings(feeds)
+        print_cache_savings(feeds)
+        print(f"  Fetched {len(rss_urls)} feeds in {time.monotonic() - start:.2f}s")
+        return feeds
+    
+    def _new_entries(self, feeds, rss_url):
+        """Entries of rss_url not seen on a previous run, raising if its download failed"""
+        result = feeds[rss_url]
+        if result['error']:
+            raise RuntimeError(result['error'])
+        return result['entries']
+    
+    def scrape_times_of_india_rss(self, feeds=None):
         """Scrape Times of India India-wide RSS feed"""
         print("\n📡 Fetching Times of India RSS...")
         
-        rss_urls = [
-            'https://timesofindia.indiatimes.com/rssfeeds/-2128838597.cms',  # India News
-            'https://timesofindia.indiatimes.com/rssfeeds/1081479906.cms',  # Mumbai News
-            'https://timesofindia.indiatimes.com/rssfeeds/2647163.cms',     # Delhi News
-            'https://timesofindia.indiatimes.com/rssfeeds/1898055.cms'      # Bangalore News
-        ]
+        if feeds is None:
+            feeds = self.fetch_feeds(TOI_RSS_URLS)
         
         new_articles = []
         
-        for rss_url in rss_urls:
+        for rss_url in TOI_RSS_URLS:
             try:
-                feed = feedparser.parse(rss_url)
-                print(f"  Found {len(feed.entries)} articles in feed")
+                entries = self._new_entries(feeds, rss_url)
+                print(f"  Found {len(entries)} new articles in feed")
                 
-                for entry in feed.entries[:20]:  # Process latest 20
+                for entry in entries[:20]:  # Process latest 20
                     title = entry.get('title', '')
                     url = entry.get('link', '')
                     
                     # Check if crime-related
-                    crime_keywords = ['murder', 'rape', 'theft', 'robbery', 'assault', 'kidnap', 
-                                     'crime', 'arrested', 'police', 'killed', 'attack', 'molest']
-                    
-                    if any(keyword in title.lower() for keyword in crime_keywords):
+                    with self.metrics.timer('classify', rss_url):
+                        is_crime = KEYWORDS.match(title)['filter']
+                    if is_crime:
                         # Add all India crime news (removed Mumbai filter)
                         new_articles.append({
                             'title': title,
                             'url': url,
                             'source': 'Times of India',
+                            'feed': rss_url,
                             'published': entry.get('published', '')
                         })
             except Exception as e:
@@ -76,35 +177,32 @@ class AutoCrimeScraper:
         print(f"  ✅ Found {len(new_articles)} crime-related articles")
         return new_articles
     
-    def scrape_hindustan_times_rss(self):
+    def scrape_hindustan_times_rss(self, feeds=None):
         """Scrape Hindustan Times India RSS"""
         print("\n📡 Fetching Hindustan Times RSS...")
         
-        rss_urls = [
-            'https://www.hindustantimes.com/feeds/rss/india-news/rssfeed.xml',
-            'https://www.hindustantimes.com/feeds/rss/mumbai-news/rssfeed.xml',
-            'https://www.hindustantimes.com/feeds/rss/delhi-news/rssfeed.xml'
-        ]
+        if feeds is None:
+            feeds = self.fetch_feeds(HT_RSS_URLS)
         
         new_articles = []
         
-        for rss_url in rss_urls:
+        for rss_url in HT_RSS_URLS:
             try:
-                feed = feedparser.parse(rss_url)
-                print(f"  Found {len(feed.entries)} articles in feed")
+                entries = self._new_entries(feeds, rss_url)
+                print(f"  Found {len(entries)} new articles in feed")
                 
-                for entry in feed.entries[:20]:
+                for entry in entries[:20]:
                     title = entry.get('title', '')
                     url = entry.get('link', '')
                     
-                    crime_keywords = ['murder', 'rape', 'theft', 'robbery', 'assault', 'kidnap', 
-                                     'crime', 'arrested', 'police', 'killed', 'attack']
-                    
-                    if any(keyword in title.lower() for keyword in crime_keywords):
+                    with self.metrics.timer('classify', rss_url):
+                        is_crime = KEYWORDS.match(title)['filter']
+                    if is_crime:
                         new_articles.append({
                             'title': title,
                             'url': url,
                             'source': 'Hindustan Times',
+                            'feed': rss_url,
                             'published': entry.get('published', '')
                         })
             except Exception as e:
@@ -115,20 +213,7 @@ class AutoCrimeScraper:
     
     def classify_crime_type(self, text):
         """Classify crime type from text"""
-        text_lower = text.lower()
-        
-        if any(word in text_lower for word in ['murder', 'killed', 'homicide', 'stabbed', 'shot dead']):
-            return 'murder'
-        elif any(word in text_lower for word in ['rape', 'sexual assault', 'molest', 'harassment']):
-            return 'rape'
-        elif any(word in text_lower for word in ['theft', 'stolen', 'burglary', 'robbery', 'loot', 'robbed']):
-            return 'theft'
-        elif any(word in text_lower for word in ['kidnap', 'abduct', 'missing']):
-            return 'kidnapping'
-        elif any(word in text_lower for word in ['extortion', 'blackmail', 'ransom']):
-            return 'extortion'
-        else:
-            return 'other'
+        return KEYWORDS.first(text, 'crime', default='other')
     
     def determine_severity(self, crime_type):
         """Determine severity level"""
@@ -144,164 +229,183 @@ class AutoCrimeScraper:
     
     def extract_location(self, text):
         """Extract location from text - covers major Indian cities"""
-        # Major Indian cities and their notable areas
-        indian_locations = [
-            # Mumbai areas
-            'Andheri', 'Bandra', 'Borivali', 'Churchgate', 'Colaba', 'Dadar', 'Goregaon',
-            'Juhu', 'Kandivali', 'Kurla', 'Malad', 'Mulund', 'Powai', 'Santacruz',
-            'Vile Parle', 'Worli', 'Ghatkopar', 'Vikhroli', 'Bhandup', 'Chembur',
-            # Major cities
-            'Mumbai', 'Delhi', 'Bangalore', 'Bengaluru', 'Chennai', 'Kolkata', 'Hyderabad',
-            'Pune', 'Ahmedabad', 'Surat', 'Jaipur', 'Lucknow', 'Kanpur', 'Nagpur',
-            'Indore', 'Thane', 'Bhopal', 'Visakhapatnam', 'Patna', 'Vadodara',
-            'Ghaziabad', 'Ludhiana', 'Agra', 'Nashik', 'Faridabad', 'Meerut',
-            'Rajkot', 'Kalyan', 'Vasai', 'Varanasi', 'Srinagar', 'Aurangabad',
-            'Dhanbad', 'Amritsar', 'Navi Mumbai', 'Allahabad', 'Ranchi', 'Howrah',
-            'Coimbatore', 'Jabalpur', 'Gwalior', 'Vijayawada', 'Jodhpur', 'Madurai',
-            'Raipur', 'Kota', 'Chandigarh', 'Guwahati', 'Noida', 'Gurugram', 'Gurgaon'
-        ]
-        
-        text_lower = text.lower()
-        for location in indian_locations:
-            if location.lower() in text_lower:
-                return location
-        return "India"  # Default if no specific location found
+        return KEYWORDS.first(text, 'location', default="India")  # Default if no specific location found
     
     def get_coordinates(self, location):
         """Get approximate coordinates for Indian cities and areas"""
-        # Hardcoded coordinates for Indian cities and areas (faster than geocoding)
-        coords_map = {
-            # Mumbai and areas
-            'Mumbai': (19.0760, 72.8777),
-            'Andheri': (19.1136, 72.8697),
-            'Bandra': (19.0596, 72.8295),
-            'Borivali': (19.2403, 72.8565),
-            'Colaba': (18.9067, 72.8147),
-            'Dadar': (19.0178, 72.8478),
-            'Kurla': (19.0728, 72.8826),
-            'Malad': (19.1864, 72.8493),
-            'Worli': (19.0183, 72.8169),
-            'Ghatkopar': (19.0864, 72.9081),
-            'Powai': (19.1176, 72.9060),
-            'Navi Mumbai': (19.0330, 73.0297),
-            'Thane': (19.2183, 72.9781),
-            # Major cities
-            'Delhi': (28.7041, 77.1025),
-            'Bangalore': (12.9716, 77.5946),
-            'Bengaluru': (12.9716, 77.5946),
-            'Chennai': (13.0827, 80.2707),
-            'Kolkata': (22.5726, 88.3639),
-            'Hyderabad': (17.3850, 78.4867),
-            'Pune': (18.5204, 73.8567),
-            'Ahmedabad': (23.0225, 72.5714),
-            'Surat': (21.1702, 72.8311),
-            'Jaipur': (26.9124, 75.7873),
-            'Lucknow': (26.8467, 80.9462),
-            'Kanpur': (26.4499, 80.3319),
-            'Nagpur': (21.1458, 79.0882),
-            'Indore': (22.7196, 75.8577),
-            'Bhopal': (23.2599, 77.4126),
-            'Visakhapatnam': (17.6868, 83.2185),
-            'Patna': (25.5941, 85.1376),
-            'Vadodara': (22.3072, 73.1812),
-            'Ghaziabad': (28.6692, 77.4538),
-            'Ludhiana': (30.9010, 75.8573),
-            'Agra': (27.1767, 78.0081),
-            'Nashik': (19.9975, 73.7898),
-            'Faridabad': (28.4089, 77.3178),
-            'Meerut': (28.9845, 77.7064),
-            'Rajkot': (22.3039, 70.8022),
-            'Varanasi': (25.3176, 82.9739),
-            'Srinagar': (34.0837, 74.7973),
-            'Aurangabad': (19.8762, 75.3433),
-            'Amritsar': (31.6340, 74.8723),
-            'Allahabad': (25.4358, 81.8463),
-            'Ranchi': (23.3441, 85.3096),
-            'Howrah': (22.5958, 88.2636),
-            'Coimbatore': (11.0168, 76.9558),
-            'Vijayawada': (16.5062, 80.6480),
-            'Jodhpur': (26.2389, 73.0243),
-            'Madurai': (9.9252, 78.1198),
-            'Raipur': (21.2514, 81.6296),
-            'Kota': (25.2138, 75.8648),
-            'Chandigarh': (30.7333, 76.7794),
-            'Guwahati': (26.1445, 91.7362),
-            'Noida': (28.5355, 77.3910),
-            'Gurugram': (28.4595, 77.0266),
-            'Gurgaon': (28.4595, 77.0266),
-            'India': (20.5937, 78.9629)  # Center of India
+        # Bundled gazetteer (faster than geocoding); unknown places fall back to the centre of India
+        return coordinates(location) or (INDIA['latitude'], INDIA['longitude'])
+    
+    def build_record(self, article):
+        """Classify an RSS article and turn it into a crime_news document"""
+        # Metrics are keyed by the feed the article came from, like fetch/parse
+        source = article.get('feed') or article['source']
+        self.record_feeds[article['url']] = source
+        with self.metrics.timer('classify', source):
+            # One scan of the title finds both the crime type and the place
+            hits = KEYWORDS.match(article['title'])
+            crime_type = hits['crime'][0] if hits['crime'] else 'other'
+            location = hits['location'][0] if hits['location'] else "India"
+            severity = self.determine_severity(crime_type)
+        with self.metrics.timer('geocode', source):
+            latitude, longitude = self.get_coordinates(location)
+        
+        # Create FIR number from hash
+        fir_hash = hashlib.md5(article['url'].encode()).hexdigest()[:8].upper()
+        fir_number = f"FIR/{datetime.now().year}/{fir_hash}"
+        with self.metrics.timer('dedupe', source):
+            title_minhash = self.title_index.hasher.signature(article['title'])
+        
+        return {
+            'fir_number': fir_number,
+            'crime_type': crime_type,
+            'title': article['title'],
+            'description': article['title'],  # Use title as description for RSS
+            'location': location,
+            'latitude': latitude,
+            'longitude': longitude,
+            'location_geo': geojson_point(latitude, longitude),
+            'incident_date': article.get('published', datetime.now().isoformat()),
+            'source': article['source'],
+            'news_url': article['url'],
+            'image_url': None,  # Can be enhanced later
+            'severity_level': severity,
+            'title_minhash': title_minhash,
+            'title_bands': self.title_index.band_keys(title_minhash),
+            'created_at': datetime.now(),
+            'updated_at': datetime.now()
         }
+    
+    def drop_near_duplicates(self, records):
+        """
+        Remove records whose title nearly matches an article already stored
+        (or earlier in the batch) under a different URL
+        """
+        bands = sorted({band for record in records for band in record['title_bands']})
+        index = NearDuplicateIndex(self.title_index.threshold)
+        stored = self.collection.find({'title_bands': {'$in': bands}}, {'news_url': 1, 'title': 1, 'title_minhash': 1})
+        for doc in stored:
+            if doc.get('title_minhash'):
+                index.add(doc.get('title'), key=doc['news_url'], signature=doc['title_minhash'])
+        
+        kept = []
+        for record in records:
+            match, score = index.find(record['title'], record['title_minhash'])
+            if match is not None and match != record['news_url']:
+                print(f"  🔁 Near-duplicate ({score:.0%}): {record['title'][:60]}...")
+                continue
+            index.add(record['title'], key=record['news_url'], signature=record['title_minhash'])
+            kept.append(record)
+        return kept
+    
+    def save_records(self, records):
+        """
+        Write records in one unordered bulk upsert keyed on news_url.
+        $setOnInsert leaves existing articles untouched, so the unique
+        index does the duplicate check instead of a find_one per article.
+        Near-duplicate titles are dropped first (see drop_near_duplicates).
+        Returns {'inserted', 'duplicates', 'failed'} counts.
+        """
+        # Feeds overlap (e.g. TOI India and TOI Mumbai); keep one record per URL,
+        # and one per story when the same title is syndicated under other URLs
+        unique = list({record['news_url']: record for record in records}.values())
+        if unique:
+            with self.metrics.timer('dedupe'):
+                unique = self.drop_near_duplicates(unique)
+        counts = {'inserted': 0, 'duplicates': len(records) - len(unique), 'failed': 0}
+        if not unique:
+            return counts
+        
+        operations = [
+            pymongo.UpdateOne({'news_url': record['news_url']}, {'$setOnInsert': record}, upsert=True)
+            for record in unique
+        ]
+        
+        try:
+            with self.metrics.timer('write'):
+                result = self.collection.bulk_write(operations, ordered=False)
+            upserted = result.upserted_ids
+        except pymongo.errors.BulkWriteError as e:
+            # Concurrent inserts of the same URL surface as duplicate key errors
+            upserted = {item['index']: item['_id'] for item in e.details.get('upserted', [])}
+            for error in e.details.get('writeErrors', []):
+                if error.get('code') != 11000:
+                    counts['failed'] += 1
+                    print(f"  ❌ Error saving article: {error.get('errmsg')}")
+        except Exception as e:
+            print(f"  ❌ Error saving articles: {e}")
+            counts['failed'] = len(unique)
+            return counts
         
-        lat, lon = coords_map.get(location, coords_map['India'])
-        return lat, lon
+        inserted = [unique[index] for index in sorted(upserted)]
+        for record in inserted:
+            print(f"  ✅ Added: {record['title'][:60]}...")
+        with self.metrics.timer('hotspots'):
+            record_crimes(self.hotspot_cells, inserted)
+        if inserted:
+            bump_data_version(self.collection)
+        for record in inserted:
+            self.metrics.count('inserted', 1, self.record_feeds.get(record['news_url'], record['source']))
+        
+        counts['inserted'] = len(inserted)
+        counts['duplicates'] += len(unique) - len(inserted) - counts['failed']
+        return counts
     
     def process_and_save_article(self, article):
         """Process article and save to MongoDB"""
         try:
-            # Check if already exists
-            if self.collection.find_one({"news_url": article['url']}):
-                return False  # Already exists
-            
-            crime_type = self.classify_crime_type(article['title'])
-            location = self.extract_location(article['title'])
-            latitude, longitude = self.get_coordinates(location)
-            severity = self.determine_severity(crime_type)
-            
-            # Create FIR number from hash
-            fir_hash = hashlib.md5(article['url'].encode()).hexdigest()[:8].upper()
-            fir_number = f"FIR/{datetime.now().year}/{fir_hash}"
-            
-            crime_record = {
-                'fir_number': fir_number,
-                'crime_type': crime_type,
-                'title': article['title'],
-                'description': article['title'],  # Use title as description for RSS
-                'location': location,
-                'latitude': latitude,
-                'longitude': longitude,
-                'incident_date': article.get('published', datetime.now().isoformat()),
-                'source': article['source'],
-                'news_url': article['url'],
-                'image_url': None,  # Can be enhanced later
-                'severity_level': severity,
-                'created_at': datetime.now(),
-                'updated_at': datetime.now()
-            }
-            
-            # Insert into MongoDB
-            self.collection.insert_one(crime_record)
-            print(f"  ✅ Added: {article['title'][:60]}...")
-            return True
-            
-        except pymongo.errors.DuplicateKeyError:
-            return False  # Duplicate
+            return self.save_records([self.build_record(article)])['inserted'] == 1
         except Exception as e:
             print(f"  ❌ Error saving article: {e}")
             return False
     
     def run(self):
-        """Main scraping process"""
+        """Main scraping process; writes a run report (see run_metrics.py) either way"""
+        try:
+            new_count = self._run()
+        except BaseException:
+            self.metrics.finish('failed')
+            raise
+        self.metrics.finish()
+        return new_count
+    
+    def _run(self):
         print("\n" + "="*80)
         print("🚨 AUTOMATED CRIME NEWS SCRAPER")
         print("="*80)
         print(f"⏰ Started at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
         
-        # Collect articles from all sources
+        # Download every feed at once, then collect articles from all sources
+        feeds = self.fetch_feeds(TOI_RSS_URLS + HT_RSS_URLS)
         all_articles = []
-        all_articles.extend(self.scrape_times_of_india_rss())
-        all_articles.extend(self.scrape_hindustan_times_rss())
+        all_articles.extend(self.scrape_times_of_india_rss(feeds))
+        all_articles.extend(self.scrape_hindustan_times_rss(feeds))
         
         print(f"\n📊 Total articles found: {len(all_articles)}")
         
-        # Process and save
-        new_count = 0
+        # Process, then save everything in one bulk write
+        records = []
         for article in all_articles:
-            if self.process_and_save_article(article):
-                new_count += 1
+            self.metrics.count('articles', 1, article['feed'])
+            try:
+                records.append(self.build_record(article))
+            except Exception as e:
+                self.metrics.count('errors', 1, article['feed'])
+                print(f"  ❌ Error processing article: {e}")
+        
+        counts = self.save_records(records)
+        new_count = counts['inserted']
+        self.metrics.count('duplicates', counts['duplicates'])
+        self.metrics.count('write_failures', counts['failed'])
+        
+        # Only now advance the per-feed high-water marks
+        if counts['failed'] == 0:
+            self.fetcher.save_state(feeds)
         
         print("\n" + "="*80)
         print(f"✅ SCRAPING COMPLETE")
         print(f"   New articles added: {new_count}")
+        print(f"   Duplicates skipped: {counts['duplicates']}")
         print(f"   Total in database: {self.collection.count_documents({})}")
         print(f"   Finished at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
         print("="*80 + "\n")
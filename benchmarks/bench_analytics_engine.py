@@ -0,0 +1,118 @@
+"""
+Benchmark: row-at-a-time analytics vs the NumPy column store
+Runs risk score, time patterns and trends over 500k synthetic rows
+(hotspots are served from the materialized grid in hotspot_cells.py)
+"""
+
+import os
+import random
+import sys
+import time
+from collections import defaultdict
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from crime_analytics import CrimeAnalytics, SEVERITY_WEIGHTS
+from crime_columns import CrimeColumns, parse_timestamp
+from spatial_index import haversine_km
+
+ROWS = int(os.getenv('BENCH_ROWS', 500_000))
+SEVERITIES = ['Critical', 'High', 'Medium', 'Low']
+LOCATIONS = ['Andheri', 'Bandra', 'Kurla', 'Dadar', 'Powai', 'Malad', 'Thane']
+
+
+def generate_documents(count, rng):
+    now = datetime.now()
+    return [{
+        'latitude': rng.uniform(18.89, 19.30),
+        'longitude': rng.uniform(72.77, 73.10),
+        'severity_level': rng.choice(SEVERITIES),
+        'crime_type': rng.choice(['murder', 'theft', 'rape', 'kidnapping']),
+        'location': rng.choice(LOCATIONS),
+        'created_at': now - timedelta(days=rng.uniform(0, 60)),
+    } for _ in range(count)]
+
+
+# Legacy row-at-a-time implementations (the pre-NumPy code paths)
+
+def legacy_risk(crimes, latitude, longitude, radius_km=2):
+    now = datetime.now()
+    score = 0
+    for crime in crimes:
+        distance = haversine_km(latitude, longitude, crime['latitude'], crime['longitude'])
+        if distance <= radius_km:
+            recency = 1.0
+            days_ago = (now - crime['created_at']).days
+            if days_ago <= 7:
+                recency = 1.5
+            elif days_ago <= 30:
+                recency = 1.2
+            score += SEVERITY_WEIGHTS.get(crime['severity_level'], 5) * \
+                max(0, (radius_km - distance) / radius_km) * recency
+    return min(score, 100)
+
+
+def legacy_time_patterns(crimes):
+    hourly = defaultdict(int)
+    daily = defaultdict(int)
+    for crime in crimes:
+        dt = parse_timestamp(crime.get('incident_date') or crime.get('created_at'))
+        if dt:
+            hourly[dt.hour] += 1
+            daily[dt.strftime('%A')] += 1
+    return hourly, daily
+
+
+def legacy_trends(crimes, days=30):
+    cutoff = datetime.now() - timedelta(days=days)
+    daily = defaultdict(int)
+    for crime in crimes:
+        if crime['created_at'] >= cutoff:
+            daily[crime['created_at'].strftime('%Y-%m-%d')] += 1
+    return daily
+
+
+class InMemoryAnalytics(CrimeAnalytics):
+    """CrimeAnalytics over a prebuilt column store (no MongoDB needed)"""
+
+    def __init__(self, columns):
+        self.columns = columns
+
+    def _get_columns(self):
+        return self.columns
+
+
+def timed(fn, repeat=3):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def main():
+    rng = random.Random(7)
+    print(f"Generating {ROWS:,} documents...")
+    crimes = generate_documents(ROWS, rng)
+
+    start = time.perf_counter()
+    columns = CrimeColumns().with_documents(crimes)
+    print(f"Column load (one-off): {time.perf_counter() - start:.2f} s\n")
+    analytics = InMemoryAnalytics(columns)
+
+    cases = [
+        ('risk score', lambda: legacy_risk(crimes, 19.1, 72.9),
+         lambda: analytics.get_risk_score(19.1, 72.9)),
+        ('time patterns', lambda: legacy_time_patterns(crimes), analytics.get_time_patterns),
+        ('trends', lambda: legacy_trends(crimes), analytics.get_crime_trends),
+    ]
+
+    print(f"{'query':15s} {'rows (ms)':>12} {'numpy (ms)':>12} {'speedup':>8}")
+    for name, legacy, vectorized in cases:
+        legacy_ms = timed(legacy, repeat=1)
+        vector_ms = timed(vectorized)
+        print(f"{name:15s} {legacy_ms:>12.1f} {vector_ms:>12.1f} {legacy_ms / vector_ms:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+Benchmark: per-article find_one + insert_one vs one unordered bulk upsert
+Counts MongoDB round trips with a CommandListener. Needs a local mongod
+(BENCH_MONGO_URI, default mongodb://localhost:27017); uses a scratch database.
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import pymongo
+from pymongo import monitoring
+
+MONGO_URI = os.getenv('BENCH_MONGO_URI', 'mongodb://localhost:27017')
+ARTICLES = int(os.getenv('BENCH_ARTICLES', 140))  # ~7 feeds x 20 entries
+DUPLICATE_SHARE = 0.7  # most entries were already saved by the previous cron run
+
+
+class CommandCounter(monitoring.CommandListener):
+    def __init__(self):
+        self.count = 0
+
+    def started(self, event):
+        self.count += 1
+
+    def succeeded(self, event):
+        pass
+
+    def failed(self, event):
+        pass
+
+
+def make_records(prefix):
+    return [{
+        'title': f"Article {i}",
+        'news_url': f"https://news.example/{prefix}/{i}",
+        'crime_type': 'theft',
+        'latitude': 19.07,
+        'longitude': 72.87,
+    } for i in range(ARTICLES)]
+
+
+def per_article(collection, records):
+    inserted = 0
+    for record in records:
+        if collection.find_one({'news_url': record['news_url']}):
+            continue
+        try:
+            collection.insert_one(dict(record))
+            inserted += 1
+        except pymongo.errors.DuplicateKeyError:
+            pass
+    return inserted
+
+
+def bulk(collection, records):
+    operations = [
+        pymongo.UpdateOne({'news_url': r['news_url']}, {'$setOnInsert': r}, upsert=True)
+        for r in records
+    ]
+    return collection.bulk_write(operations, ordered=False).upserted_count
+
+
+def run(label, fn, collection, counter, prefix):
+    seeded = int(ARTICLES * DUPLICATE_SHARE)
+    records = make_records(prefix)
+    collection.insert_many([dict(r) for r in records[:seeded]])
+
+    counter.count = 0
+    start = time.perf_counter()
+    inserted = fn(collection, records)
+    elapsed = (time.perf_counter() - start) * 1000
+    print(f"{label:24s} {counter.count:>6} round trips  {elapsed:>8.1f} ms  "
+          f"inserted={inserted} duplicates={ARTICLES - inserted}")
+
+
+def main():
+    counter = CommandCounter()
+    client = pymongo.MongoClient(MONGO_URI, event_listeners=[counter], serverSelectionTimeoutMS=3000)
+    db = client['crimepulse_bench']
+    collection = db['crime_news']
+    collection.drop()
+    collection.create_index([('news_url', 1)], unique=True)
+
+    print(f"{ARTICLES} articles, {int(DUPLICATE_SHARE * 100)}% already stored\n")
+    run('find_one + insert_one', per_article, collection, counter, 'a')
+    run('bulk upsert', bulk, collection, counter, 'b')
+
+    client.drop_database('crimepulse_bench')
+    client.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Benchmark: sequential vs concurrent feed fetching
+Serves recorded feeds (built from crime_news_data.json) from a local stub
+HTTP server with simulated network latency, spread over several hostnames
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from xml.sax.saxutils import escape
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from feed_fetcher import FeedFetcher, print_feed_timings
+
+DATA_FILE = os.path.join(os.path.dirname(__file__), '..', 'crime_news_data.json')
+LATENCY = float(os.getenv('BENCH_FEED_LATENCY', 0.4))  # seconds per response
+FEEDS = 7
+# Loopback aliases stand in for separate news sites
+HOSTS = ['127.0.0.1', '127.0.0.2', '127.0.0.3']
+
+
+def build_feeds():
+    """Record-like RSS documents, 30 items each"""
+    with open(DATA_FILE, encoding='utf-8') as f:
+        articles = json.load(f)['articles']
+
+    feeds = []
+    for n in range(FEEDS):
+        items = ''.join(
+            f"<item><title>{escape(a['title'])}</title><link>{escape(a['link'])}</link>"
+            f"<pubDate>{escape(a['published_date'])}</pubDate></item>"
+            for a in articles[n * 30:(n + 1) * 30]
+        )
+        feeds.append(f'<?xml version="1.0"?><rss version="2.0"><channel><title>feed {n}</title>'
+                     f'{items}</channel></rss>'.encode('utf-8'))
+    return feeds
+
+
+def start_stub_server(feeds):
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            time.sleep(LATENCY)
+            body = feeds[int(self.path.strip('/').split('.')[0])]
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/rss+xml')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(('0.0.0.0', 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main():
+    feeds = build_feeds()
+    server = start_stub_server(feeds)
+    port = server.server_address[1]
+    urls = [f"http://{HOSTS[n % len(HOSTS)]}:{port}/{n}.xml" for n in range(FEEDS)]
+
+    for label, workers in [('sequential', 1), ('concurrent', 8)]:
+        fetcher = FeedFetcher(max_workers=workers, per_host=2, timeout=10, deadline=60)
+        start = time.perf_counter()
+        results = fetcher.fetch_all(urls)
+        wall = time.perf_counter() - start
+        entries = sum(len(r['feed'].entries) for r in results.values() if not r['error'])
+        print(f"\n{label}: {wall:.2f}s for {FEEDS} feeds ({entries} entries)")
+        print_feed_timings(results)
+
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
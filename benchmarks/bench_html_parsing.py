@@ -0,0 +1,140 @@
+"""
+Benchmark: BeautifulSoup(..., 'html.parser') vs html_parsing
+Times the three parsing jobs of the scraper and importer per document:
+a news listing page (parse + article extraction), the article-image lookup
+in a page's <head>, and tag stripping of RSS descriptions.
+
+    python benchmarks/bench_html_parsing.py [DIR]
+
+DIR holds saved pages (*.html) to use as listing/article fixtures; without
+it, pages shaped like the Mumbai news sites (script-heavy <head>, card
+grid, long article body) are generated.
+"""
+
+import glob
+import os
+import re
+import sys
+import time
+from bs4 import BeautifulSoup
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from html_parsing import PARSER, meta_image, parse_html, strip_tags
+
+FIXTURE_DIR = os.path.join(os.path.dirname(__file__), 'fixtures', 'html')
+ROUNDS = 20
+DESCRIPTIONS = 5000
+
+
+def head(i):
+    scripts = ''.join(f"<script>window.cfg{j}={{'slot':'ad-{j}','sizes':[[300,250],[728,90]]}};</script>"
+                      for j in range(40))
+    metas = ''.join(f'<meta name="keywords-{j}" content="mumbai, crime, police, {j}">' for j in range(30))
+    return (f'<head><meta charset="utf-8"><title>Mumbai crime {i}</title>{metas}'
+            f'<link rel="stylesheet" href="/static/site.css">{scripts}'
+            f'<meta name="twitter:image" content="https://img.example.com/t/{i}.jpg">'
+            f'<meta property="og:image" content="https://img.example.com/og/{i}.jpg"></head>')
+
+
+def listing_page(i):
+    cards = ''.join(
+        f'<div class="story-card"><a href="/city/mumbai/crime-{i}-{j}"><img src="/thumb/{j}.jpg" alt="">'
+        f'<h3 class="story-title">Man held for chain snatching in Dadar, case {j}</h3></a>'
+        f'<p class="summary">Police arrested the accused after CCTV footage &amp; witness accounts.</p>'
+        f'<span class="time">{j} min ago</span></div>'
+        for j in range(120))
+    nav = ''.join(f'<li><a href="/section/{j}">Section {j}</a></li>' for j in range(80))
+    return f'<!DOCTYPE html><html>{head(i)}<body><nav><ul>{nav}</ul></nav><main>{cards}</main></body></html>'
+
+
+def article_page(i):
+    body = ''.join(f'<p>Paragraph {j}: the Kurla police registered an FIR under relevant sections '
+                   f'and <a href="/tag/{j}">further probe</a> is on.</p>' for j in range(60))
+    return (f'<!DOCTYPE html><html>{head(i)}<body><article><h1>Robbery in Kurla</h1>'
+            f'<img src="/photo/{i}.jpg">{body}</article></body></html>')
+
+
+def description(i):
+    # Google News / publisher RSS style summaries
+    return (f'<a href="https://news.example.com/{i}" target="_blank">Extortion case filed in Andheri '
+            f'&#8211; accused demanded &#8377;5 lakh</a>&nbsp;&nbsp;<font color="#6f6f6f">Mid-Day</font>'
+            f'<p>Police said the complainant, a builder, received calls &amp; threats.</p>')
+
+
+def load_fixtures(directory):
+    paths = sorted(glob.glob(os.path.join(directory, '*.html')))
+    if paths:
+        pages = [open(path, 'rb').read() for path in paths]
+        return pages, pages, f"{len(pages)} saved pages from {directory}"
+    listings = [listing_page(i).encode() for i in range(5)]
+    articles = [article_page(i).encode() for i in range(5)]
+    return listings, articles, "generated pages (pass a directory of saved *.html to use real ones)"
+
+
+def extract_articles(soup):
+    """news_scraper.scrape_with_beautifulsoup's article lookup"""
+    articles = (soup.find_all('article')[:30] or
+                soup.find_all('div', class_=re.compile('story|news|item'))[:30] or
+                soup.select('.brief_box, .news-item, .story-card')[:30])
+    return [(a.find(['h1', 'h2', 'h3', 'h4']) or a.find('a')) for a in articles]
+
+
+def old_meta_image(soup):
+    """import_news_to_db's previous soup-based lookup"""
+    og_image = soup.find('meta', property='og:image')
+    if og_image and og_image.get('content'):
+        return og_image['content']
+    twitter_image = soup.find('meta', attrs={'name': 'twitter:image'})
+    if twitter_image and twitter_image.get('content'):
+        return twitter_image['content']
+    return None
+
+
+def head_of(page):
+    end = page.lower().find(b'</head>')
+    return page[:end + 7] if end != -1 else page
+
+
+def per_document(fn, documents, rounds):
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for document in documents:
+            fn(document)
+    return (time.perf_counter() - start) / (rounds * len(documents))
+
+
+def report(name, old, new):
+    print(f"  {name:34s} {old * 1e3:8.3f} ms -> {new * 1e3:8.3f} ms  ({old / new:5.1f}x)")
+
+
+def main():
+    directory = sys.argv[1] if len(sys.argv) > 1 else FIXTURE_DIR
+    listings, articles, source = load_fixtures(directory)
+    heads = [head_of(page) for page in articles]
+    descriptions = [description(i) for i in range(DESCRIPTIONS)]
+
+    # Same answers before timing anything
+    for page in heads:
+        assert meta_image(page) == old_meta_image(BeautifulSoup(page, 'html.parser'))
+    for page in listings:
+        assert len(extract_articles(parse_html(page))) == len(extract_articles(BeautifulSoup(page, 'html.parser')))
+
+    print(f"\n📄 {source}; parse_html uses '{PARSER}'")
+    print(f"  {'per document':34s} {'html.parser':>11s}    {'html_parsing':>11s}")
+    report("listing page: parse + extract",
+           per_document(lambda p: extract_articles(BeautifulSoup(p, 'html.parser')), listings, ROUNDS),
+           per_document(lambda p: extract_articles(parse_html(p)), listings, ROUNDS))
+    report("article image: <head> only",
+           per_document(lambda h: old_meta_image(BeautifulSoup(h, 'html.parser')), heads, ROUNDS * 5),
+           per_document(meta_image, heads, ROUNDS * 5))
+    report("article image: whole page",
+           per_document(lambda p: old_meta_image(BeautifulSoup(p, 'html.parser')), articles, ROUNDS),
+           per_document(meta_image, articles, ROUNDS))
+    report("RSS description: strip tags",
+           per_document(lambda d: BeautifulSoup(d, 'html.parser').get_text(strip=True), descriptions, 1),
+           per_document(strip_tags, descriptions, 1))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+Benchmark: per-keyword substring loops vs the compiled KeywordMatcher
+Classifies the articles in crime_news_data.json, replicated to 100k, with
+news_scraper's crime-type and Mumbai-area tables, then again with every
+gazetteer place name as an area to show how each approach scales
+"""
+
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from keyword_matcher import KeywordMatcher
+from gazetteer import INDIAN_CITIES, MUMBAI_LOCALITIES, MUMBAI_POLICE_STATIONS
+
+DATA_FILE = os.path.join(os.path.dirname(__file__), '..', 'crime_news_data.json')
+ARTICLES = 100_000
+
+# Copied from CrimeNewsScraper.__init__ (which needs Chrome to construct)
+CRIME_TYPES = {
+    'murder': ['murder', 'killed', 'homicide', 'stabbed', 'shot dead', 'strangled', 'body found'],
+    'theft': ['theft', 'stolen', 'burglary', 'robbery', 'loot', 'chain snatch', 'pickpocket', 'robbed'],
+    'kidnapping': ['kidnap', 'abduct', 'missing person', 'ransom'],
+    'rape': ['rape', 'sexual assault', 'molestation', 'molest', 'sexual harassment'],
+    'extortion': ['extortion', 'blackmail', 'threatened for money', 'hafta', 'ransom demand']
+}
+MUMBAI_AREAS = [
+    'Andheri', 'Bandra', 'Borivali', 'Churchgate', 'Colaba', 'Dadar', 'Goregaon',
+    'Juhu', 'Kandivali', 'Kurla', 'Malad', 'Mulund', 'Powai', 'Santacruz',
+    'Vile Parle', 'Worli', 'Mumbai', 'Ghatkopar', 'Vikhroli', 'Bhandup',
+    'Chembur', 'Dharavi', 'Mahim', 'Sion', 'Wadala', 'Parel', 'Lower Parel',
+    'Marine Drive', 'Malabar Hill', 'Fort', 'Nariman Point', 'Thane', 'Navi Mumbai',
+    'Vasai', 'Mira Road', 'Bhayander', 'Versova', 'Jogeshwari', 'Sakinaka'
+]
+GAZETTEER_AREAS = list(dict.fromkeys(
+    MUMBAI_AREAS + list(MUMBAI_LOCALITIES) + list(MUMBAI_POLICE_STATIONS) + list(INDIAN_CITIES)
+))
+
+
+def load_texts():
+    with open(DATA_FILE, encoding='utf-8') as f:
+        articles = json.load(f)['articles']
+    texts = [f"{a.get('title', '')} {a.get('description', '')}" for a in articles]
+    return (texts * (ARTICLES // len(texts) + 1))[:ARTICLES]
+
+
+def legacy_classify(text, areas):
+    """Baseline: the old nested substring loops"""
+    text_lower = text.lower()
+    crime_type = None
+    for label, keywords in CRIME_TYPES.items():
+        if any(keyword in text_lower for keyword in keywords):
+            crime_type = label
+            break
+    found = [area for area in areas if area.lower() in text_lower]
+    return crime_type, max(found, key=len) if found else "Mumbai"
+
+
+def matcher_classify(matcher, text):
+    hits = matcher.match(text)
+    crime_type = hits['crime'][0] if hits['crime'] else None
+    return crime_type, max(hits['location'], key=len) if hits['location'] else "Mumbai"
+
+
+def run(texts, areas):
+    matcher = KeywordMatcher()
+    matcher.add_group('crime', CRIME_TYPES)
+    matcher.add_group('location', areas, whole_words=True)
+    matcher.match('')  # compile outside the timed loop
+
+    start = time.perf_counter()
+    legacy = [legacy_classify(text, areas) for text in texts]
+    legacy_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    compiled = [matcher_classify(matcher, text) for text in texts]
+    matcher_time = time.perf_counter() - start
+
+    print(f"\n{len(texts):,} articles, {sum(map(len, CRIME_TYPES.values()))} crime keywords, "
+          f"{len(areas)} areas")
+    print(f"  substring loops: {legacy_time:.2f}s")
+    print(f"  KeywordMatcher:  {matcher_time:.2f}s  ({legacy_time / matcher_time:.1f}x)")
+
+    # Differences come from word boundaries (e.g. 'rape' in 'parapet' no longer matches)
+    differing = sorted({(t, a, b) for t, a, b in zip(texts, legacy, compiled) if a != b})
+    print(f"  {len(differing)} distinct articles classified differently")
+    for text, old, new in differing[:5]:
+        print(f"    {old} -> {new}: {text[:70]!r}")
+
+
+def main():
+    texts = load_texts()
+    run(texts, MUMBAI_AREAS)
+    run(texts, GAZETTEER_AREAS)
+
+
+if __name__ == "__main__":
+    main()
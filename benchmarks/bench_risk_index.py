@@ -0,0 +1,71 @@
+"""
+Benchmark: risk-score radius lookup
+Compares the full linear haversine scan with SpatialGridIndex at 10k/100k/1M points
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from spatial_index import SpatialGridIndex, haversine_km
+
+# Rough bounding box of Mumbai + Thane + Navi Mumbai
+LAT_RANGE = (18.89, 19.30)
+LON_RANGE = (72.77, 73.10)
+SIZES = [10_000, 100_000, 1_000_000]
+QUERIES = 20
+RADIUS_KM = 2
+
+
+def generate_points(count, rng):
+    """Generate synthetic crime points"""
+    return [
+        (rng.uniform(*LAT_RANGE), rng.uniform(*LON_RANGE), {'severity': 'Low'})
+        for _ in range(count)
+    ]
+
+
+def linear_scan(points, latitude, longitude, radius_km):
+    """Baseline: the old full-collection scan"""
+    results = []
+    for point_lat, point_lon, payload in points:
+        distance = haversine_km(latitude, longitude, point_lat, point_lon)
+        if distance <= radius_km:
+            results.append((distance, payload))
+    return results
+
+
+def time_queries(fn, queries):
+    start = time.perf_counter()
+    total = 0
+    for latitude, longitude in queries:
+        total += len(fn(latitude, longitude, RADIUS_KM))
+    return (time.perf_counter() - start) / len(queries) * 1000, total
+
+
+def main():
+    rng = random.Random(42)
+    queries = [(rng.uniform(*LAT_RANGE), rng.uniform(*LON_RANGE)) for _ in range(QUERIES)]
+
+    print(f"{'points':>10} {'build (s)':>10} {'scan (ms)':>10} {'grid (ms)':>10} {'speedup':>8}")
+    for size in SIZES:
+        points = generate_points(size, rng)
+
+        start = time.perf_counter()
+        index = SpatialGridIndex()
+        for latitude, longitude, payload in points:
+            index.add(latitude, longitude, payload)
+        build_time = time.perf_counter() - start
+
+        scan_ms, scan_hits = time_queries(lambda la, lo, r: linear_scan(points, la, lo, r), queries)
+        grid_ms, grid_hits = time_queries(index.query_radius, queries)
+        assert scan_hits == grid_hits, "grid index returned a different result set"
+
+        print(f"{size:>10,} {build_time:>10.2f} {scan_ms:>10.2f} {grid_ms:>10.2f} {scan_ms / grid_ms:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
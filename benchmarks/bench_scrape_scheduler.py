@@ -0,0 +1,167 @@
+"""
+Benchmark: sequential phases with global sleeps vs the concurrent scheduler
+Serves RSS feeds, listing pages and search results from local fixture
+servers (one port per news site, with simulated latency), points
+CrimeNewsScraper's source lists at them, and times a full run both ways.
+Pauses are scaled down by SLEEP_SCALE for both runs to keep this short.
+A last run serves enough RSS items to pass MIN_TARGET and checks that no
+fallback source was fetched and no renderer was started.
+"""
+
+import hashlib
+import os
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+TEMP_DIR = tempfile.mkdtemp()
+os.environ['GEOCODE_OFFLINE'] = '1'
+os.environ['GEOCODE_CACHE_PATH'] = os.path.join(TEMP_DIR, 'geocode_cache.db')
+
+import news_scraper
+from scrape_scheduler import ScrapeScheduler
+
+LATENCY = 0.3        # seconds per fixture response
+SLEEP_SCALE = 0.25   # applied to the old sleeps and to the politeness interval
+LEGACY_PAUSES = {'RSS': 1, 'Web': 2, 'Dynamic': 2, 'Search': 3}  # old per-source sleeps
+WORKERS = 8
+RSS_ITEMS = 2        # items per feed; RICH_RSS_ITEMS for the RSS-only run
+RICH_RSS_ITEMS = 6
+CRIMES = ['stabbed', 'chain snatch', 'kidnap', 'extortion', 'robbery']
+AREAS = ['Andheri', 'Dadar', 'Kurla', 'Bandra', 'Powai']
+
+
+def title(path, i):
+    # Distinct enough that the near-duplicate index keeps every one
+    tag = hashlib.md5(f"{path}{i}".encode()).hexdigest()[:12]
+    return f"{CRIMES[i % len(CRIMES)].title()} case in {AREAS[i % len(AREAS)]} ref {tag}"
+
+
+class FixtureHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        time.sleep(LATENCY)
+        if self.path.startswith('/rss'):
+            items = ''.join(f"<item><title>{title(self.path, i)}</title><link>http://x/{i}</link>"
+                            f"<description>Police registered a case.</description></item>"
+                            for i in range(RSS_ITEMS))
+            body, kind = f"<rss version='2.0'><channel><title>f</title>{items}</channel></rss>", 'application/rss+xml'
+        elif self.path.startswith('/search'):
+            body = ''.join(f"<div class='SoaBEf'><a href='http://x/{i}'><div role='heading'>"
+                           f"{title(self.path, i)}</div></a></div>" for i in range(2))
+            body, kind = f"<html><body>{body}</body></html>", 'text/html'
+        else:
+            body = ''.join(f"<article><h2><a href='/{i}'>{title(self.path, i)}</a></h2>"
+                           f"<p>Police said.</p></article>" for i in range(2))
+            body, kind = f"<html><body>{body}</body></html>", 'text/html'
+        data = body.encode()
+        self.send_response(200)
+        self.send_header('Content-Type', kind)
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+def start_site():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), FixtureHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return f"http://127.0.0.1:{server.server_address[1]}"
+
+
+def point_sources_at_fixtures():
+    """Same number of sources per site as the real lists, on local sites"""
+    sites = {}
+
+    def site_for(url):
+        host = url.split('/')[2]
+        if host not in sites:
+            sites[host] = start_site()
+        return sites[host]
+
+    news_scraper.RSS_FEEDS = [(f"{site_for(url)}/rss/{i}", name)
+                              for i, (url, name) in enumerate(news_scraper.RSS_FEEDS)]
+    news_scraper.WEB_SOURCES = [(f"{site_for(url)}/web/{i}", name)
+                                for i, (url, name) in enumerate(news_scraper.WEB_SOURCES)]
+    news_scraper.DYNAMIC_SOURCES = [(f"{site_for(url)}/dynamic/{i}", name)
+                                    for i, (url, name) in enumerate(news_scraper.DYNAMIC_SOURCES)]
+    google = site_for(news_scraper.GOOGLE_NEWS_SEARCH_URL)
+    news_scraper.GOOGLE_NEWS_SEARCH_URL = google + "/search?q={query}"
+    return len(sites)
+
+
+def make_scraper(name):
+    scraper = news_scraper.CrimeNewsScraper()
+    scraper.fetcher.state = None  # no conditional GETs between the two runs
+    scraper.output_path = os.path.join(TEMP_DIR, f"{name}.ndjson")
+    return scraper
+
+
+def run_sequential():
+    """The old run(): one source at a time, sleeping after each"""
+    scraper = make_scraper('sequential')
+    start = time.perf_counter()
+    for job in scraper.build_jobs():
+        if scraper.article_count >= job['skip_at']:
+            continue
+        job['run']()
+        time.sleep(LEGACY_PAUSES[job['phase']] * SLEEP_SCALE)
+    return time.perf_counter() - start, scraper.article_count
+
+
+def run_concurrent(name='concurrent'):
+    scraper = make_scraper(name)
+    scheduler = ScrapeScheduler(lambda: scraper.article_count, news_scraper.STOP_TARGET,
+                                max_workers=WORKERS, domain_interval=2 * SLEEP_SCALE)
+    start = time.perf_counter()
+    results = scraper.run_jobs(scheduler)
+    elapsed = time.perf_counter() - start
+    fallbacks_ran = sum(1 for r in results if r['phase'] != 'RSS' and r['start'] is not None)
+    renderer_started = scraper._renderer is not None
+    return elapsed, scraper.article_count, fallbacks_ran, renderer_started
+
+
+def run_rss_only():
+    """Feeds alone pass MIN_TARGET: no fallback source may be fetched"""
+    global RSS_ITEMS
+    RSS_ITEMS = RICH_RSS_ITEMS
+    try:
+        return run_concurrent('rss_only')
+    finally:
+        RSS_ITEMS = 2
+
+
+def main():
+    site_count = point_sources_at_fixtures()
+    jobs = len(news_scraper.RSS_FEEDS) + len(news_scraper.WEB_SOURCES) + \
+        len(news_scraper.DYNAMIC_SOURCES) + len(news_scraper.SEARCH_QUERIES)
+
+    # The scrapers print every article; keep the report readable
+    stdout = sys.stdout
+    sys.stdout = open(os.devnull, 'w')
+    try:
+        sequential_time, sequential_count = run_sequential()
+        concurrent_time, concurrent_count, _, _ = run_concurrent()
+        rss_time, rss_count, fallbacks_ran, renderer_started = run_rss_only()
+    finally:
+        sys.stdout.close()
+        sys.stdout = stdout
+
+    print(f"\n{jobs} sources on {site_count} fixture sites, {LATENCY}s latency, "
+          f"pauses x{SLEEP_SCALE}")
+    print(f"  sequential phases: {sequential_time:.2f}s  ({sequential_count} articles)")
+    print(f"  scheduler ({WORKERS} workers): {concurrent_time:.2f}s  ({concurrent_count} articles, "
+          f"{sequential_time / concurrent_time:.1f}x)")
+    print(f"  RSS alone ({RICH_RSS_ITEMS} items per feed): {rss_time:.2f}s  ({rss_count} articles, "
+          f"{fallbacks_ran} fallback sources fetched, renderer {'started' if renderer_started else 'not started'})")
+    assert rss_count >= news_scraper.MIN_TARGET, "fixture feeds should pass MIN_TARGET on their own"
+    assert fallbacks_ran == 0 and not renderer_started, "fallback phases ran although RSS reached MIN_TARGET"
+
+
+if __name__ == "__main__":
+    main()
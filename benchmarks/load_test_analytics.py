@@ -0,0 +1,75 @@
+"""
+Load test: per-request CrimeAnalytics vs the shared pooled instance
+Runs the same analytics call from concurrent threads in both modes and
+prints p50/p99 latency. Needs MONGO_URI pointing at a populated database.
+"""
+
+import os
+import statistics
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import pymongo
+from dotenv import load_dotenv
+from crime_analytics import CrimeAnalytics
+
+load_dotenv()
+
+REQUESTS = int(os.getenv('LOAD_TEST_REQUESTS', 400))
+THREADS = int(os.getenv('LOAD_TEST_THREADS', 8))
+
+
+def call(analytics):
+    return analytics.get_risk_score(19.0760, 72.8777, 2)
+
+
+def per_request_call():
+    """Old behaviour: fresh client, handshake and discovery every request"""
+    start = time.perf_counter()
+    analytics = CrimeAnalytics()
+    call(analytics)
+    analytics.close()
+    return time.perf_counter() - start
+
+
+def shared_call(analytics):
+    start = time.perf_counter()
+    call(analytics)
+    return time.perf_counter() - start
+
+
+def percentile(samples, pct):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+def run(label, fn):
+    with ThreadPoolExecutor(max_workers=THREADS) as pool:
+        start = time.perf_counter()
+        latencies = list(pool.map(lambda _: fn(), range(REQUESTS)))
+        wall = time.perf_counter() - start
+
+    print(f"{label:12s} p50={percentile(latencies, 50) * 1000:8.1f} ms  "
+          f"p99={percentile(latencies, 99) * 1000:8.1f} ms  "
+          f"mean={statistics.mean(latencies) * 1000:8.1f} ms  "
+          f"throughput={REQUESTS / wall:7.1f} req/s")
+
+
+def main():
+    print(f"{REQUESTS} requests, {THREADS} threads\n")
+
+    client = pymongo.MongoClient(os.getenv("MONGO_URI"), maxPoolSize=THREADS)
+    shared = CrimeAnalytics(client=client)
+    call(shared)  # Warm the pool and the risk index
+
+    run("per-request", per_request_call)
+    run("shared", lambda: shared_call(shared))
+
+    client.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+"""
+Query Plan Check
+Seeds a scratch database on a local mongod, applies db_schema's indexes and
+runs explain() on every hot query of the server, analytics and scraper.
+Exits with status 1 if any winning plan contains a COLLSCAN.
+
+    python check_query_plans.py                      # mongodb://localhost:27017
+    QUERY_PLAN_MONGO_URI=mongodb://host:27017 python check_query_plans.py
+
+The scratch database is dropped afterwards. Deliberate full reads (the
+unpaginated /api/crime-data dump, the first column-store load, backfills)
+are not listed.
+"""
+
+import os
+import sys
+from datetime import datetime, timedelta
+import pymongo
+from crime_analytics import stats_pipeline
+from crime_columns import PROJECTION as COLUMN_PROJECTION
+from crime_geo import bbox_filter, cluster_pipeline, geojson_point, GEO_FIELD
+from db_schema import ensure_indexes
+from hotspot_cells import CELLS_COLLECTION, cell_id
+
+MONGO_URI = os.getenv('QUERY_PLAN_MONGO_URI', 'mongodb://localhost:27017')
+SCRATCH_DB = 'fir_data_plan_check'
+SAMPLE_SIZE = 500
+
+CRIME_TYPES = ['murder', 'theft', 'kidnapping', 'rape', 'extortion', 'other']
+SEVERITIES = ['Critical', 'High', 'Medium', 'Low']
+
+
+def seed(db):
+    """Representative documents, so the planner has real choices to make"""
+    now = datetime.now()
+    crimes = []
+    for i in range(SAMPLE_SIZE):
+        latitude = 18.9 + (i % 50) * 0.008
+        longitude = 72.8 + (i // 50) * 0.015
+        crimes.append({
+            'title': f"Sample crime {i}",
+            'news_url': f"https://example.com/news/{i}",
+            'crime_type': CRIME_TYPES[i % len(CRIME_TYPES)],
+            'severity_level': SEVERITIES[i % len(SEVERITIES)],
+            'location': 'Mumbai',
+            'latitude': latitude,
+            'longitude': longitude,
+            GEO_FIELD: geojson_point(latitude, longitude),
+            'title_bands': [f"{band}:{i % 40:016x}" for band in range(4)],
+            'created_at': now - timedelta(hours=i)
+        })
+    db['crime_news'].insert_many(crimes)
+    db['firs'].insert_many([{'news_url': crime['news_url']} for crime in crimes[:100]])
+    db['users'].insert_many([{'email': f"user{i}@example.com"} for i in range(50)])
+    db[CELLS_COLLECTION].insert_many([
+        {'_id': cell_id(18.9 + i * 0.05, 72.8), 'count': i, 'risk_raw': i * 10} for i in range(1, 50)
+    ])
+
+
+def hot_queries(db):
+    """name -> zero-argument function returning that query's explain output"""
+    crime_news = db['crime_news']
+    since = datetime.now() - timedelta(days=3)
+    viewport = bbox_filter(18.95, 72.82, 19.1, 72.9)
+    middle_id = crime_news.find_one({}, {'_id': 1}, sort=[('_id', 1)], skip=SAMPLE_SIZE // 2)['_id']
+
+    def aggregate(collection, pipeline, **options):
+        command = {'aggregate': collection.name, 'pipeline': pipeline, 'cursor': {}}
+        command.update(options)
+        return db.command('explain', command, verbosity='queryPlanner')
+
+    stats_by_date = stats_pipeline({'created_at': {'$gte': since}})
+    stats_by_area = stats_pipeline(viewport)
+    stats_all = stats_pipeline({}, use_index=True)
+
+    return {
+        '/api/crime-data?after= (page)': lambda: crime_news.find(
+            {'_id': {'$gt': middle_id}}).sort('_id', 1).limit(500).explain(),
+        '/api/crime-data/new': lambda: crime_news.find(
+            {'created_at': {'$gt': since}}).sort('created_at', -1).explain(),
+        '/api/crime-data/stream (replay)': lambda: crime_news.find(
+            {'_id': {'$gt': middle_id}}).sort('_id', 1).explain(),
+        '/api/crime-data/bbox (points)': lambda: crime_news.find(viewport).limit(2001).explain(),
+        '/api/crime-data/bbox (clusters)': lambda: aggregate(crime_news, cluster_pipeline(viewport, 10)),
+        '/api/stats': lambda: aggregate(crime_news, stats_all[0], **stats_all[1]),
+        '/api/stats?since=': lambda: aggregate(crime_news, stats_by_date[0], **stats_by_date[1]),
+        '/api/stats?minLat=...': lambda: aggregate(crime_news, stats_by_area[0], **stats_by_area[1]),
+        'analytics: column store refresh': lambda: crime_news.find(
+            {'_id': {'$gt': middle_id}}, COLUMN_PROJECTION).sort('_id', 1).explain(),
+        'analytics: hotspots': lambda: db[CELLS_COLLECTION].find(
+            {'count': {'$gte': 3}}).sort([('risk_raw', -1), ('count', -1)]).limit(10).explain(),
+        'scraper: upsert by news_url': lambda: crime_news.find(
+            {'news_url': 'https://example.com/news/7'}).explain(),
+        'scraper: near-duplicate bands': lambda: crime_news.find(
+            {'title_bands': {'$in': ['0:0000000000000001', '1:0000000000000002']}}).explain(),
+        'importer: firs upsert by news_url': lambda: db['firs'].find(
+            {'news_url': 'https://example.com/news/7'}).explain(),
+        'auth: user by email': lambda: db['users'].find({'email': 'user7@example.com'}).explain(),
+    }
+
+
+def winning_stages(explain):
+    """Every stage name inside the winning plan(s) of an explain document"""
+    stages = []
+
+    def walk(node, in_plan):
+        if isinstance(node, dict):
+            for key, value in node.items():
+                if key == 'rejectedPlans':
+                    continue
+                if key == 'stage' and in_plan:
+                    stages.append(value)
+                walk(value, in_plan or key == 'winningPlan')
+        elif isinstance(node, list):
+            for item in node:
+                walk(item, in_plan)
+
+    walk(explain, False)
+    return stages
+
+
+def main():
+    client = pymongo.MongoClient(MONGO_URI, serverSelectionTimeoutMS=5000)
+    db = client[SCRATCH_DB]
+    client.drop_database(SCRATCH_DB)
+
+    failures = []
+    try:
+        seed(db)
+        if ensure_indexes(db):
+            print("❌ Some indexes could not be created")
+            return 1
+
+        print(f"🔍 Checking query plans on {MONGO_URI}/{SCRATCH_DB}\n")
+        for name, explain in hot_queries(db).items():
+            stages = winning_stages(explain())
+            if not stages or 'COLLSCAN' in stages:
+                failures.append(name)
+                print(f"  ❌ {name}: {' -> '.join(stages) or 'no winning plan found'}")
+            else:
+                print(f"  ✅ {name}: {' -> '.join(stages)}")
+    finally:
+        client.drop_database(SCRATCH_DB)
+        client.close()
+
+    if failures:
+        print(f"\n❌ {len(failures)} query(ies) scan the whole collection")
+        return 1
+    print("\n✅ Every hot query uses an index")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
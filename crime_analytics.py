@@ -6,142 +6,110 @@ Handles: Hotspot detection, Pattern analysis, Risk scoring, Predictions
 import pymongo
 import os
 from datetime import datetime, timedelta
-from collections import defaultdict
-import math
+import threading
+import numpy as np
 from dotenv import load_dotenv
+from crime_columns import CrimeColumns, haversine_km as haversine_km_array
+from hotspot_cells import CELLS_COLLECTION, top_hotspots
+from db_schema import STATS_INDEX
 
 load_dotenv()
 
+# Columnar snapshots of crime_news, shared across CrimeAnalytics instances and
+# keyed by collection so each process loads the data only once. Snapshots
+# are swapped in whole under _column_store_lock; builds of a collection's
+# next snapshot are serialised by its lock in _column_build_locks
+_column_stores = {}
+_column_build_locks = {}
+_column_store_lock = threading.Lock()
+
+SEVERITY_WEIGHTS = {
+    'Critical': 40,
+    'High': 25,
+    'Medium': 15,
+    'Low': 5
+}
+
+DAY_ORDER = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
+
+
+def stats_pipeline(query, use_index=False):
+    """
+    (pipeline, aggregate options) counting crime types and severities, plus
+    the total when filtered, in one pass. Unfiltered, the caller uses
+    estimated_document_count, and with use_index (STATS_INDEX is known to
+    exist) the pipeline is hinted onto that covering index.
+    """
+    facets = {
+        'crime_types': [
+            {'$group': {'_id': '$crime_type', 'count': {'$sum': 1}}},
+            {'$sort': {'count': -1}}
+        ],
+        'severity_levels': [
+            {'$group': {'_id': '$severity_level', 'count': {'$sum': 1}}},
+            {'$sort': {'count': -1}}
+        ]
+    }
+    if query:
+        facets['total'] = [{'$count': 'count'}]
+    
+    pipeline = [{'$match': query}] if query else []
+    pipeline.append({'$project': {'_id': 0, 'crime_type': 1, 'severity_level': 1}})
+    pipeline.append({'$facet': facets})
+    return pipeline, ({'hint': STATS_INDEX} if use_index and not query else {})
+
 
 class CrimeAnalytics:
-    def __init__(self):
+    def __init__(self, client=None):
+        """
+        Pass an existing MongoClient to share its connection pool; otherwise
+        a private client is opened and owned by this instance
+        """
         self.mongo_uri = os.getenv("MONGO_URI")
-        self.client = pymongo.MongoClient(self.mongo_uri)
+        self._owns_client = client is None
+        self.client = client if client is not None else pymongo.MongoClient(self.mongo_uri)
         self.db = self.client["fir_data"]
         self.collection = self.db["crime_news"]
+        self.hotspot_cells = self.db[CELLS_COLLECTION]
     
     def get_hotspots(self, min_crimes=3, radius_km=2):
         """
         Identify crime hotspots using density-based clustering
         Returns areas with high crime concentration
         """
-        crimes = list(self.collection.find({}, {
-            'latitude': 1, 'longitude': 1, 'location': 1, 
-            'crime_type': 1, 'severity_level': 1, '_id': 0
-        }))
-        
-        if len(crimes) < min_crimes:
-            return []
-        
-        # Group crimes by approximate location (grid-based clustering)
-        hotspots = defaultdict(lambda: {
-            'crimes': [],
-            'count': 0,
-            'critical_count': 0,
-            'high_count': 0,
-            'lat_sum': 0,
-            'lon_sum': 0
-        })
-        
-        for crime in crimes:
-            # Round coordinates to create grid cells (~0.5km precision)
-            lat_key = round(crime['latitude'] * 20) / 20  # ~2.5km grid
-            lon_key = round(crime['longitude'] * 20) / 20
-            key = f"{lat_key},{lon_key}"
-            
-            hotspots[key]['crimes'].append(crime)
-            hotspots[key]['count'] += 1
-            hotspots[key]['lat_sum'] += crime['latitude']
-            hotspots[key]['lon_sum'] += crime['longitude']
-            
-            if crime.get('severity_level') == 'Critical':
-                hotspots[key]['critical_count'] += 1
-            elif crime.get('severity_level') == 'High':
-                hotspots[key]['high_count'] += 1
-        
-        # Filter and calculate centers
-        result = []
-        for key, data in hotspots.items():
-            if data['count'] >= min_crimes:
-                avg_lat = data['lat_sum'] / data['count']
-                avg_lon = data['lon_sum'] / data['count']
-                
-                # Get most common location name
-                locations = [c.get('location', 'Unknown') for c in data['crimes']]
-                location = max(set(locations), key=locations.count)
-                
-                # Calculate risk score
-                risk_score = (
-                    data['count'] * 10 +
-                    data['critical_count'] * 30 +
-                    data['high_count'] * 15
-                )
-                risk_score = min(risk_score, 100)  # Cap at 100
-                
-                result.append({
-                    'location': location,
-                    'latitude': avg_lat,
-                    'longitude': avg_lon,
-                    'crime_count': data['count'],
-                    'critical_crimes': data['critical_count'],
-                    'high_crimes': data['high_count'],
-                    'risk_score': risk_score,
-                    'radius_km': 1.5
-                })
-        
-        # Sort by risk score
-        result.sort(key=lambda x: x['risk_score'], reverse=True)
-        return result[:10]  # Top 10 hotspots
+        # Top-k read from the materialized grid, which the importer and
+        # auto_scraper build and keep current (see hotspot_cells.py)
+        return top_hotspots(self.hotspot_cells, min_crimes=min_crimes, limit=10)
     
     def get_time_patterns(self):
         """
         Analyze crime patterns by time (hour, day, month)
         """
-        crimes = list(self.collection.find({}, {
-            'incident_date': 1, 'crime_type': 1, 'created_at': 1, '_id': 0
-        }))
-        
-        hourly = defaultdict(int)
-        daily = defaultdict(int)
-        crime_type_by_hour = defaultdict(lambda: defaultdict(int))
+        columns = self._get_columns()
         
-        for crime in crimes:
-            try:
-                # Try to parse incident_date or created_at
-                date_str = crime.get('incident_date') or crime.get('created_at')
-                if isinstance(date_str, str):
-                    dt = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
-                elif isinstance(date_str, datetime):
-                    dt = date_str
-                else:
-                    continue
-                
-                hour = dt.hour
-                day = dt.strftime('%A')
-                crime_type = crime.get('crime_type', 'other')
-                
-                hourly[hour] += 1
-                daily[day] += 1
-                crime_type_by_hour[hour][crime_type] += 1
-                
-            except Exception:
-                continue
+        # incident_date (or created_at) is parsed once when rows are loaded
+        known = columns.event_hour >= 0
+        hourly = np.bincount(columns.event_hour[known], minlength=24)
+        daily = np.bincount(columns.event_weekday[known], minlength=7)
         
         # Find peak hours and days
-        peak_hour = max(hourly.items(), key=lambda x: x[1]) if hourly else (0, 0)
-        peak_day = max(daily.items(), key=lambda x: x[1]) if daily else ('Unknown', 0)
+        if known.any():
+            peak_hour = (int(hourly.argmax()), int(hourly.max()))
+            peak_day = (DAY_ORDER[int(daily.argmax())], int(daily.max()))
+        else:
+            peak_hour = (0, 0)
+            peak_day = ('Unknown', 0)
         
         # Format hourly data
         hourly_data = [
-            {'hour': h, 'count': hourly.get(h, 0)}
+            {'hour': h, 'count': int(hourly[h])}
             for h in range(24)
         ]
         
         # Format daily data
-        day_order = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
         daily_data = [
-            {'day': day, 'count': daily.get(day, 0)}
-            for day in day_order
+            {'day': day, 'count': int(daily[i])}
+            for i, day in enumerate(DAY_ORDER)
         ]
         
         return {
@@ -151,7 +119,7 @@ class CrimeAnalytics:
             'peak_hour_count': peak_hour[1],
             'peak_day': peak_day[0],
             'peak_day_count': peak_day[1],
-            'high_risk_hours': [h for h, c in hourly.items() if c > (peak_hour[1] * 0.6)]
+            'high_risk_hours': [int(h) for h in np.nonzero(hourly > (peak_hour[1] * 0.6))[0]]
         }
     
     def get_risk_score(self, latitude, longitude, radius_km=2):
@@ -159,34 +127,18 @@ class CrimeAnalytics:
         Calculate real-time risk score for a specific location
         Based on: recent crimes, severity, distance, time
         """
-        current_time = datetime.now()
-        recent_cutoff = current_time - timedelta(days=7)  # Last 7 days
-        
-        # Find nearby crimes
-        crimes = list(self.collection.find({
-            'latitude': {'$exists': True},
-            'longitude': {'$exists': True}
-        }, {
-            'latitude': 1, 'longitude': 1, 'severity_level': 1,
-            'created_at': 1, 'crime_type': 1, '_id': 0
-        }))
+        columns = self._get_columns()
+        current_time = np.datetime64(datetime.now(), 'us')
         
-        nearby_crimes = []
-        for crime in crimes:
-            distance = self._haversine_distance(
-                latitude, longitude,
-                crime['latitude'], crime['longitude']
-            )
-            
-            if distance <= radius_km:
-                nearby_crimes.append({
-                    'distance': distance,
-                    'severity': crime.get('severity_level', 'Low'),
-                    'created_at': crime.get('created_at'),
-                    'type': crime.get('crime_type', 'other')
-                })
+        # Candidate rows come from the grid cells overlapping the radius,
+        # then one batched haversine keeps those actually inside it
+        rows = np.fromiter(columns.grid.candidates(latitude, longitude, radius_km), dtype=np.int64)
+        distances = haversine_km_array(latitude, longitude, columns.latitude[rows], columns.longitude[rows])
+        within = distances <= radius_km
+        rows = rows[within]
+        distances = distances[within]
         
-        if not nearby_crimes:
+        if rows.size == 0:
             return {
                 'risk_score': 0,
                 'risk_level': 'Safe',
@@ -194,43 +146,29 @@ class CrimeAnalytics:
                 'factors': []
             }
         
-        # Calculate weighted risk score
-        risk_score = 0
-        recent_count = 0
-        critical_count = 0
+        # Distance weight (closer = higher risk)
+        distance_weight = np.maximum(0, (radius_km - distances) / radius_km)
         
-        for crime in nearby_crimes:
-            # Distance weight (closer = higher risk)
-            distance_weight = max(0, (radius_km - crime['distance']) / radius_km)
-            
-            # Severity weight
-            severity_weights = {
-                'Critical': 40,
-                'High': 25,
-                'Medium': 15,
-                'Low': 5
-            }
-            severity_score = severity_weights.get(crime['severity'], 5)
-            
-            # Recency weight
-            recency_weight = 1.0
-            if crime.get('created_at'):
-                try:
-                    crime_date = crime['created_at'] if isinstance(crime['created_at'], datetime) else datetime.fromisoformat(str(crime['created_at']).replace('Z', '+00:00'))
-                    days_ago = (current_time - crime_date).days
-                    if days_ago <= 7:
-                        recent_count += 1
-                        recency_weight = 1.5
-                    elif days_ago <= 30:
-                        recency_weight = 1.2
-                except:
-                    pass
-            
-            if crime['severity'] == 'Critical':
-                critical_count += 1
-            
-            crime_risk = severity_score * distance_weight * recency_weight
-            risk_score += crime_risk
+        # Severity weight
+        weight_by_code = np.array(
+            [SEVERITY_WEIGHTS.get(level, 5) for level in columns.severities.values], dtype=np.float64
+        )
+        severity_score = weight_by_code[columns.severity[rows]]
+        
+        # Recency weight
+        created_at = columns.recency_time[rows]
+        dated = ~np.isnat(created_at)
+        days_ago = np.zeros(rows.size, dtype=np.int64)
+        days_ago[dated] = (current_time - created_at[dated]) // np.timedelta64(1, 'D')
+        recent = dated & (days_ago <= 7)
+        recency_weight = np.ones(rows.size)
+        recency_weight[dated & (days_ago <= 30)] = 1.2
+        recency_weight[recent] = 1.5
+        
+        recent_count = int(recent.sum())
+        critical_count = int((columns.severity[rows] == columns.severities.lookup('Critical')).sum())
+        
+        risk_score = float((severity_score * distance_weight * recency_weight).sum())
         
         # Normalize to 0-100
         risk_score = min(risk_score, 100)
@@ -250,12 +188,12 @@ class CrimeAnalytics:
             factors.append(f"{recent_count} crime(s) in last 7 days")
         if critical_count > 0:
             factors.append(f"{critical_count} critical incident(s)")
-        factors.append(f"{len(nearby_crimes)} total crimes within {radius_km}km")
+        factors.append(f"{rows.size} total crimes within {radius_km}km")
         
         return {
             'risk_score': round(risk_score, 1),
             'risk_level': risk_level,
-            'nearby_crimes': len(nearby_crimes),
+            'nearby_crimes': int(rows.size),
             'recent_crimes': recent_count,
             'critical_crimes': critical_count,
             'factors': factors
@@ -265,32 +203,17 @@ class CrimeAnalytics:
         """
         Analyze crime trends over time
         """
-        cutoff_date = datetime.now() - timedelta(days=days)
-        
-        crimes = list(self.collection.find({
-            'created_at': {'$gte': cutoff_date}
-        }, {
-            'created_at': 1, 'crime_type': 1, 'severity_level': 1, '_id': 0
-        }).sort('created_at', 1))
-        
-        daily_counts = defaultdict(int)
-        type_trends = defaultdict(lambda: defaultdict(int))
+        columns = self._get_columns()
+        cutoff_date = np.datetime64(datetime.now() - timedelta(days=days), 'us')
         
-        for crime in crimes:
-            try:
-                crime_date = crime.get('created_at')
-                if isinstance(crime_date, datetime):
-                    date_key = crime_date.strftime('%Y-%m-%d')
-                    daily_counts[date_key] += 1
-                    type_trends[date_key][crime.get('crime_type', 'other')] += 1
-            except:
-                continue
+        # NaT (created_at not stored as a date) never compares >= cutoff
+        recent = columns.created_at[columns.created_at >= cutoff_date]
+        dates, counts = np.unique(recent.astype('datetime64[D]'), return_counts=True)
         
         # Calculate trend (increasing/decreasing)
-        dates = sorted(daily_counts.keys())
         if len(dates) >= 2:
-            first_half = sum(daily_counts[d] for d in dates[:len(dates)//2])
-            second_half = sum(daily_counts[d] for d in dates[len(dates)//2:])
+            first_half = int(counts[:len(dates)//2].sum())
+            second_half = int(counts[len(dates)//2:].sum())
             trend = 'increasing' if second_half > first_half else 'decreasing'
             change_percent = ((second_half - first_half) / max(first_half, 1)) * 100
         else:
@@ -298,11 +221,14 @@ class CrimeAnalytics:
             change_percent = 0
         
         return {
-            'daily_counts': [{'date': d, 'count': daily_counts[d]} for d in dates],
-            'total_crimes': len(crimes),
+            'daily_counts': [
+                {'date': str(d), 'count': int(c)}
+                for d, c in zip(np.datetime_as_string(dates, unit='D'), counts)
+            ],
+            'total_crimes': int(recent.size),
             'trend': trend,
             'change_percent': round(change_percent, 1),
-            'average_per_day': round(len(crimes) / max(days, 1), 1)
+            'average_per_day': round(recent.size / max(days, 1), 1)
         }
     
     def get_patrol_suggestions(self, officer_count=5):
@@ -329,22 +255,43 @@ class CrimeAnalytics:
         
         return suggestions
     
-    def _haversine_distance(self, lat1, lon1, lat2, lon2):
-        """Calculate distance between two coordinates in km"""
-        R = 6371  # Earth radius in km
-        
-        lat1_rad = math.radians(lat1)
-        lat2_rad = math.radians(lat2)
-        delta_lat = math.radians(lat2 - lat1)
-        delta_lon = math.radians(lon2 - lon1)
+    def _get_columns(self):
+        """
+        Return the latest column snapshot for this collection, loaded on
+        first use and topped up with any documents inserted since. Callers
+        use the one snapshot returned for the whole computation.
+        """
+        key = self.collection.full_name
+        with _column_store_lock:
+            columns = _column_stores.get(key)
+            build_lock = _column_build_locks.setdefault(key, threading.Lock())
         
-        a = (math.sin(delta_lat / 2) ** 2 +
-             math.cos(lat1_rad) * math.cos(lat2_rad) *
-             math.sin(delta_lon / 2) ** 2)
-        c = 2 * math.asin(math.sqrt(a))
+        if columns is None:
+            # First (full) load, once per process
+            with build_lock:
+                with _column_store_lock:
+                    columns = _column_stores.get(key)
+                if columns is None:
+                    columns = CrimeColumns()
+                    columns = columns.with_documents(columns.newer_documents(self.collection))
+                    with _column_store_lock:
+                        _column_stores[key] = columns
+            return columns
         
-        return R * c
+        # Top-ups query without a lock, so concurrent requests don't queue
+        # behind one round trip; rows a newer snapshot already has are skipped
+        documents = columns.newer_documents(self.collection)
+        if not documents:
+            return columns
+        with build_lock:
+            with _column_store_lock:
+                latest = _column_stores[key]
+            columns = latest.with_documents(documents)
+            with _column_store_lock:
+                _column_stores[key] = columns
+        return columns
     
     def close(self):
-        """Close MongoDB connection"""
-        self.client.close()
+        """Close MongoDB connection (shared clients are left to their owner)"""
+        if self._owns_client:
+            self.client.close()
@@ -0,0 +1,153 @@
+"""
+Columnar Crime Store
+Loads crime_news into NumPy arrays so analytics run as array operations
+"""
+
+import copy
+from datetime import datetime
+import math
+import numpy as np
+from spatial_index import SpatialGridIndex, EARTH_RADIUS_KM
+
+PROJECTION = {
+    'latitude': 1, 'longitude': 1, 'severity_level': 1, 'crime_type': 1,
+    'location': 1, 'incident_date': 1, 'created_at': 1
+}
+
+
+def parse_timestamp(value):
+    """Return a datetime for a stored datetime or ISO string, else None"""
+    if isinstance(value, datetime):
+        return value
+    if isinstance(value, str):
+        try:
+            return datetime.fromisoformat(value.replace('Z', '+00:00'))
+        except ValueError:
+            return None
+    return None
+
+
+def haversine_km(latitude, longitude, latitudes, longitudes):
+    """Distances in km from one point to arrays of points"""
+    lat1 = np.radians(latitude)
+    lat2 = np.radians(latitudes)
+    delta_lat = lat2 - lat1
+    delta_lon = np.radians(longitudes - longitude)
+
+    a = (np.sin(delta_lat / 2) ** 2 +
+         np.cos(lat1) * np.cos(lat2) * np.sin(delta_lon / 2) ** 2)
+    return EARTH_RADIUS_KM * 2 * np.arcsin(np.sqrt(a))
+
+
+class Categories:
+    """Maps string values to small integer codes"""
+
+    def __init__(self):
+        self.values = []
+        self._codes = {}
+
+    def code(self, value):
+        if value not in self._codes:
+            self._codes[value] = len(self.values)
+            self.values.append(value)
+        return self._codes[value]
+
+    def lookup(self, value):
+        """Code for value, or -1 if it has never been seen"""
+        return self._codes.get(value, -1)
+
+
+class CrimeColumns:
+    """
+    Parallel NumPy arrays, one row per crime_news document, plus a grid
+    index of the rows. A CrimeColumns is an immutable snapshot: new
+    documents go into a new snapshot (with_documents), so a reader holding
+    one never sees arrays and grid of different lengths. Snapshots share
+    the Categories, which only ever gain codes.
+    Documents are loaded by _id, so edits to existing rows are not picked up.
+    """
+
+    def __init__(self):
+        self.severities = Categories()
+        self.crime_types = Categories()
+        self.locations = Categories()
+
+        self.latitude = np.empty(0, dtype=np.float64)
+        self.longitude = np.empty(0, dtype=np.float64)
+        self.severity = np.empty(0, dtype=np.int32)
+        self.crime_type = np.empty(0, dtype=np.int32)
+        self.location = np.empty(0, dtype=np.int32)
+        # created_at only when stored as a BSON date (used for trends)
+        self.created_at = np.empty(0, dtype='datetime64[us]')
+        # created_at as a naive datetime or ISO string (used for recency)
+        self.recency_time = np.empty(0, dtype='datetime64[us]')
+        # Hour / weekday of incident_date (falling back to created_at), -1 if unknown
+        self.event_hour = np.empty(0, dtype=np.int8)
+        self.event_weekday = np.empty(0, dtype=np.int8)
+
+        self.grid = SpatialGridIndex()
+        self.last_id = None  # Highest _id loaded
+
+    def __len__(self):
+        return len(self.latitude)
+
+    def newer_documents(self, collection):
+        """Documents inserted after this snapshot was built, oldest first"""
+        query = {'_id': {'$gt': self.last_id}} if self.last_id is not None else {}
+        return list(collection.find(query, PROJECTION).sort('_id', 1))
+
+    def with_documents(self, documents):
+        """
+        A new snapshot with documents (sorted by _id) appended; ones already
+        loaded are skipped. This snapshot is left untouched.
+        """
+        if self.last_id is not None:
+            documents = [doc for doc in documents if doc['_id'] > self.last_id]
+        if not documents:
+            return self
+
+        offset = len(self)
+        latitude, longitude, points = [], [], []
+        severity, crime_type, location = [], [], []
+        created_at, recency_time = [], []
+        event_hour, event_weekday = [], []
+
+        for row, doc in enumerate(documents, offset):
+            lat = doc.get('latitude')
+            lon = doc.get('longitude')
+            if (isinstance(lat, (int, float)) and isinstance(lon, (int, float))
+                    and math.isfinite(lat) and math.isfinite(lon)):
+                latitude.append(lat)
+                longitude.append(lon)
+                points.append((lat, lon, row))
+            else:
+                latitude.append(np.nan)
+                longitude.append(np.nan)
+
+            severity.append(self.severities.code(doc.get('severity_level')))
+            crime_type.append(self.crime_types.code(doc.get('crime_type', 'other')))
+            location.append(self.locations.code(doc.get('location', 'Unknown')))
+
+            created = doc.get('created_at')
+            created_at.append(created if isinstance(created, datetime) and created.tzinfo is None else None)
+
+            recency = parse_timestamp(created) if created else None
+            recency_time.append(recency if recency is not None and recency.tzinfo is None else None)
+
+            event = parse_timestamp(doc.get('incident_date') or created)
+            event_hour.append(event.hour if event else -1)
+            event_weekday.append(event.weekday() if event else -1)
+
+        snapshot = copy.copy(self)
+        snapshot.latitude = np.concatenate([self.latitude, np.array(latitude, dtype=np.float64)])
+        snapshot.longitude = np.concatenate([self.longitude, np.array(longitude, dtype=np.float64)])
+        snapshot.severity = np.concatenate([self.severity, np.array(severity, dtype=np.int32)])
+        snapshot.crime_type = np.concatenate([self.crime_type, np.array(crime_type, dtype=np.int32)])
+        snapshot.location = np.concatenate([self.location, np.array(location, dtype=np.int32)])
+        snapshot.created_at = np.concatenate([self.created_at, np.array(created_at, dtype='datetime64[us]')])
+        snapshot.recency_time = np.concatenate([self.recency_time, np.array(recency_time, dtype='datetime64[us]')])
+        snapshot.event_hour = np.concatenate([self.event_hour, np.array(event_hour, dtype=np.int8)])
+        snapshot.event_weekday = np.concatenate([self.event_weekday, np.array(event_weekday, dtype=np.int8)])
+        snapshot.grid = self.grid.with_points(points)
+        snapshot.last_id = documents[-1].get('_id')
+        return snapshot
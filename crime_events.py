@@ -0,0 +1,138 @@
+"""
+Crime Event Broadcaster
+One background watcher per process follows inserts into crime_news and fans
+them out to every connected client, so idle dashboards cost no queries.
+Inserts come from a change stream (replica sets / Atlas); on a standalone
+mongod the watcher falls back to tailing new _ids on an interval.
+"""
+
+import os
+import queue
+import threading
+import time
+import pymongo
+
+POLL_SECONDS = float(os.getenv('CRIME_EVENTS_POLL_SECONDS', 15))
+RETRY_SECONDS = 5
+# A client this many batches behind is disconnected; it reconnects and
+# catches up from its Last-Event-ID instead of holding memory here
+MAX_QUEUED_BATCHES = 100
+
+# Raised by $changeStream on a server that is not a replica set member
+_CHANGE_STREAMS_UNSUPPORTED = (40573, 40415)
+
+
+class CrimeEventBroadcaster:
+    def __init__(self, collection, fields, poll_interval=POLL_SECONDS, on_insert=None):
+        """
+        fields: the document fields sent to clients (plus _id).
+        on_insert(documents) runs for each batch before clients get it
+        (e.g. to invalidate caches the clients are about to re-query).
+        """
+        self.collection = collection
+        self.projection = {field: 1 for field in fields}
+        self.poll_interval = poll_interval
+        self.on_insert = on_insert
+        self.mode = None  # 'change_stream' or 'polling' once the watcher runs
+        self._subscribers = set()
+        self._lock = threading.Lock()
+        self._thread = None
+
+    def subscribe(self):
+        """Queue receiving lists of new documents; None means reconnect"""
+        subscriber = queue.Queue()
+        with self._lock:
+            self._subscribers.add(subscriber)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name='crime-events', daemon=True)
+                self._thread.start()
+        return subscriber
+
+    def unsubscribe(self, subscriber):
+        with self._lock:
+            self._subscribers.discard(subscriber)
+
+    def replay(self, after_id):
+        """Documents inserted after after_id, oldest first (for reconnecting clients)"""
+        return self.collection.find({'_id': {'$gt': after_id}}, self.projection).sort('_id', 1)
+
+    def _publish(self, documents):
+        if self.on_insert is not None:
+            self.on_insert(documents)
+        with self._lock:
+            for subscriber in list(self._subscribers):
+                if subscriber.qsize() >= MAX_QUEUED_BATCHES:
+                    self._subscribers.discard(subscriber)
+                    subscriber.put(None)
+                else:
+                    subscriber.put(documents)
+
+    def _idle(self):
+        """Stop the watcher once the last client has gone (subscribe restarts it)"""
+        with self._lock:
+            if not self._subscribers:
+                self._thread = None
+                return True
+            return False
+
+    def _run(self):
+        self.mode = None
+        try:
+            try:
+                self._watch()
+            except pymongo.errors.OperationFailure as e:
+                if e.code not in _CHANGE_STREAMS_UNSUPPORTED:
+                    raise
+                print("⚠️  Change streams unavailable (standalone mongod?) - polling for new crimes")
+                self._poll()
+        except Exception as e:
+            # Disconnect everyone; reconnecting clients restart the watcher
+            print(f"❌ Crime event watcher stopped: {e}")
+            with self._lock:
+                for subscriber in self._subscribers:
+                    subscriber.put(None)
+                self._subscribers.clear()
+                self._thread = None
+
+    def _watch(self):
+        pipeline = [
+            {'$match': {'operationType': 'insert'}},
+            {'$project': dict({'fullDocument._id': 1},
+                              **{f"fullDocument.{field}": 1 for field in self.projection})}
+        ]
+        resume_token = None
+        while True:
+            try:
+                with self.collection.watch(pipeline, resume_after=resume_token, max_await_time_ms=1000) as stream:
+                    self.mode = 'change_stream'
+                    while stream.alive:
+                        change = stream.try_next()
+                        if change is not None:
+                            resume_token = stream.resume_token
+                            self._publish([change['fullDocument']])
+                        elif self._idle():
+                            return
+            except pymongo.errors.OperationFailure:
+                if self.mode is None:
+                    raise
+                print("⚠️  Change stream failed, resuming")
+                time.sleep(RETRY_SECONDS)
+            except pymongo.errors.PyMongoError as e:
+                print(f"⚠️  Change stream interrupted: {e}")
+                time.sleep(RETRY_SECONDS)
+
+    def _poll(self):
+        self.mode = 'polling'
+        newest = self.collection.find_one({}, {'_id': 1}, sort=[('_id', -1)])
+        last_id = newest['_id'] if newest else None
+        while not self._idle():
+            time.sleep(self.poll_interval)
+            try:
+                query = {} if last_id is None else {'_id': {'$gt': last_id}}
+                documents = list(self.collection.find(query, self.projection).sort('_id', 1))
+            except pymongo.errors.PyMongoError as e:
+                print(f"⚠️  Polling for new crimes failed: {e}")
+                continue
+            if documents:
+                last_id = documents[-1]['_id']
+                self._publish(documents)
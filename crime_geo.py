@@ -0,0 +1,131 @@
+"""
+Crime Geo Helpers
+GeoJSON location field, 2dsphere index, viewport queries and backfill for crime_news
+
+Run directly to backfill location_geo on existing documents:
+    python crime_geo.py
+"""
+
+import os
+import pymongo
+from dotenv import load_dotenv
+
+load_dotenv()
+
+GEO_FIELD = 'location_geo'
+
+# Zoom levels at or below this return server-side clusters instead of points
+CLUSTER_MAX_ZOOM = 12
+# Cluster cells per 256px map tile along each axis (~64px cells)
+CLUSTER_CELLS_PER_TILE = 4
+# Longitude span of each polygon piece; keeps the geodesic edges close to
+# the parallels they stand in for
+POLYGON_STEP_DEG = 10
+
+
+def geojson_point(latitude, longitude):
+    """GeoJSON Point for a lat/lon pair, or None if the pair is unusable"""
+    try:
+        latitude = float(latitude)
+        longitude = float(longitude)
+    except (TypeError, ValueError):
+        return None
+    if not (-90 <= latitude <= 90 and -180 <= longitude <= 180):
+        return None
+    return {'type': 'Point', 'coordinates': [longitude, latitude]}
+
+
+def ensure_geo_index(collection):
+    """Create the 2dsphere index on location_geo (no-op if it exists)"""
+    collection.create_index([(GEO_FIELD, pymongo.GEOSPHERE)])
+
+
+def _bbox_polygon(min_lat, min_lon, max_lat, max_lon):
+    """Polygon for one bbox piece, densified along the top and bottom edges"""
+    steps = max(1, int((max_lon - min_lon) // POLYGON_STEP_DEG) + 1)
+    lons = [min_lon + (max_lon - min_lon) * i / steps for i in range(steps + 1)]
+    ring = ([[lon, min_lat] for lon in lons] +
+            [[lon, max_lat] for lon in reversed(lons)] +
+            [[min_lon, min_lat]])
+    return {'type': 'Polygon', 'coordinates': [ring]}
+
+
+def bbox_filter(min_lat, min_lon, max_lat, max_lon):
+    """
+    Query matching location_geo inside a viewport.
+    Wide viewports are split into pieces below a hemisphere so each
+    polygon stays unambiguous; a viewport crossing the antimeridian
+    (min_lon > max_lon) is split there too.
+    """
+    if min_lon > max_lon:
+        spans = [(min_lon, 180.0), (-180.0, max_lon)]
+    else:
+        spans = [(min_lon, max_lon)]
+
+    pieces = []
+    for start, end in spans:
+        while start < end:
+            stop = min(start + 90, end)
+            pieces.append(_bbox_polygon(min_lat, start, max_lat, stop))
+            start = stop
+
+    clauses = [{GEO_FIELD: {'$geoWithin': {'$geometry': polygon}}} for polygon in pieces]
+    return clauses[0] if len(clauses) == 1 else {'$or': clauses}
+
+
+def cluster_pipeline(query, zoom):
+    """Aggregation grouping matched crimes into zoom-sized grid cells"""
+    cell_deg = 360 / (2 ** zoom) / CLUSTER_CELLS_PER_TILE
+    return [
+        {'$match': query},
+        {'$group': {
+            '_id': {
+                'lat': {'$floor': {'$divide': ['$latitude', cell_deg]}},
+                'lon': {'$floor': {'$divide': ['$longitude', cell_deg]}}
+            },
+            'count': {'$sum': 1},
+            'latitude': {'$avg': '$latitude'},
+            'longitude': {'$avg': '$longitude'},
+            'critical_crimes': {'$sum': {'$cond': [{'$eq': ['$severity_level', 'Critical']}, 1, 0]}},
+            'high_crimes': {'$sum': {'$cond': [{'$eq': ['$severity_level', 'High']}, 1, 0]}}
+        }},
+        {'$project': {'_id': 0}},
+        {'$sort': {'count': -1}}
+    ]
+
+
+def backfill_location_geo(collection, batch_size=500):
+    """Set location_geo on documents that have coordinates but no GeoJSON yet"""
+    cursor = collection.find(
+        {GEO_FIELD: {'$exists': False}, 'latitude': {'$ne': None}, 'longitude': {'$ne': None}},
+        {'latitude': 1, 'longitude': 1}
+    )
+
+    updated = 0
+    skipped = 0
+    batch = []
+    for doc in cursor:
+        point = geojson_point(doc.get('latitude'), doc.get('longitude'))
+        if point is None:
+            skipped += 1
+            continue
+        batch.append(pymongo.UpdateOne({'_id': doc['_id']}, {'$set': {GEO_FIELD: point}}))
+        if len(batch) >= batch_size:
+            updated += collection.bulk_write(batch, ordered=False).modified_count
+            batch = []
+    if batch:
+        updated += collection.bulk_write(batch, ordered=False).modified_count
+
+    return updated, skipped
+
+
+if __name__ == "__main__":
+    client = pymongo.MongoClient(os.getenv("MONGO_URI"))
+    collection = client["fir_data"]["crime_news"]
+
+    print(f"🌍 Backfilling {GEO_FIELD} on '{collection.name}'...")
+    updated, skipped = backfill_location_geo(collection)
+    ensure_geo_index(collection)
+    print(f"  ✅ Updated {updated} documents ({skipped} without usable coordinates)")
+
+    client.close()
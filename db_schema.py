@@ -0,0 +1,89 @@
+"""
+Database Schema
+Every index the hot queries rely on, declared in one place and applied
+idempotently at startup by the server, the scraper and the importer.
+check_query_plans.py (and tests/test_query_plans.py) verifies that each hot
+query is served by one of them.
+
+Run directly to apply the indexes to fir_data:
+    python db_schema.py
+"""
+
+import os
+import pymongo
+from dotenv import load_dotenv
+from crime_geo import GEO_FIELD
+from hotspot_cells import CELLS_COLLECTION
+
+load_dotenv()
+
+# Covering index for the unfiltered /api/stats pipeline: hinted (once
+# has_index confirms it exists), the counts are read from the index alone
+# instead of every document
+STATS_INDEX = [('crime_type', 1), ('severity_level', 1)]
+
+# collection -> [(keys, options)], each with the queries it serves
+INDEXES = {
+    'crime_news': [
+        # Upserts from auto_scraper / the importer
+        ([('news_url', 1)], {'unique': True}),
+        # /api/crime-data/new, /api/stats?since=&until=, analytics trends
+        ([('created_at', -1)], {}),
+        # /api/crime-data/bbox, /api/stats?minLat=...
+        ([(GEO_FIELD, pymongo.GEOSPHERE)], {}),
+        # /api/stats without filters (see STATS_INDEX)
+        (STATS_INDEX, {}),
+        # Near-duplicate title lookups in auto_scraper
+        ([('title_bands', 1)], {}),
+    ],
+    'firs': [
+        # Mirrored news articles are upserted by URL (FIRs have none, so not unique)
+        ([('news_url', 1)], {}),
+    ],
+    'users': [
+        ([('email', 1)], {'unique': True}),
+    ],
+    CELLS_COLLECTION: [
+        # Top-k hotspot read
+        ([('risk_raw', -1), ('count', -1)], {}),
+    ],
+}
+
+
+def ensure_indexes(db, indexes=INDEXES):
+    """
+    Create any missing index (create_index is a no-op for existing ones).
+    An index that cannot be built, e.g. unique over duplicate data or
+    clashing with an existing index's options, is reported and skipped so
+    startup still succeeds. Returns the number of failures.
+    """
+    failures = 0
+    for collection_name, specs in indexes.items():
+        for keys, options in specs:
+            try:
+                db[collection_name].create_index(keys, **options)
+            except pymongo.errors.OperationFailure as e:
+                failures += 1
+                print(f"⚠️  Index {collection_name}.{keys} not created: {e}")
+    return failures
+
+
+def has_index(collection, keys):
+    """Whether collection has an index on exactly these keys"""
+    keys = [(field, direction) for field, direction in keys]
+    return any([(field, direction) for field, direction in spec['key']] == keys
+               for spec in collection.index_information().values())
+
+
+if __name__ == "__main__":
+    client = pymongo.MongoClient(os.getenv("MONGO_URI"))
+    db = client["fir_data"]
+
+    print("🗂️  Applying indexes to 'fir_data'...")
+    failures = ensure_indexes(db)
+    for collection_name in INDEXES:
+        names = sorted(db[collection_name].index_information())
+        print(f"  {collection_name}: {', '.join(names)}")
+    print("  ✅ Done" if not failures else f"  ⚠️  {failures} index(es) could not be created")
+
+    client.close()
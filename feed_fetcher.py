@@ -0,0 +1,166 @@
+"""
+Concurrent Feed Fetcher
+Downloads RSS feeds in parallel with per-host limits, per-feed timeouts
+and an overall deadline, reporting how long each feed took.
+With a state store, feeds are fetched conditionally (ETag / Last-Modified)
+and only entries newer than the last run are returned.
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from urllib.parse import urlparse
+import feedparser
+import requests
+from requests.adapters import HTTPAdapter
+from feed_state import new_entries, next_state
+
+DEFAULT_HEADERS = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64)'}
+
+
+class HostLimiter:
+    """Caps the number of in-flight requests per host"""
+
+    def __init__(self, per_host=2):
+        self.per_host = per_host
+        self._semaphores = {}
+        self._lock = threading.Lock()
+
+    def slot(self, url):
+        """Semaphore to hold while requesting url"""
+        host = urlparse(url).netloc
+        with self._lock:
+            if host not in self._semaphores:
+                self._semaphores[host] = threading.BoundedSemaphore(self.per_host)
+            return self._semaphores[host]
+
+
+class FeedFetcher:
+    def __init__(self, max_workers=8, per_host=2, timeout=10, deadline=60, headers=None, state=None):
+        """
+        max_workers=1 fetches sequentially. timeout bounds each feed's whole
+        download; deadline bounds the entire batch. state is an optional
+        SQLiteFeedState / MongoFeedState used for conditional requests.
+        """
+        self.state = state
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self.deadline = deadline
+        self.headers = headers or DEFAULT_HEADERS
+        self.limiter = HostLimiter(per_host)
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=max_workers, pool_maxsize=max_workers)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+    def _download(self, url, headers):
+        """GET url, aborting if the full body takes longer than self.timeout"""
+        start = time.monotonic()
+        with self.session.get(url, headers=headers, timeout=self.timeout, stream=True) as response:
+            response.raise_for_status()
+            chunks = []
+            for chunk in response.iter_content(chunk_size=16384):
+                chunks.append(chunk)
+                if time.monotonic() - start > self.timeout:
+                    raise TimeoutError(f"feed took longer than {self.timeout}s")
+            return response.status_code, b''.join(chunks), response.headers
+
+    def fetch(self, url):
+        """
+        Download and parse one feed.
+        result['entries'] holds the entries to process: all of them without
+        a state store, otherwise only those newer than the previous run.
+        """
+        result = {'url': url, 'status': None, 'feed': None, 'entries': [], 'bytes': 0,
+                  'elapsed': 0.0, 'parse_elapsed': 0.0, 'error': None, 'not_modified': False,
+                  'bytes_saved': 0}
+        start = time.monotonic()
+        try:
+            state = self.state.get(url) if self.state else {}
+            headers = dict(self.headers)
+            if state.get('etag'):
+                headers['If-None-Match'] = state['etag']
+            if state.get('last_modified'):
+                headers['If-Modified-Since'] = state['last_modified']
+
+            with self.limiter.slot(url):
+                status, content, response_headers = self._download(url, headers)
+            result['status'] = status
+            result['bytes'] = len(content)
+
+            if status == 304:
+                # Unchanged since last run: nothing downloaded, nothing to parse
+                result['not_modified'] = True
+                result['bytes_saved'] = state.get('bytes', 0)
+            else:
+                parse_start = time.monotonic()
+                feed = feedparser.parse(content)
+                result['parse_elapsed'] = time.monotonic() - parse_start
+                result['feed'] = feed
+                if self.state:
+                    result['entries'] = new_entries(feed.entries, state)
+                    result['state'] = next_state(state, response_headers, feed.entries, len(content))
+                else:
+                    result['entries'] = feed.entries
+        except Exception as e:
+            result['error'] = str(e) or e.__class__.__name__
+        result['elapsed'] = time.monotonic() - start
+        return result
+
+    def fetch_all(self, urls):
+        """
+        Fetch every feed concurrently.
+        Returns {url: result}; feeds still running at the deadline are
+        reported with an error and their results discarded.
+        """
+        executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        futures = {executor.submit(self.fetch, url): url for url in urls}
+        done, _ = wait(futures, timeout=self.deadline)
+        executor.shutdown(wait=False, cancel_futures=True)
+
+        results = {}
+        for future, url in futures.items():
+            if future in done:
+                results[url] = future.result()
+            else:
+                results[url] = {'url': url, 'status': None, 'feed': None, 'entries': [], 'bytes': 0,
+                                'elapsed': self.deadline, 'parse_elapsed': 0.0, 'error': 'deadline exceeded',
+                                'not_modified': False, 'bytes_saved': 0}
+        return results
+
+    def save_state(self, results):
+        """
+        Persist validators and high-water marks for successfully fetched
+        feeds. Call after their entries have been processed, so a crash
+        mid-run does not skip them next time.
+        """
+        if not self.state:
+            return
+        for result in results.values():
+            if result.get('state'):
+                self.state.put(result['url'], result['state'])
+
+
+def print_feed_timings(results):
+    """Print a per-feed timing table"""
+    print("\n⏱️  Feed timings:")
+    for result in sorted(results.values(), key=lambda r: r['elapsed'], reverse=True):
+        if result['error']:
+            outcome = f"❌ {result['error'][:60]}"
+        elif result['not_modified']:
+            outcome = "304 not modified"
+        else:
+            outcome = (f"{len(result['entries'])}/{len(result['feed'].entries)} new entries, "
+                       f"{result['bytes'] / 1024:.0f} KB")
+        print(f"  {result['elapsed']:6.2f}s  {result['url']}  {outcome}")
+
+
+def print_cache_savings(results):
+    """Summarise what conditional requests and high-water marks saved"""
+    not_modified = sum(1 for r in results.values() if r['not_modified'])
+    bytes_saved = sum(r['bytes_saved'] for r in results.values())
+    skipped = sum(len(r['feed'].entries) - len(r['entries'])
+                  for r in results.values() if r['feed'] is not None)
+    print(f"  💾 Feed cache: {not_modified} unchanged (304), {bytes_saved / 1024:.0f} KB and "
+          f"{not_modified} parses saved, {skipped} already-seen entries skipped")
@@ -0,0 +1,98 @@
+"""
+Feed State Store
+Remembers ETag / Last-Modified and the newest entries seen for each feed URL,
+so unchanged feeds can be skipped with a conditional GET
+"""
+
+import calendar
+import json
+import os
+import sqlite3
+import threading
+
+DEFAULT_DB_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'feed_state.db')
+MAX_SEEN_IDS = 500
+
+
+def entry_id(entry):
+    """Stable identifier for a feed entry"""
+    return entry.get('id') or entry.get('link') or entry.get('title', '')
+
+
+def entry_timestamp(entry):
+    """Published/updated time of an entry as epoch seconds, if the feed gives one"""
+    parsed = entry.get('published_parsed') or entry.get('updated_parsed')
+    return calendar.timegm(parsed) if parsed else None
+
+
+def new_entries(entries, state):
+    """Entries not seen before and newer than the stored high-water mark"""
+    seen = set(state.get('seen_ids') or [])
+    high_water = state.get('high_water')
+
+    fresh = []
+    for entry in entries:
+        if entry_id(entry) in seen:
+            continue
+        timestamp = entry_timestamp(entry)
+        if high_water is not None and timestamp is not None and timestamp <= high_water:
+            continue
+        fresh.append(entry)
+    return fresh
+
+
+def next_state(state, response_headers, entries, body_bytes):
+    """State to store after a successful (200) fetch"""
+    timestamps = [t for t in (entry_timestamp(e) for e in entries) if t is not None]
+    high_water = max(timestamps + ([state['high_water']] if state.get('high_water') is not None else []),
+                     default=None)
+    return {
+        'etag': response_headers.get('ETag'),
+        'last_modified': response_headers.get('Last-Modified'),
+        'seen_ids': [entry_id(e) for e in entries][:MAX_SEEN_IDS],
+        'high_water': high_water,
+        'bytes': body_bytes
+    }
+
+
+class SQLiteFeedState:
+    """Feed state in a local SQLite file (for scripts run on one machine)"""
+
+    def __init__(self, path=DEFAULT_DB_PATH):
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS feed_state (url TEXT PRIMARY KEY, state TEXT NOT NULL)"
+            )
+
+    def get(self, url):
+        with self._lock:
+            row = self._conn.execute("SELECT state FROM feed_state WHERE url = ?", (url,)).fetchone()
+        return json.loads(row[0]) if row else {}
+
+    def put(self, url, state):
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO feed_state (url, state) VALUES (?, ?)", (url, json.dumps(state))
+            )
+
+    def close(self):
+        self._conn.close()
+
+
+class MongoFeedState:
+    """Feed state in a Mongo collection (survives ephemeral CI runners)"""
+
+    def __init__(self, collection):
+        self.collection = collection
+
+    def get(self, url):
+        doc = self.collection.find_one({'_id': url}, {'_id': 0})
+        return doc or {}
+
+    def put(self, url, state):
+        self.collection.replace_one({'_id': url}, state, upsert=True)
+
+    def close(self):
+        pass
@@ -0,0 +1,199 @@
+"""
+Offline Gazetteer
+Bundled centroids for Mumbai localities, Mumbai police stations and major
+Indian cities, with common aliases. Resolving a known place needs no network
+call, so the geocoder is only a fallback for names not listed here.
+"""
+
+import re
+
+# Mumbai Metropolitan Region localities: name -> ((lat, lon), aliases)
+MUMBAI_LOCALITIES = {
+    'Andheri': ((19.1136, 72.8697), ['Andheri East', 'Andheri West']),
+    'Bandra': ((19.0596, 72.8295), ['Bandra East', 'Bandra West', 'Bandra Kurla Complex', 'BKC']),
+    'Borivali': ((19.2403, 72.8565), ['Borivli']),
+    'Churchgate': ((18.9322, 72.8264), []),
+    'Colaba': ((18.9067, 72.8147), []),
+    'Cuffe Parade': ((18.9150, 72.8200), []),
+    'Dadar': ((19.0178, 72.8478), []),
+    'Goregaon': ((19.1663, 72.8526), []),
+    'Juhu': ((19.1075, 72.8263), []),
+    'Kandivali': ((19.2047, 72.8521), ['Kandivli']),
+    'Kurla': ((19.0728, 72.8826), []),
+    'Malad': ((19.1864, 72.8493), []),
+    'Mulund': ((19.1726, 72.9425), []),
+    'Powai': ((19.1176, 72.9060), []),
+    'Santacruz': ((19.0838, 72.8410), ['Santa Cruz']),
+    'Vile Parle': ((19.0990, 72.8440), ['Vileparle']),
+    'Worli': ((19.0183, 72.8169), []),
+    'Ghatkopar': ((19.0864, 72.9081), []),
+    'Vikhroli': ((19.1112, 72.9279), []),
+    'Bhandup': ((19.1442, 72.9375), []),
+    'Chembur': ((19.0522, 72.9005), []),
+    'Dharavi': ((19.0380, 72.8538), []),
+    'Mahim': ((19.0400, 72.8400), []),
+    'Matunga': ((19.0271, 72.8553), []),
+    'Sion': ((19.0390, 72.8619), []),
+    'Wadala': ((19.0176, 72.8562), []),
+    'Parel': ((18.9986, 72.8378), []),
+    'Lower Parel': ((18.9953, 72.8302), []),
+    'Byculla': ((18.9793, 72.8331), []),
+    'Mazgaon': ((18.9670, 72.8440), []),
+    'Grant Road': ((18.9633, 72.8150), []),
+    'Marine Drive': ((18.9440, 72.8230), []),
+    'Malabar Hill': ((18.9548, 72.7985), []),
+    'Fort': ((18.9345, 72.8356), []),
+    'Nariman Point': ((18.9256, 72.8242), []),
+    'Khar': ((19.0728, 72.8367), []),
+    'Versova': ((19.1351, 72.8146), []),
+    'Jogeshwari': ((19.1365, 72.8486), []),
+    'Oshiwara': ((19.1480, 72.8350), []),
+    'Sakinaka': ((19.1030, 72.8877), ['Saki Naka']),
+    'Dahisar': ((19.2494, 72.8596), []),
+    'Mankhurd': ((19.0489, 72.9321), []),
+    'Govandi': ((19.0551, 72.9152), []),
+    'Thane': ((19.2183, 72.9781), []),
+    'Navi Mumbai': ((19.0330, 73.0297), ['New Bombay']),
+    'Vashi': ((19.0771, 72.9986), []),
+    'Kharghar': ((19.0473, 73.0699), []),
+    'Panvel': ((18.9894, 73.1175), []),
+    'Kalyan': ((19.2437, 73.1355), []),
+    'Dombivli': ((19.2183, 73.0868), ['Dombivali']),
+    'Ulhasnagar': ((19.2215, 73.1645), []),
+    'Bhiwandi': ((19.2813, 73.0483), []),
+    'Vasai': ((19.3919, 72.8397), ['Vasai Virar']),
+    'Mira Road': ((19.2813, 72.8558), ['Mira Bhayandar']),
+    'Bhayander': ((19.3010, 72.8512), ['Bhayandar']),
+}
+
+# Mumbai police stations whose names are not simply a locality name
+# (every locality above also resolves as "<locality> Police Station")
+MUMBAI_POLICE_STATIONS = {
+    'MIDC Police Station': ((19.1190, 72.8710), []),
+    'Azad Maidan Police Station': ((18.9387, 72.8335), []),
+    'D N Nagar Police Station': ((19.1265, 72.8320), ['DN Nagar Police Station']),
+    'Amboli Police Station': ((19.1290, 72.8460), []),
+    'Pant Nagar Police Station': ((19.0820, 72.9130), ['Pantnagar Police Station']),
+    'Tilak Nagar Police Station': ((19.0660, 72.8960), []),
+    'Shivaji Park Police Station': ((19.0270, 72.8380), []),
+    'Gamdevi Police Station': ((18.9610, 72.8110), []),
+    'Dongri Police Station': ((18.9600, 72.8350), []),
+    'Nagpada Police Station': ((18.9690, 72.8260), []),
+    'VP Road Police Station': ((18.9560, 72.8190), ['V P Road Police Station']),
+    'Kasturba Marg Police Station': ((19.2250, 72.8650), []),
+    'Samta Nagar Police Station': ((19.2080, 72.8690), []),
+    'Kurar Police Station': ((19.1900, 72.8680), []),
+    'Vanrai Police Station': ((19.1650, 72.8620), []),
+    'Park Site Police Station': ((19.1060, 72.9240), []),
+    'Trombay Police Station': ((19.0280, 72.9300), []),
+    'RCF Police Station': ((19.0430, 72.8990), []),
+    'Nehru Nagar Police Station': ((19.0700, 72.8850), []),
+}
+
+# Major Indian cities: name -> ((lat, lon), state, aliases)
+INDIAN_CITIES = {
+    'Mumbai': ((19.0760, 72.8777), 'Maharashtra', ['Bombay']),
+    'Delhi': ((28.7041, 77.1025), 'Delhi', ['New Delhi']),
+    'Bangalore': ((12.9716, 77.5946), 'Karnataka', ['Bengaluru']),
+    'Chennai': ((13.0827, 80.2707), 'Tamil Nadu', ['Madras']),
+    'Kolkata': ((22.5726, 88.3639), 'West Bengal', ['Calcutta']),
+    'Hyderabad': ((17.3850, 78.4867), 'Telangana', []),
+    'Pune': ((18.5204, 73.8567), 'Maharashtra', ['Poona']),
+    'Ahmedabad': ((23.0225, 72.5714), 'Gujarat', []),
+    'Surat': ((21.1702, 72.8311), 'Gujarat', []),
+    'Jaipur': ((26.9124, 75.7873), 'Rajasthan', []),
+    'Lucknow': ((26.8467, 80.9462), 'Uttar Pradesh', []),
+    'Kanpur': ((26.4499, 80.3319), 'Uttar Pradesh', []),
+    'Nagpur': ((21.1458, 79.0882), 'Maharashtra', []),
+    'Indore': ((22.7196, 75.8577), 'Madhya Pradesh', []),
+    'Bhopal': ((23.2599, 77.4126), 'Madhya Pradesh', []),
+    'Visakhapatnam': ((17.6868, 83.2185), 'Andhra Pradesh', ['Vizag']),
+    'Patna': ((25.5941, 85.1376), 'Bihar', []),
+    'Vadodara': ((22.3072, 73.1812), 'Gujarat', ['Baroda']),
+    'Ghaziabad': ((28.6692, 77.4538), 'Uttar Pradesh', []),
+    'Ludhiana': ((30.9010, 75.8573), 'Punjab', []),
+    'Agra': ((27.1767, 78.0081), 'Uttar Pradesh', []),
+    'Nashik': ((19.9975, 73.7898), 'Maharashtra', ['Nasik']),
+    'Faridabad': ((28.4089, 77.3178), 'Haryana', []),
+    'Meerut': ((28.9845, 77.7064), 'Uttar Pradesh', []),
+    'Rajkot': ((22.3039, 70.8022), 'Gujarat', []),
+    'Varanasi': ((25.3176, 82.9739), 'Uttar Pradesh', ['Banaras', 'Benares']),
+    'Srinagar': ((34.0837, 74.7973), 'Jammu and Kashmir', []),
+    'Aurangabad': ((19.8762, 75.3433), 'Maharashtra', ['Chhatrapati Sambhajinagar']),
+    'Dhanbad': ((23.7957, 86.4304), 'Jharkhand', []),
+    'Amritsar': ((31.6340, 74.8723), 'Punjab', []),
+    'Allahabad': ((25.4358, 81.8463), 'Uttar Pradesh', ['Prayagraj']),
+    'Ranchi': ((23.3441, 85.3096), 'Jharkhand', []),
+    'Howrah': ((22.5958, 88.2636), 'West Bengal', []),
+    'Coimbatore': ((11.0168, 76.9558), 'Tamil Nadu', []),
+    'Jabalpur': ((23.1815, 79.9864), 'Madhya Pradesh', []),
+    'Gwalior': ((26.2183, 78.1828), 'Madhya Pradesh', []),
+    'Vijayawada': ((16.5062, 80.6480), 'Andhra Pradesh', []),
+    'Jodhpur': ((26.2389, 73.0243), 'Rajasthan', []),
+    'Madurai': ((9.9252, 78.1198), 'Tamil Nadu', []),
+    'Raipur': ((21.2514, 81.6296), 'Chhattisgarh', []),
+    'Kota': ((25.2138, 75.8648), 'Rajasthan', []),
+    'Chandigarh': ((30.7333, 76.7794), 'Chandigarh', []),
+    'Guwahati': ((26.1445, 91.7362), 'Assam', []),
+    'Noida': ((28.5355, 77.3910), 'Uttar Pradesh', []),
+    'Gurugram': ((28.4595, 77.0266), 'Haryana', ['Gurgaon']),
+}
+
+INDIA = {'name': 'India', 'kind': 'country', 'latitude': 20.5937, 'longitude': 78.9629, 'region': ''}
+
+# Suffixes that do not change which place is meant
+_SUFFIX_PATTERN = re.compile(r'\s+(?:\((?:e|w|east|west)\)|east|west|e|w)$')
+_STATION_PATTERN = re.compile(r'\s+(?:police\s+station|police\s+chowki|police|ps)$')
+
+
+def normalize_name(name):
+    """Lookup key for a place name"""
+    name = re.sub(r'[^\w\s()]', ' ', str(name).lower())
+    name = re.sub(r'\s+', ' ', name).strip()
+    return _SUFFIX_PATTERN.sub('', name)
+
+
+def _build_index():
+    index = {}
+
+    def add(names, place):
+        for name in names:
+            index.setdefault(normalize_name(name), place)
+
+    for name, ((lat, lon), state, aliases) in INDIAN_CITIES.items():
+        add([name] + aliases, {'name': name, 'kind': 'city', 'latitude': lat, 'longitude': lon,
+                               'region': f"{state}, India"})
+    for name, ((lat, lon), aliases) in MUMBAI_LOCALITIES.items():
+        add([name] + aliases, {'name': name, 'kind': 'locality', 'latitude': lat, 'longitude': lon,
+                               'region': 'Mumbai, Maharashtra, India'})
+    for name, ((lat, lon), aliases) in MUMBAI_POLICE_STATIONS.items():
+        add([name] + aliases, {'name': name, 'kind': 'police_station', 'latitude': lat, 'longitude': lon,
+                               'region': 'Mumbai, Maharashtra, India'})
+    add(['India'], INDIA)
+    return index
+
+
+_INDEX = _build_index()
+
+
+def resolve(name):
+    """
+    Gazetteer entry for a place name or alias, or None if unknown.
+    "<locality> Police Station" resolves to the locality's centroid.
+    Entries are dicts: name, kind, latitude, longitude, region.
+    """
+    if not name:
+        return None
+    key = normalize_name(name)
+    place = _INDEX.get(key)
+    if place is None:
+        station = _STATION_PATTERN.sub('', key)
+        if station != key:
+            place = _INDEX.get(normalize_name(station))
+    return dict(place) if place else None
+
+
+def coordinates(name):
+    """(lat, lon) for a known place, or None"""
+    place = resolve(name)
+    return (place['latitude'], place['longitude']) if place else None
@@ -0,0 +1,120 @@
+"""
+Persistent Geocode Cache
+SQLite-backed store of geocoder results shared by the scraper and importer,
+so repeat runs resolve known places without network calls or rate-limit sleeps
+
+Settings (environment):
+    GEOCODE_CACHE_PATH   - database file (default: geocode_cache.db next to this module)
+    GEOCODE_TTL_DAYS     - how long a found place is trusted (default 180)
+    GEOCODE_NEGATIVE_TTL_DAYS - how long a "not found" is remembered (default 7)
+    GEOCODE_OFFLINE=1    - never call the geocoder; misses resolve to None
+"""
+
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+
+DEFAULT_DB_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'geocode_cache.db')
+DAY_SECONDS = 24 * 60 * 60
+
+
+def normalize_query(query):
+    """Cache key for a place query: case, spacing and comma spacing ignored"""
+    query = re.sub(r'\s+', ' ', str(query).lower()).strip()
+    return re.sub(r'\s*,\s*', ', ', query).strip(', ')
+
+
+def geopy_geocoder(geolocator, timeout=10):
+    """Wrap a geopy geocoder as query -> {'latitude', 'longitude', 'address'} or None"""
+    def geocode(query):
+        location = geolocator.geocode(query, timeout=timeout)
+        if location is None:
+            return None
+        return {
+            'latitude': location.latitude,
+            'longitude': location.longitude,
+            'address': location.address
+        }
+    return geocode
+
+
+class GeocodeCache:
+    def __init__(self, path=None, ttl_days=None, negative_ttl_days=None, offline=None):
+        """Arguments left as None are read from the environment"""
+        self.path = path or os.getenv('GEOCODE_CACHE_PATH') or DEFAULT_DB_PATH
+        self.ttl = float(ttl_days if ttl_days is not None else os.getenv('GEOCODE_TTL_DAYS', 180)) * DAY_SECONDS
+        self.negative_ttl = float(negative_ttl_days if negative_ttl_days is not None
+                                  else os.getenv('GEOCODE_NEGATIVE_TTL_DAYS', 7)) * DAY_SECONDS
+        self.offline = offline if offline is not None else os.getenv('GEOCODE_OFFLINE', '') in ('1', 'true', 'yes')
+        self.stats = {'hits': 0, 'misses': 0, 'calls': 0}
+
+        self._last_call = 0.0
+        self._call_lock = threading.Lock()  # serializes real calls across threads
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS geocode_cache "
+                "(query TEXT PRIMARY KEY, result TEXT, fetched_at REAL NOT NULL)"
+            )
+
+    def get(self, query):
+        """
+        (found, result) for a cached query; result is None for a cached
+        "not found". Expired entries count as not cached.
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT result, fetched_at FROM geocode_cache WHERE query = ?", (normalize_query(query),)
+            ).fetchone()
+        if row is None:
+            return False, None
+
+        result = json.loads(row[0]) if row[0] is not None else None
+        ttl = self.ttl if result is not None else self.negative_ttl
+        if time.time() - row[1] > ttl:
+            return False, None
+        return True, result
+
+    def put(self, query, result):
+        """Store a result (None caches the query as not found)"""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO geocode_cache (query, result, fetched_at) VALUES (?, ?, ?)",
+                (normalize_query(query), json.dumps(result) if result is not None else None, time.time())
+            )
+
+    def lookup(self, query, geocode, min_interval=1.0):
+        """
+        Cached geocode(query). The geocoder is only called on a miss, at
+        most once per min_interval seconds, and never in offline mode.
+        Geocoder exceptions propagate and are not cached.
+        """
+        found, result = self.get(query)
+        if found:
+            self.stats['hits'] += 1
+            return result
+
+        self.stats['misses'] += 1
+        if self.offline:
+            return None
+
+        # Rate limit only real calls, and only for the time not already spent
+        with self._call_lock:
+            wait = self._last_call + min_interval - time.monotonic()
+            if wait > 0:
+                time.sleep(wait)
+            try:
+                self.stats['calls'] += 1
+                result = geocode(query)
+            finally:
+                self._last_call = time.monotonic()
+
+        self.put(query, result)
+        return result
+
+    def close(self):
+        self._conn.close()
@@ -0,0 +1,229 @@
+"""
+Materialized Hotspot Grid
+Per-cell crime aggregates kept in the hotspot_cells collection and updated
+incrementally as crimes are inserted, so hotspot queries are a top-k read
+
+The grid is first built by the importer / auto_scraper (ensure_materialized),
+never from a server request. Run directly to rebuild it from crime_news
+(fixes any drift):
+    python hotspot_cells.py
+"""
+
+import math
+import os
+import uuid
+from collections import defaultdict
+from datetime import datetime, timedelta
+import pymongo
+from dotenv import load_dotenv
+
+load_dotenv()
+
+CELLS_COLLECTION = 'hotspot_cells'
+CELLS_PER_DEGREE = 20  # ~2.5km grid
+UNKNOWN_LOCATION = 'Unknown'
+# One lock document per grid, so only one rebuild runs at a time; a lock
+# older than REBUILD_LOCK_SECONDS is from a rebuild that died and is taken over
+REBUILD_LOCKS = 'rebuild_locks'
+REBUILD_LOCK_SECONDS = 600
+REBUILD_PROJECTION = {'latitude': 1, 'longitude': 1, 'location': 1, 'severity_level': 1}
+
+
+def cell_id(latitude, longitude):
+    """Grid cell key for a coordinate (cell centre, rounded to the grid)"""
+    lat_key = round(latitude * CELLS_PER_DEGREE) / CELLS_PER_DEGREE
+    lon_key = round(longitude * CELLS_PER_DEGREE) / CELLS_PER_DEGREE
+    return f"{lat_key},{lon_key}"
+
+
+def _location_field(name):
+    """Location names become field names, so escape '.' and '$' (and never leave one empty)"""
+    name = str(name).strip() if name is not None else ''
+    return (name or UNKNOWN_LOCATION).replace('.', '．').replace('$', '＄')
+
+
+def _location_name(field):
+    return field.replace('．', '.').replace('＄', '$')
+
+
+def _risk_raw(count, critical_count, high_count):
+    """Uncapped hotspot risk; the API caps it at 100"""
+    return count * 10 + critical_count * 30 + high_count * 15
+
+
+def _accumulate(crimes):
+    """Sum the per-cell aggregates for a batch of crime documents"""
+    cells = defaultdict(lambda: {
+        'count': 0, 'lat_sum': 0.0, 'lon_sum': 0.0,
+        'critical_count': 0, 'high_count': 0,
+        'locations': defaultdict(int)
+    })
+
+    for crime in crimes:
+        latitude = crime.get('latitude')
+        longitude = crime.get('longitude')
+        if not isinstance(latitude, (int, float)) or not isinstance(longitude, (int, float)):
+            continue
+        if not math.isfinite(latitude) or not math.isfinite(longitude):
+            continue  # NaN/inf cannot be placed on the grid
+
+        cell = cells[cell_id(latitude, longitude)]
+        cell['count'] += 1
+        cell['lat_sum'] += latitude
+        cell['lon_sum'] += longitude
+        if crime.get('severity_level') == 'Critical':
+            cell['critical_count'] += 1
+        elif crime.get('severity_level') == 'High':
+            cell['high_count'] += 1
+        cell['locations'][_location_field(crime.get('location'))] += 1
+
+    return cells
+
+
+def record_crimes(cells_collection, crimes):
+    """Fold newly inserted crimes into the materialized grid"""
+    operations = []
+    for key, cell in _accumulate(crimes).items():
+        increments = {
+            'count': cell['count'],
+            'lat_sum': cell['lat_sum'],
+            'lon_sum': cell['lon_sum'],
+            'critical_count': cell['critical_count'],
+            'high_count': cell['high_count'],
+            'risk_raw': _risk_raw(cell['count'], cell['critical_count'], cell['high_count'])
+        }
+        for location, count in cell['locations'].items():
+            increments[f"locations.{location}"] = count
+        operations.append(pymongo.UpdateOne({'_id': key}, {'$inc': increments}, upsert=True))
+
+    if operations:
+        cells_collection.bulk_write(operations, ordered=False)
+    return len(operations)
+
+
+def ensure_indexes(cells_collection):
+    """Index backing the top-k hotspot read"""
+    cells_collection.create_index([('risk_raw', -1), ('count', -1)])
+
+
+def _acquire_rebuild_lock(cells_collection, owner):
+    locks = cells_collection.database[REBUILD_LOCKS]
+    now = datetime.utcnow()
+    lock = {'owner': owner, 'expires_at': now + timedelta(seconds=REBUILD_LOCK_SECONDS)}
+    try:
+        locks.insert_one(dict(lock, _id=cells_collection.name))
+        return True
+    except pymongo.errors.DuplicateKeyError:
+        taken = locks.find_one_and_update({'_id': cells_collection.name, 'expires_at': {'$lt': now}},
+                                          {'$set': lock})
+        return taken is not None
+
+
+def _release_rebuild_lock(cells_collection, owner):
+    cells_collection.database[REBUILD_LOCKS].delete_one({'_id': cells_collection.name, 'owner': owner})
+
+
+def rebuild(crime_collection, cells_collection):
+    """
+    Recompute every cell from crime_news and swap the result in. Returns
+    the number of cells, or None if another rebuild holds the lock.
+
+    Crimes are read up to the newest _id at the start; ones inserted while
+    the grid is built (whose record_crimes went to the old grid) are then
+    folded into the new grid in catch-up passes until one finds none, right
+    before the rename. Only a crime inserted between that last pass and the
+    rename can still be missed; re-running the rebuild corrects it.
+    """
+    owner = uuid.uuid4().hex
+    if not _acquire_rebuild_lock(cells_collection, owner):
+        return None
+
+    # A private scratch collection per rebuild, renamed over the live one
+    staging = cells_collection.database[f"{cells_collection.name}_rebuild_{owner[:12]}"]
+    try:
+        newest = crime_collection.find_one({}, {'_id': 1}, sort=[('_id', -1)])
+        last_id = newest['_id'] if newest else None
+        crimes = crime_collection.find({'_id': {'$lte': last_id}}, REBUILD_PROJECTION) if newest else []
+
+        documents = []
+        for key, cell in _accumulate(crimes).items():
+            documents.append({
+                '_id': key,
+                'count': cell['count'],
+                'lat_sum': cell['lat_sum'],
+                'lon_sum': cell['lon_sum'],
+                'critical_count': cell['critical_count'],
+                'high_count': cell['high_count'],
+                'risk_raw': _risk_raw(cell['count'], cell['critical_count'], cell['high_count']),
+                'locations': dict(cell['locations'])
+            })
+        if documents:
+            staging.insert_many(documents)
+
+        while True:
+            query = {'_id': {'$gt': last_id}} if last_id is not None else {}
+            newer = list(crime_collection.find(query, REBUILD_PROJECTION).sort('_id', 1))
+            if not newer:
+                break
+            record_crimes(staging, newer)
+            last_id = newer[-1]['_id']
+
+        cell_count = staging.count_documents({})
+        if cell_count:
+            ensure_indexes(staging)
+            staging.rename(cells_collection.name, dropTarget=True)
+        else:
+            cells_collection.delete_many({})
+        return cell_count
+    finally:
+        staging.drop()
+        _release_rebuild_lock(cells_collection, owner)
+
+
+def ensure_materialized(crime_collection, cells_collection):
+    """
+    Build the grid if it is empty, so incremental updates never start from
+    a partial state. Called by the ingestion jobs, not by server requests;
+    if another process is already building it, that build is left to finish.
+    """
+    if cells_collection.estimated_document_count() == 0 and crime_collection.estimated_document_count() > 0:
+        rebuild(crime_collection, cells_collection)
+    ensure_indexes(cells_collection)
+
+
+def top_hotspots(cells_collection, min_crimes=3, limit=10):
+    """Highest-risk cells with at least min_crimes crimes"""
+    cells = cells_collection.find({'count': {'$gte': min_crimes}}).sort(
+        [('risk_raw', -1), ('count', -1)]
+    ).limit(limit)
+
+    result = []
+    for cell in cells:
+        locations = cell.get('locations') or {UNKNOWN_LOCATION: 1}
+        location = max(locations.items(), key=lambda item: item[1])[0]
+
+        result.append({
+            'location': _location_name(location),
+            'latitude': cell['lat_sum'] / cell['count'],
+            'longitude': cell['lon_sum'] / cell['count'],
+            'crime_count': cell['count'],
+            'critical_crimes': cell['critical_count'],
+            'high_crimes': cell['high_count'],
+            'risk_score': min(cell['risk_raw'], 100),  # Cap at 100
+            'radius_km': 1.5
+        })
+    return result
+
+
+if __name__ == "__main__":
+    client = pymongo.MongoClient(os.getenv("MONGO_URI"))
+    db = client["fir_data"]
+
+    print(f"🔄 Rebuilding '{CELLS_COLLECTION}' from 'crime_news'...")
+    cell_count = rebuild(db["crime_news"], db[CELLS_COLLECTION])
+    if cell_count is None:
+        print(f"  ⏳ Another rebuild is running (lock in '{REBUILD_LOCKS}'); try again later")
+    else:
+        print(f"  ✅ Materialized {cell_count} grid cells")
+
+    client.close()
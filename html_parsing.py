@@ -0,0 +1,78 @@
+"""
+HTML Parsing
+One place to pick the parser for every BeautifulSoup call site (lxml when
+installed, else the pure-Python html.parser), plus parse-free helpers for
+the hot paths that never needed a tree: stripping tags from short RSS
+descriptions and reading og:image / twitter:image out of a page's <head>
+"""
+
+import html
+import re
+from bs4 import BeautifulSoup
+
+try:
+    import lxml  # noqa: F401 (BeautifulSoup's fast tree builder)
+    PARSER = 'lxml'
+except ImportError:
+    PARSER = 'html.parser'
+
+# Tags that separate words when removed; inline tags (<b>, <a>, ...) do not
+_BLOCK_TAGS = frozenset([
+    'address', 'article', 'aside', 'blockquote', 'br', 'dd', 'div', 'dl', 'dt',
+    'figcaption', 'figure', 'footer', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'header',
+    'hr', 'img', 'li', 'ol', 'p', 'pre', 'section', 'table', 'td', 'th', 'tr', 'ul'
+])
+_HIDDEN = re.compile(r'<(script|style)\b.*?</\1\s*>|<!--.*?-->|<[!?][^>]*>', re.S | re.I)
+# Only a '<' followed by a tag name starts a tag; a bare '<' ("x < 5") is text
+_TAG = re.compile(r'<\s*/?\s*([a-zA-Z][a-zA-Z0-9]*)\b[^>]*>')
+_SPACE = re.compile(r'\s+')
+
+_META_TAG = re.compile(r'<meta\b[^>]*>', re.I)
+_ATTRIBUTE = re.compile(r'''([\w:.-]+)\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s"'>]+))''')
+_META_IMAGE_KEYS = ('og:image', 'twitter:image')
+
+
+def parse_html(markup):
+    """BeautifulSoup tree using the fastest available parser"""
+    return BeautifulSoup(markup, PARSER)
+
+
+def _replace_tag(match):
+    name = match.group(1).lower()
+    return ' ' if name in _BLOCK_TAGS else ''
+
+
+def strip_tags(markup):
+    """Plain text of an HTML fragment (tags removed, entities decoded, spaces collapsed)"""
+    if not markup:
+        return ''
+    if '<' not in markup and '&' not in markup:
+        return _SPACE.sub(' ', markup).strip()
+    text = _TAG.sub(_replace_tag, _HIDDEN.sub(' ', markup))
+    return _SPACE.sub(' ', html.unescape(text)).strip()
+
+
+def _attributes(tag):
+    attributes = {}
+    for name, double, single, bare in _ATTRIBUTE.findall(tag):
+        attributes[name.lower()] = html.unescape(double or single or bare)
+    return attributes
+
+
+def meta_image(markup):
+    """
+    og:image (preferred) or twitter:image content from <meta> tags, or None.
+    Works on a truncated document, e.g. just the bytes up to </head>.
+    """
+    if isinstance(markup, (bytes, bytearray)):
+        markup = bytes(markup).decode('utf-8', 'replace')
+
+    found = {}
+    for tag in _META_TAG.findall(markup):
+        attributes = _attributes(tag)
+        key = (attributes.get('property') or attributes.get('name') or '').lower()
+        if key in _META_IMAGE_KEYS and attributes.get('content') and key not in found:
+            found[key] = attributes['content'].strip()
+            if key == 'og:image':
+                break
+    return next((found[key] for key in _META_IMAGE_KEYS if key in found), None)
@@ -1,21 +1,37 @@
 """
 Import crime news data into MongoDB
-Reads crime_news_data.json and inserts into your existing fir_data database
+Reads crime_news_data.ndjson / crime_news_data.json and inserts into your existing fir_data database
 Enhanced with: image fetching, better geocoding, and record display
 """
 
-import json
+import itertools
+import re
 import pymongo
 import os
+import sys
+import threading
+from collections import OrderedDict
 from datetime import datetime
 from dotenv import load_dotenv
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
 from geopy.geocoders import Nominatim
 from geopy.exc import GeocoderTimedOut
 import time
 from urllib.parse import urljoin
+from concurrent.futures import ThreadPoolExecutor
 import warnings
+from crime_geo import geojson_point
+from hotspot_cells import CELLS_COLLECTION, ensure_materialized, record_crimes
+from feed_fetcher import HostLimiter
+from gazetteer import resolve as resolve_place
+from html_parsing import meta_image, parse_html
+from near_duplicate import DEFAULT_THRESHOLD, NearDuplicateIndex
+from geocode_cache import GeocodeCache, geopy_geocoder
+from article_stream import ImportCheckpoint, batched, iter_articles
+from response_cache import bump_data_version
+from db_schema import ensure_indexes
+from run_metrics import RunMetrics
 
 # Disable SSL warnings
 warnings.filterwarnings('ignore', message='Unverified HTTPS request')
@@ -24,9 +40,37 @@ urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
 load_dotenv()
 
+NEWS_DATA_FILE = 'crime_news_data.json'
+NEWS_NDJSON_FILE = 'crime_news_data.ndjson'
+IMPORT_BATCH_SIZE = int(os.getenv("IMPORT_BATCH_SIZE", 50))
+
 # Initialize geocoder
 geolocator = Nominatim(user_agent="crimepulse_importer_v1")
-geocode_cache = {}
+geocode = geopy_geocoder(geolocator)
+# Persistent across runs and shared with news_scraper.py
+geocode_cache = GeocodeCache()
+
+# Image lookups share one pooled session and run concurrently,
+# at most IMAGE_PER_HOST at a time against any one news site
+IMAGE_FETCH_WORKERS = 16
+IMAGE_PER_HOST = 4
+MAX_IMAGE_PAGE_BYTES = 2 * 1024 * 1024
+HEAD_END = re.compile(rb'</head\s*>', re.IGNORECASE)
+image_session = requests.Session()
+image_session.mount('https://', HTTPAdapter(pool_connections=IMAGE_FETCH_WORKERS, pool_maxsize=IMAGE_FETCH_WORKERS))
+image_session.mount('http://', HTTPAdapter(pool_connections=IMAGE_FETCH_WORKERS, pool_maxsize=IMAGE_FETCH_WORKERS))
+image_host_limiter = HostLimiter(IMAGE_PER_HOST)
+# Article URL -> image URL (or None), least recently used first; kept across
+# batches so a URL seen again later in the file is not fetched twice
+IMAGE_CACHE_SIZE = int(os.getenv("IMAGE_CACHE_SIZE", 5000))
+image_cache = OrderedDict()
+image_cache_lock = threading.Lock()
+
+# Title signatures and LSH bands are stored like auto_scraper's, so its
+# near-duplicate lookups also find articles that came through this importer
+title_index = NearDuplicateIndex(float(os.getenv("TITLE_DUPLICATE_THRESHOLD", DEFAULT_THRESHOLD)))
+# Only crime_news is searched for near-duplicates; the 'firs' mirror leaves them out
+TITLE_SIGNATURE_FIELDS = ('title_minhash', 'title_bands')
 
 
 def display_existing_records(collection, limit=5):
@@ -81,110 +125,138 @@ def display_existing_records(collection, limit=5):
     print("=" * 80)
 
 
+def _body_image(soup):
+    """Fallback: pick an image out of the article body"""
+    # 3. First article image
+    article_img = soup.find('article') or soup.find('div', class_='article')
+    if article_img:
+        img = article_img.find('img')
+        if img and (img.get('src') or img.get('data-src')):
+            return img.get('src') or img.get('data-src')
+    
+    # 4. Any large image in content
+    for img in soup.find_all('img'):
+        src = img.get('src') or img.get('data-src')
+        if src and not any(x in src.lower() for x in ['logo', 'icon', 'avatar', 'thumbnail']):
+            # Check if it's reasonably sized
+            width = img.get('width', '0')
+            height = img.get('height', '0')
+            if width and height:
+                try:
+                    if int(width) > 300 or int(height) > 200:
+                        return src
+                except:
+                    pass
+            else:
+                return src
+    
+    return None
+
+
 def fetch_article_image(url, title=""):
-    """Fetch the main image from an article URL"""
+    """
+    Fetch the main image from an article URL.
+    The page is streamed and reading stops at </head> when an og:image or
+    twitter:image is found there; the body is only downloaded as a fallback.
+    """
     if not url or not url.startswith('http'):
         return None
     
+    with image_cache_lock:
+        if url in image_cache:
+            image_cache.move_to_end(url)
+            return image_cache[url]
+    
+    image_url = None
     try:
         headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         }
         
-        response = requests.get(url, headers=headers, timeout=5, verify=False)
-        soup = BeautifulSoup(response.content, 'html.parser')
-        
-        # Try multiple strategies to find image
-        image_url = None
-        
-        # 1. Open Graph image
-        og_image = soup.find('meta', property='og:image')
-        if og_image and og_image.get('content'):
-            image_url = og_image['content']
-        
-        # 2. Twitter card image
-        if not image_url:
-            twitter_image = soup.find('meta', attrs={'name': 'twitter:image'})
-            if twitter_image and twitter_image.get('content'):
-                image_url = twitter_image['content']
-        
-        # 3. First article image
-        if not image_url:
-            article_img = soup.find('article') or soup.find('div', class_='article')
-            if article_img:
-                img = article_img.find('img')
-                if img and (img.get('src') or img.get('data-src')):
-                    image_url = img.get('src') or img.get('data-src')
-        
-        # 4. Any large image in content
-        if not image_url:
-            for img in soup.find_all('img'):
-                src = img.get('src') or img.get('data-src')
-                if src and not any(x in src.lower() for x in ['logo', 'icon', 'avatar', 'thumbnail']):
-                    # Check if it's reasonably sized
-                    width = img.get('width', '0')
-                    height = img.get('height', '0')
-                    if width and height:
-                        try:
-                            if int(width) > 300 or int(height) > 200:
-                                image_url = src
-                                break
-                        except:
-                            pass
-                    else:
-                        image_url = src
+        with image_host_limiter.slot(url):
+            with image_session.get(url, headers=headers, timeout=5, verify=False, stream=True) as response:
+                chunks = response.iter_content(chunk_size=8192)
+                content = bytearray()
+                head_end = -1
+                
+                for chunk in chunks:
+                    # Only the new bytes (plus a tag's worth of overlap) are searched
+                    search_from = max(0, len(content) - 16)
+                    content.extend(chunk)
+                    match = HEAD_END.search(content, search_from)
+                    head_end = match.end() if match else -1
+                    if head_end != -1 or len(content) > MAX_IMAGE_PAGE_BYTES:
                         break
+                
+                # Try multiple strategies to find image
+                if head_end != -1:
+                    image_url = meta_image(content[:head_end])
+                
+                if not image_url:
+                    for chunk in chunks:
+                        content.extend(chunk)
+                        if len(content) > MAX_IMAGE_PAGE_BYTES:
+                            break
+                    image_url = meta_image(content) or _body_image(parse_html(bytes(content)))
         
         # Make URL absolute
-        if image_url:
-            if not image_url.startswith('http'):
-                image_url = urljoin(url, image_url)
-            
-            return image_url
+        if image_url and not image_url.startswith('http'):
+            image_url = urljoin(url, image_url)
         
     except KeyboardInterrupt:
         raise  # Re-raise keyboard interrupt
     except:
-        pass  # Silently fail on any other error
+        image_url = None  # Silently fail on any other error
     
-    return None
+    with image_cache_lock:
+        image_cache[url] = image_url
+        if len(image_cache) > IMAGE_CACHE_SIZE:
+            image_cache.popitem(last=False)
+    return image_url
+
+
+def fetch_article_images(urls):
+    """Resolve images for many articles concurrently; returns {url: image_url}"""
+    unique_urls = list(dict.fromkeys(url for url in urls if url))
+    with ThreadPoolExecutor(max_workers=IMAGE_FETCH_WORKERS) as executor:
+        images = executor.map(fetch_article_image, unique_urls)
+        return dict(zip(unique_urls, images))
 
 
 def get_precise_coordinates(location_name, city="Mumbai", state="Maharashtra", country="India"):
     """Get precise lat/lon for a specific location using geocoding"""
     
-    # Check cache first
-    cache_key = f"{location_name}_{city}"
-    if cache_key in geocode_cache:
-        return geocode_cache[cache_key]
+    # Known areas, stations and cities come from the bundled gazetteer
+    place = resolve_place(location_name)
+    if place:
+        return {
+            'latitude': place['latitude'],
+            'longitude': place['longitude'],
+            'formatted_address': ', '.join(part for part in (place['name'], place['region']) if part)
+        }
     
+    # Lookups hit the persistent cache first; only misses reach the
+    # geocoder, rate limited to one call per 0.5s
     try:
-        # Add delay to respect rate limits (reduced to 0.5s since we're caching)
-        time.sleep(0.5)
-        
         # Try full address first
         full_address = f"{location_name}, {city}, {state}, {country}"
-        location = geolocator.geocode(full_address, timeout=10)
+        location = geocode_cache.lookup(full_address, geocode, min_interval=0.5)
         
         if location:
-            coords = {
-                'latitude': location.latitude,
-                'longitude': location.longitude,
-                'formatted_address': location.address
+            return {
+                'latitude': location['latitude'],
+                'longitude': location['longitude'],
+                'formatted_address': location['address']
             }
-            geocode_cache[cache_key] = coords
-            return coords
         
         # Try with just city if area not found
-        location = geolocator.geocode(f"{city}, {state}, {country}", timeout=10)
+        location = geocode_cache.lookup(f"{city}, {state}, {country}", geocode, min_interval=0.5)
         if location:
-            coords = {
-                'latitude': location.latitude,
-                'longitude': location.longitude,
+            return {
+                'latitude': location['latitude'],
+                'longitude': location['longitude'],
                 'formatted_address': f"{city}, {state}, {country} (default)"
             }
-            geocode_cache[cache_key] = coords
-            return coords
             
     except GeocoderTimedOut:
         pass
@@ -197,11 +269,145 @@ def get_precise_coordinates(location_name, city="Mumbai", state="Maharashtra", c
         'longitude': 72.8777 + (hash(location_name) % 100) * 0.001,
         'formatted_address': f"{location_name}, Mumbai (approximate)"
     }
-    geocode_cache[cache_key] = default
     return default
 
-def import_news_to_mongodb():
-    """Import scraped news data into MongoDB with images and precise geocoding"""
+def build_news_record(article, index, location_counter, coords=None):
+    """
+    Classify and geocode one scraped article (the image is added later).
+    coords: the article location's get_precise_coordinates(), if already looked up
+    """
+    location_name = article.get('location', 'Mumbai')
+    
+    # Get precise coordinates for this specific location
+    # Add small variation if we've seen this location before
+    location_key = location_name.lower()
+    if location_key in location_counter:
+        location_counter[location_key] += 1
+        variation = location_counter[location_key] * 0.0001
+    else:
+        location_counter[location_key] = 0
+        variation = 0
+    
+    coords = coords or get_precise_coordinates(location_name)
+    
+    # Add variation to prevent exact duplicates
+    latitude = coords['latitude'] + variation
+    longitude = coords['longitude'] + variation
+    
+    title_minhash = title_index.hasher.signature(article.get('title') or '')
+    
+    # Create enhanced record
+    return {
+        'fir_number': f"NEWS-{datetime.now().strftime('%Y%m%d')}-{index:04d}",
+        'crime_type': article.get('crime_type', 'unknown').upper(),
+        'crime_category': article.get('crime_type', 'unknown'),
+        'severity_level': get_severity_level(article.get('crime_type')),
+        
+        # Precise geocoding
+        'latitude': latitude,
+        'longitude': longitude,
+        'location_geo': geojson_point(latitude, longitude),
+        'location': location_name,
+        'formatted_address': coords.get('formatted_address'),
+        'police_station': extract_police_station(location_name),
+        
+        # Dates
+        'incident_date': article.get('published_date'),
+        'scraped_date': article.get('scraped_date'),
+        
+        # News-specific fields
+        'source': article.get('source'),
+        'title': article.get('title'),
+        'description': article.get('description'),
+        'news_url': article.get('link'),
+        'image_url': None,
+        'is_verified': False,
+        'data_source': 'news_scraper',
+        
+        # Near-duplicate lookups (see near_duplicate.py)
+        'title_minhash': title_minhash,
+        'title_bands': title_index.band_keys(title_minhash),
+        
+        # Metadata
+        'created_at': datetime.now(),
+        'is_mumbai_related': True
+    }
+
+
+def normalize_created_at(collection):
+    """
+    Convert created_at values stored as ISO strings (by earlier imports)
+    to dates, so date-range queries on created_at match them.
+    Returns the number of documents converted.
+    """
+    operations = []
+    for doc in collection.find({'created_at': {'$type': 'string'}}, {'created_at': 1}):
+        try:
+            created_at = datetime.fromisoformat(doc['created_at'].replace('Z', '+00:00'))
+        except ValueError:
+            continue
+        operations.append(pymongo.UpdateOne({'_id': doc['_id']}, {'$set': {'created_at': created_at}}))
+    if operations:
+        collection.bulk_write(operations, ordered=False)
+    return len(operations)
+
+
+def known_urls(collection, urls):
+    """The subset of urls already stored in collection"""
+    urls = [url for url in urls if url]
+    if not urls:
+        return set()
+    return {doc['news_url'] for doc in collection.find({'news_url': {'$in': urls}}, {'news_url': 1, '_id': 0})}
+
+
+def write_records(collection, records):
+    """
+    Write a batch in one unordered bulk write. Articles are upserted on
+    news_url with $setOnInsert, so re-running a batch after an interrupted
+    import never duplicates them. Returns the records actually inserted.
+    Records without a news_url are skipped: under the unique index they
+    would all collide on a null key.
+    """
+    records = [r for r in records if r.get('news_url')]
+    if not records:
+        return []
+    operations = [
+        pymongo.UpdateOne({'news_url': r['news_url']}, {'$setOnInsert': r}, upsert=True)
+        for r in records
+    ]
+    
+    try:
+        result = collection.bulk_write(operations, ordered=False)
+        inserted = set(result.upserted_ids)
+    except pymongo.errors.BulkWriteError as e:
+        # The unique news_url index turns racing upserts into duplicate key errors
+        errors = [error for error in e.details.get('writeErrors', []) if error.get('code') != 11000]
+        if errors:
+            raise
+        inserted = {item['index'] for item in e.details.get('upserted', [])}
+    
+    return [records[i] for i in sorted(inserted)]
+
+
+def latest_news_file():
+    """The scraper's most recent output: NDJSON or the classic JSON document"""
+    existing = [path for path in (NEWS_NDJSON_FILE, NEWS_DATA_FILE) if os.path.exists(path)]
+    return max(existing, key=os.path.getmtime) if existing else NEWS_DATA_FILE
+
+
+def import_news_to_mongodb(path=None, batch_size=IMPORT_BATCH_SIZE):
+    """
+    Import scraped news data into MongoDB with images and precise geocoding.
+    Articles are streamed from the file and pass through classify -> geocode
+    -> image -> write in batches of batch_size, so memory stays flat however
+    large the file is. Progress is checkpointed after every batch; running
+    the import again after an interruption resumes where it stopped.
+    path may be NDJSON (.ndjson/.jsonl) or JSON; it defaults to the newer
+    of crime_news_data.ndjson and crime_news_data.json.
+    """
+    path = path or latest_news_file()
+    # Per-stage, per-source timings and counts (see run_metrics.py)
+    metrics = RunMetrics('import_news_to_db')
     
     # Connect to MongoDB
     MONGODB_URI = os.getenv("MONGO_URI")
@@ -215,150 +421,152 @@ def import_news_to_mongodb():
         
         # Create/access collections
         news_collection = db["crime_news"]
+        fir_collection = db["firs"]
+        hotspot_cells = db[CELLS_COLLECTION]
+        ensure_indexes(db)
+        for collection in (news_collection, fir_collection):
+            converted = normalize_created_at(collection)
+            if converted:
+                print(f"🕒 Converted created_at to a date on {converted} {collection.name} records")
         
         # Display existing records FIRST
         display_existing_records(news_collection, limit=5)
         
-        # Read the JSON file
-        with open('crime_news_data.json', 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        
-        articles = data.get('articles', [])
-        
-        if not articles:
-            print("⚠️  No articles found in crime_news_data.json")
-            return
+        checkpoint = ImportCheckpoint(path)
+        done = checkpoint.load()
         
         print(f"\n{'='*80}")
         print(f"📊 NEW DATA TO IMPORT:")
         print(f"{'='*80}")
-        print(f"Found {len(articles)} articles to import")
+        print(f"Streaming articles from {path} ({os.path.getsize(path) / 1024:.0f} KB), "
+              f"{batch_size} per batch")
+        if checkpoint.is_imported():
+            print(f"✅ All {done} articles were imported by an earlier run; nothing to do")
+        elif done:
+            print(f"⏩ Resuming after {done} articles imported by an earlier run")
         print(f"💾 Importing to database: {db.name}")
         print(f"📁 Collection: {news_collection.name}")
         print()
         
-        # Process articles with progress
-        news_records = []
+        ensure_materialized(news_collection, hotspot_cells)
+        
+        # Running totals only; records are dropped once their batch is written
         location_counter = {}  # Track locations to ensure unique coords
+        crime_counts = {}
+        totals = {'read': 0, 'inserted': 0, 'duplicates': 0, 'no_url': 0, 'images': 0, 'firs': 0}
+        start = time.time()
         
-        for i, article in enumerate(articles, 1):
-            try:
-                if i % 20 == 0 or i == 1:  # Show progress every 20 articles
-                    print(f"Processing {i}/{len(articles)}...")
-                
-                location_name = article.get('location', 'Mumbai')
-                
-                # Get precise coordinates for this specific location
-                # Add small variation if we've seen this location before
-                location_key = location_name.lower()
-                if location_key in location_counter:
-                    location_counter[location_key] += 1
-                    variation = location_counter[location_key] * 0.0001
-                else:
-                    location_counter[location_key] = 0
-                    variation = 0
+        articles = itertools.islice(enumerate(metrics.timed_iter('parse', iter_articles(path)), 1), done, None)
+        try:
+            for batch in batched(articles, batch_size):
+                # Articles an earlier import already stored (e.g. ones the scraper
+                # carried over into this file) skip geocoding and image lookups
+                with metrics.timer('dedupe'):
+                    known = known_urls(news_collection, [article.get('link') for _, article in batch])
                 
-                coords = get_precise_coordinates(location_name)
+                # Classify + geocode
+                records = []
+                for i, article in batch:
+                    source = article.get('source') or 'unknown'
+                    metrics.count('articles', 1, source)
+                    if not article.get('link'):
+                        # Cannot be upserted or deduplicated without a URL
+                        metrics.count('no_url', 1, source)
+                        totals['no_url'] += 1
+                        continue
+                    if article.get('link') in known:
+                        metrics.count('duplicates', 1, source)
+                        totals['duplicates'] += 1
+                        continue
+                    try:
+                        with metrics.timer('geocode', source):
+                            coords = get_precise_coordinates(article.get('location', 'Mumbai'))
+                        with metrics.timer('classify', source):
+                            records.append(build_news_record(article, i, location_counter, coords))
+                    except Exception as e:
+                        metrics.count('errors', 1, source)
+                        print(f"\n⚠️  Error processing article {i}: {str(e)[:50]}")
                 
-                # Add variation to prevent exact duplicates
-                latitude = coords['latitude'] + variation
-                longitude = coords['longitude'] + variation
+                # Images, fetched concurrently for the whole batch
+                with metrics.timer('image'):
+                    images = fetch_article_images(record['news_url'] for record in records)
+                for record in records:
+                    record['image_url'] = images.get(record['news_url'])
+                    if record['image_url']:
+                        metrics.count('images', 1, record['source'])
                 
-                # Fetch image from article (with timeout protection)
-                try:
-                    image_url = fetch_article_image(article.get('link'), article.get('title'))
-                except:
-                    image_url = None
-                    
-                # Create enhanced record
-                record = {
-                    'fir_number': f"NEWS-{datetime.now().strftime('%Y%m%d')}-{i:04d}",
-                    'crime_type': article.get('crime_type', 'unknown').upper(),
-                    'crime_category': article.get('crime_type', 'unknown'),
-                    'severity_level': get_severity_level(article.get('crime_type')),
-                    
-                    # Precise geocoding
-                    'latitude': latitude,
-                    'longitude': longitude,
-                    'location': location_name,
-                    'formatted_address': coords.get('formatted_address'),
-                    'police_station': extract_police_station(location_name),
-                    
-                    # Dates
-                    'incident_date': article.get('published_date'),
-                    'scraped_date': article.get('scraped_date'),
-                    
-                    # News-specific fields
-                    'source': article.get('source'),
-                    'title': article.get('title'),
-                    'description': article.get('description'),
-                    'news_url': article.get('link'),
-                    'image_url': image_url,  # NEW: Image URL
-                    'is_verified': False,
-                    'data_source': 'news_scraper',
-                    
-                    # Metadata
-                    'created_at': datetime.now().isoformat(),
-                    'is_mumbai_related': True
-                }
+                # Write, then fold the new crimes into the hotspot grid and
+                # mirror them into 'firs' for the unified heatmap
+                with metrics.timer('write'):
+                    inserted = write_records(news_collection, records) if records else []
+                with metrics.timer('hotspots'):
+                    record_crimes(hotspot_cells, inserted)
+                if inserted:
+                    bump_data_version(news_collection)
+                    with metrics.timer('write'):
+                        mirrored = [{key: value for key, value in record.items() if key not in TITLE_SIGNATURE_FIELDS}
+                                    for record in inserted]
+                        totals['firs'] += len(write_records(fir_collection, mirrored))
+                checkpoint.save(batch[-1][0])
+                done = batch[-1][0]
+                for record in inserted:
+                    metrics.count('inserted', 1, record['source'])
+                metrics.count('duplicates', len(records) - len(inserted))
                 
-                news_records.append(record)
-                
-            except KeyboardInterrupt:
-                print("\n⚠️  Import interrupted by user")
-                break
-            except Exception as e:
-                print(f"\n⚠️  Error processing article {i}: {str(e)[:50]}")
-                continue
+                totals['read'] += len(batch)
+                totals['inserted'] += len(inserted)
+                totals['duplicates'] += len(records) - len(inserted)
+                totals['images'] += sum(1 for r in inserted if r.get('image_url'))
+                for record in inserted:
+                    crime_counts[record['crime_type']] = crime_counts.get(record['crime_type'], 0) + 1
+                print(f"  ✅ Articles {batch[0][0]}-{batch[-1][0]}: {len(inserted)} inserted, "
+                      f"{len(records) - len(inserted) + len(known)} already in database "
+                      f"({time.time() - start:.1f}s)")
+        except KeyboardInterrupt:
+            print("\n⚠️  Import interrupted by user - run again to resume from the last batch")
+            client.close()
+            metrics.finish('interrupted')
+            return
         
-        # Insert into MongoDB
-        if news_records:
-            print(f"{'='*80}")
-            print("💾 INSERTING RECORDS INTO DATABASE...")
-            print(f"{'='*80}\n")
-            
-            result = news_collection.insert_many(news_records)
-            print(f"✅ Successfully inserted {len(result.inserted_ids)} records")
-            print()
-            
-            # Print detailed summary
-            print(f"{'='*80}")
-            print("📈 IMPORT SUMMARY:")
-            print(f"{'='*80}")
-            print(f"Total records imported: {len(news_records)}")
-            print(f"Records with images: {sum(1 for r in news_records if r.get('image_url'))}")
-            print(f"Unique locations: {len(location_counter)}")
-            print()
-            
-            crime_counts = {}
-            for record in news_records:
-                ct = record['crime_type']
-                crime_counts[ct] = crime_counts.get(ct, 0) + 1
-            
+        # Kept (marked complete) so the scraper knows it may start a fresh file
+        checkpoint.finish(done)
+        geo = geocode_cache.stats
+        print(f"🗺️  Geocode cache: {geo['hits']} hits, {geo['misses']} misses, {geo['calls']} geocoder calls")
+        print()
+        
+        # Print detailed summary
+        print(f"{'='*80}")
+        print("📈 IMPORT SUMMARY:")
+        print(f"{'='*80}")
+        print(f"Articles read: {totals['read']}")
+        print(f"Total records imported: {totals['inserted']}")
+        print(f"Already in database: {totals['duplicates']}")
+        if totals['no_url']:
+            print(f"Skipped (no URL): {totals['no_url']}")
+        print(f"Records with images: {totals['images']}")
+        print(f"Unique locations: {len(location_counter)}")
+        print()
+        
+        if crime_counts:
             print("Crime type breakdown:")
             for crime_type, count in sorted(crime_counts.items(), key=lambda x: x[1], reverse=True):
                 print(f"  - {crime_type:15s}: {count:3d} records")
-            
             print()
-            print("🔗 DATABASE INFO:")
-            print(f"  Database: {db.name}")
-            print(f"  Collection: {news_collection.name}")
-            print(f"  Total documents: {news_collection.count_documents({})}")
-            
-            # Also add to main 'firs' collection automatically
-            print()
-            print("📌 Adding to 'firs' collection for unified heatmap...")
-            fir_collection = db["firs"]
-            fir_result = fir_collection.insert_many([r.copy() for r in news_records])
-            print(f"✅ Added {len(fir_result.inserted_ids)} records to 'firs' collection")
-            print(f"  Total FIRs: {fir_collection.count_documents({})}")
+        
+        print("🔗 DATABASE INFO:")
+        print(f"  Database: {db.name}")
+        print(f"  Collection: {news_collection.name}")
+        print(f"  Total documents: {news_collection.count_documents({})}")
+        print(f"  Added to 'firs': {totals['firs']} (total FIRs: {fir_collection.count_documents({})})")
         
         client.close()
+        metrics.finish()
         print(f"\n{'='*80}")
         print("🎉 Import complete! Your data is ready for the heatmap.")
         print(f"{'='*80}")
         
     except Exception as e:
+        metrics.finish('failed')
         print(f"❌ Error: {str(e)}")
         import traceback
         traceback.print_exc()
@@ -435,13 +643,17 @@ if __name__ == "__main__":
     print("  ✓ Fetch article images automatically")
     print("  ✓ Precise geocoding for unique lat/lon")
     print("  ✓ Detailed import progress")
+    print("  ✓ Streaming, batched and resumable")
     print("=" * 80)
     print()
     
-    # Check if JSON file exists
-    if not os.path.exists('crime_news_data.json'):
-        print("❌ Error: crime_news_data.json not found")
+    # Optional path argument, e.g. python import_news_to_db.py other_run.ndjson
+    path = sys.argv[1] if len(sys.argv) > 1 else latest_news_file()
+    
+    # Check if the data file exists
+    if not os.path.exists(path):
+        print(f"❌ Error: {path} not found")
         print("   Run news_scraper.py first to generate data")
     else:
-        import_news_to_mongodb()
+        import_news_to_mongodb(path)
 
@@ -0,0 +1,122 @@
+"""
+Keyword Matcher
+Crime-type and location keyword tables compiled into one matcher, so an
+article is tokenized once and only keywords that can possibly occur in it
+are checked, however many keywords or areas are configured
+"""
+
+import string
+import threading
+from operator import itemgetter
+
+MAX_HEAD = 4
+# Byte table blanking everything but ASCII letters and digits, so that any
+# keyword starting at a word boundary starts a token after .split()
+_ALNUM = (string.ascii_letters + string.digits).encode()
+_TOKEN_TABLE = bytes(byte if byte in _ALNUM else 32 for byte in range(256))
+
+
+def _tokens(text):
+    return text.encode('utf-8').translate(_TOKEN_TABLE).split()
+
+
+def _is_word_char(char):
+    return char.isalnum() or char == '_'
+
+
+def _occurs(text, keyword, whole_word):
+    """keyword in text starting at a word boundary (and ending at one if whole_word)"""
+    pos = text.find(keyword)
+    while pos != -1:
+        end = pos + len(keyword)
+        if ((pos == 0 or not _is_word_char(text[pos - 1])) and
+                (not whole_word or end == len(text) or not _is_word_char(text[end]))):
+            return True
+        pos = text.find(keyword, pos + 1)
+    return False
+
+
+class KeywordMatcher:
+    def __init__(self):
+        self.groups = {}      # group -> [labels, in priority order]
+        self._entries = []    # (keyword, group, label, whole_word)
+        # (always, lookups, rank), built on first match and swapped in whole,
+        # so shared matchers are safe to first use from several threads
+        self._compiled = None
+        self._lock = threading.Lock()
+
+    def add_group(self, group, labels, whole_words=False):
+        """
+        Register a group of labels. labels maps each label to its keywords
+        (or is a plain list, each keyword being its own label), in priority
+        order. Keywords match at the start of a word (so 'kidnap' matches
+        'kidnapped'); with whole_words they must also end at a word boundary.
+        """
+        if not isinstance(labels, dict):
+            labels = {label: [label] for label in labels}
+
+        with self._lock:
+            self.groups[group] = list(labels)
+            for label, keywords in labels.items():
+                for keyword in keywords:
+                    self._entries.append((keyword.lower(), group, label, whole_words))
+            self._compiled = None
+        return self
+
+    def _compile(self):
+        with self._lock:
+            if self._compiled is None:
+                self._compiled = self._build()
+            return self._compiled
+
+    def _build(self):
+        # Every keyword is filed under the first few bytes of its longest
+        # word; intersecting those heads with the heads of a text's words
+        # selects the handful of keywords worth verifying. Keywords without
+        # an ASCII word are always verified.
+        always = []
+        heads = {}  # head length -> {head: [entries]}
+        for entry in self._entries:
+            words = _tokens(entry[0])
+            if not words or not entry[0].isascii():
+                always.append(entry)
+                continue
+            word = max(words, key=len)
+            size = min(MAX_HEAD, len(word))
+            heads.setdefault(size, {}).setdefault(word[:size], []).append(entry)
+
+        lookups = [(itemgetter(slice(None, size)), frozenset(table), table)
+                   for size, table in heads.items()]
+        rank = {(group, label): rank for group, labels in self.groups.items()
+                for rank, label in enumerate(labels)}
+        return always, lookups, rank
+
+    def match(self, text):
+        """
+        Every label hit in text, per group, in priority order:
+        {group: [label, ...]}
+        """
+        always, lookups, rank = self._compiled or self._compile()
+
+        text = (text or '').lower()
+        words = _tokens(text)
+        candidates = [always]
+        for head_of, heads, table in lookups:
+            for head in heads.intersection(map(head_of, words)):
+                candidates.append(table[head])
+
+        found = set()
+        for entries in candidates:
+            for keyword, group, label, whole_word in entries:
+                if (group, label) not in found and _occurs(text, keyword, whole_word):
+                    found.add((group, label))
+
+        hits = {group: [] for group in self.groups}
+        for group, label in sorted(found, key=rank.__getitem__):
+            hits[group].append(label)
+        return hits
+
+    def first(self, text, group, default=None):
+        """Highest-priority label of group found in text"""
+        labels = self.match(text)[group]
+        return labels[0] if labels else default
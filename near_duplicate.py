@@ -0,0 +1,203 @@
+"""
+Near-Duplicate Titles
+MinHash signatures over character shingles of normalized titles, bucketed
+with locality-sensitive hashing so a lookup only compares a title against
+the few stored titles sharing a band, instead of every title seen so far
+
+Run directly to store signatures on crime_news documents that lack them:
+    python near_duplicate.py
+"""
+
+import hashlib
+import json
+import os
+import re
+import zlib
+import numpy as np
+import pymongo
+from dotenv import load_dotenv
+from gazetteer import INDIAN_CITIES, MUMBAI_LOCALITIES
+from keyword_matcher import KeywordMatcher
+
+load_dotenv()
+
+NUM_PERM = 128
+SHINGLE_SIZE = 3
+DEFAULT_THRESHOLD = 0.8  # Estimated Jaccard similarity of title shingles
+# Bands are laid out for a lower similarity than the match threshold: a pair
+# at 0.8 then shares a band ~99.8% of the time (a layout centred on 0.8 would
+# catch only ~63%), and stored title_bands stay valid if the threshold moves
+BAND_THRESHOLD = 0.6
+_PRIME = (1 << 31) - 1
+
+# Places named in titles: "Man held for theft in Kurla" and "... in Dadar" are
+# different incidents however similar the rest of the title is
+PLACES = KeywordMatcher()
+PLACES.add_group('place', {
+    **{name: [name] + aliases for name, (_, _, aliases) in INDIAN_CITIES.items()},
+    **{name: [name] + aliases for name, (_, aliases) in MUMBAI_LOCALITIES.items()}
+}, whole_words=True)
+
+
+def normalize_title(title):
+    """Lowercase, with everything but letters and digits removed"""
+    return re.sub(r'\W+', '', (title or '').lower())
+
+
+def places_in(title):
+    """Gazetteer places (canonical names) mentioned in a title"""
+    return frozenset(PLACES.match(title)['place']) if title else frozenset()
+
+
+def same_places(places_a, places_b):
+    """
+    Whether two titles can describe the same incident: one names no place
+    the other lacks ("Mumbai: theft in Kurla" vs "Theft in Kurla" is fine).
+    None means unknown and never rules a match out.
+    """
+    if places_a is None or places_b is None:
+        return True
+    return places_a <= places_b or places_b <= places_a
+
+
+def shingles(text, size=SHINGLE_SIZE):
+    """Set of overlapping character n-grams (the whole text if shorter)"""
+    if len(text) <= size:
+        return {text}
+    return {text[i:i + size] for i in range(len(text) - size + 1)}
+
+
+def choose_bands(num_perm, threshold):
+    """
+    (bands, rows) whose LSH S-curve crosses 50% closest to threshold;
+    titles at or above the threshold then almost always share a band
+    """
+    best = None
+    for rows in range(1, num_perm + 1):
+        bands = num_perm // rows
+        crossing = (1 / bands) ** (1 / rows)
+        if best is None or abs(crossing - threshold) < best[0]:
+            best = (abs(crossing - threshold), bands, rows)
+    return best[1], best[2]
+
+
+def similarity(signature_a, signature_b):
+    """Estimated Jaccard similarity: the fraction of equal MinHash values"""
+    return float(np.mean(np.asarray(signature_a) == np.asarray(signature_b)))
+
+
+class MinHasher:
+    def __init__(self, num_perm=NUM_PERM, shingle_size=SHINGLE_SIZE, seed=1):
+        """Permutations are seeded, so signatures are comparable across runs"""
+        rng = np.random.RandomState(seed)
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        self._a = rng.randint(1, _PRIME, size=num_perm, dtype=np.int64).astype(np.uint64)
+        self._b = rng.randint(0, _PRIME, size=num_perm, dtype=np.int64).astype(np.uint64)
+
+    def signature(self, title):
+        """MinHash signature (list of ints) of a title"""
+        grams = shingles(normalize_title(title), self.shingle_size)
+        hashes = np.fromiter((zlib.crc32(gram.encode('utf-8')) % _PRIME for gram in grams),
+                             dtype=np.uint64, count=len(grams))
+        values = (self._a[:, None] * hashes[None, :] + self._b[:, None]) % _PRIME
+        return values.min(axis=1).tolist()
+
+
+class NearDuplicateIndex:
+    def __init__(self, threshold=DEFAULT_THRESHOLD, num_perm=NUM_PERM, shingle_size=SHINGLE_SIZE):
+        """
+        threshold: estimated Jaccard similarity at which titles count as
+        duplicates (if they also name the same places, see same_places)
+        """
+        self.threshold = threshold
+        self.hasher = MinHasher(num_perm, shingle_size)
+        self.bands, self.rows = choose_bands(num_perm, min(threshold, BAND_THRESHOLD))
+        self.signatures = {}  # key -> signature
+        self.places = {}      # key -> places_in(title), None if the title is unknown
+        self.buckets = {}     # band key -> [keys]
+
+    def band_keys(self, signature):
+        """One bucket key per band, stable across runs (safe to store)"""
+        keys = []
+        for band in range(self.bands):
+            values = signature[band * self.rows:(band + 1) * self.rows]
+            digest = hashlib.blake2b(json.dumps(values).encode(), digest_size=8).hexdigest()
+            keys.append(f"{band}:{digest}")
+        return keys
+
+    def find(self, title, signature=None):
+        """(key, similarity) of the closest stored near-duplicate, or (None, 0.0)"""
+        if signature is None:
+            signature = self.hasher.signature(title)
+
+        candidates = set()
+        for band_key in self.band_keys(signature):
+            candidates.update(self.buckets.get(band_key, ()))
+
+        places = places_in(title) if title is not None else None
+        best = (None, 0.0)
+        for key in candidates:
+            score = similarity(signature, self.signatures[key])
+            if score >= self.threshold and score > best[1] and same_places(places, self.places[key]):
+                best = (key, score)
+        return best
+
+    def add(self, title, key=None, signature=None):
+        """
+        Store a title (key defaults to its normalized form). title may be
+        None when only the signature is known; places are then not checked.
+        """
+        if signature is None:
+            signature = self.hasher.signature(title)
+        key = key if key is not None else normalize_title(title)
+        self.signatures[key] = signature
+        self.places[key] = places_in(title) if title is not None else None
+        for band_key in self.band_keys(signature):
+            self.buckets.setdefault(band_key, []).append(key)
+        return key
+
+    def is_duplicate(self, title):
+        """True if title is a near-duplicate of a stored one; otherwise store it"""
+        signature = self.hasher.signature(title)
+        if self.find(title, signature)[0] is not None:
+            return True
+        self.add(title, signature=signature)
+        return False
+
+    def __len__(self):
+        return len(self.signatures)
+
+
+def backfill_title_signatures(collection, index, batch_size=500):
+    """Set title_minhash / title_bands on documents stored without them"""
+    cursor = collection.find({'title_bands': {'$exists': False}}, {'title': 1})
+
+    updated = 0
+    batch = []
+    for doc in cursor:
+        signature = index.hasher.signature(doc.get('title', ''))
+        batch.append(pymongo.UpdateOne({'_id': doc['_id']}, {'$set': {
+            'title_minhash': signature,
+            'title_bands': index.band_keys(signature)
+        }}))
+        if len(batch) >= batch_size:
+            updated += collection.bulk_write(batch, ordered=False).modified_count
+            batch = []
+    if batch:
+        updated += collection.bulk_write(batch, ordered=False).modified_count
+
+    return updated
+
+
+if __name__ == "__main__":
+    client = pymongo.MongoClient(os.getenv("MONGO_URI"))
+    collection = client["fir_data"]["crime_news"]
+    index = NearDuplicateIndex(float(os.getenv("TITLE_DUPLICATE_THRESHOLD", DEFAULT_THRESHOLD)))
+
+    print(f"🔁 Backfilling title signatures on '{collection.name}'...")
+    updated = backfill_title_signatures(collection, index)
+    collection.create_index([('title_bands', 1)])
+    print(f"  ✅ Updated {updated} documents")
+
+    client.close()
@@ -1,30 +1,103 @@
 """
 Optimized Crime News Scraper for Mumbai
-Uses BeautifulSoup + Selenium + RSS to fetch 100+ crime entries
+Uses BeautifulSoup + RSS (+ optional Selenium rendering) to fetch 100+ crime entries
 """
 
 import json
 import requests
-from bs4 import BeautifulSoup
 from datetime import datetime, timedelta
 import time
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
-from webdriver_manager.chrome import ChromeDriverManager
+import threading
+from functools import partial
 from geopy.geocoders import Nominatim
 from geopy.exc import GeocoderTimedOut
-from fuzzywuzzy import fuzz
-import feedparser
 import re
 import os
 from dotenv import load_dotenv
+from feed_fetcher import FeedFetcher
+from feed_state import SQLiteFeedState
+from article_stream import ImportCheckpoint, NDJSONWriter, iter_ndjson_articles
+from near_duplicate import DEFAULT_THRESHOLD, NearDuplicateIndex
+from keyword_matcher import KeywordMatcher
+from gazetteer import resolve as resolve_place
+from geocode_cache import GeocodeCache, geopy_geocoder
+from html_parsing import parse_html, strip_tags
+from renderers import ARTICLE_SELECTOR, make_renderer
+from scrape_scheduler import ScrapeScheduler, job
 
 load_dotenv()
 
+# Sources, in the order the phases used to run
+RSS_FEEDS = [
+    # Mumbai/Maharashtra specific
+    ('https://timesofindia.indiatimes.com/rssfeeds/-2128838593.cms', 'TOI Mumbai'),
+    ('https://indianexpress.com/section/cities/mumbai/feed/', 'IE Mumbai'),
+    ('https://www.thehindu.com/news/cities/mumbai/?service=rss', 'Hindu Mumbai'),
+    ('https://www.thehindu.com/news/national/maharashtra/?service=rss', 'Hindu Maharashtra'),
+    ('https://www.hindustantimes.com/feeds/rss/mumbai/rssfeed.xml', 'HT Mumbai'),
+    
+    # National feeds (contain Mumbai stories)
+    ('https://feeds.feedburner.com/ndtvnews-india-news', 'NDTV India'),
+    ('https://indianexpress.com/section/india/feed/', 'IE India'),
+    ('https://www.thehindu.com/news/national/?service=rss', 'Hindu National'),
+    ('https://timesofindia.indiatimes.com/rssfeeds/296589292.cms', 'TOI India'),
+    ('https://www.hindustantimes.com/feeds/rss/india-news/rssfeed.xml', 'HT India'),
+    
+    # Crime-specific feeds
+    ('https://www.news18.com/rss/india.xml', 'News18 India'),
+    ('https://www.dnaindia.com/feeds/india.xml', 'DNA India'),
+    ('https://www.businesstoday.in/rss/latest-news', 'Business Today'),
+    
+    # Google News RSS (crime searches)
+    ('https://news.google.com/rss/search?q=Mumbai+murder&hl=en-IN&gl=IN&ceid=IN:en', 'Google News - Murder'),
+    ('https://news.google.com/rss/search?q=Mumbai+theft+robbery&hl=en-IN&gl=IN&ceid=IN:en', 'Google News - Theft'),
+    ('https://news.google.com/rss/search?q=Mumbai+kidnapping&hl=en-IN&gl=IN&ceid=IN:en', 'Google News - Kidnapping'),
+    ('https://news.google.com/rss/search?q=Mumbai+rape+assault&hl=en-IN&gl=IN&ceid=IN:en', 'Google News - Rape'),
+    ('https://news.google.com/rss/search?q=Mumbai+crime+police&hl=en-IN&gl=IN&ceid=IN:en', 'Google News - Crime'),
+    ('https://news.google.com/rss/search?q=Mumbai+extortion&hl=en-IN&gl=IN&ceid=IN:en', 'Google News - Extortion'),
+    ('https://news.google.com/rss/search?q=Maharashtra+murder&hl=en-IN&gl=IN&ceid=IN:en', 'Google News - MH Murder'),
+    ('https://news.google.com/rss/search?q=Maharashtra+crime&hl=en-IN&gl=IN&ceid=IN:en', 'Google News - MH Crime'),
+]
+
+WEB_SOURCES = [
+    ('https://timesofindia.indiatimes.com/city/mumbai/crime', 'TOI Crime'),
+    ('https://www.mid-day.com/mumbai/mumbai-crime-news', 'Mid-Day Crime'),
+    ('https://www.hindustantimes.com/cities/mumbai-news', 'HT Mumbai'),
+    ('https://www.freepressjournal.in/mumbai', 'FPJ Mumbai'),
+]
+
+# JavaScript-heavy listings, fetched through the renderer
+DYNAMIC_SOURCES = [
+    ('https://www.news18.com/news/india/mumbai/', 'News18'),
+    ('https://www.freepressjournal.in/mumbai', 'FPJ'),
+    ('https://www.mid-day.com/mumbai/mumbai-crime-news', 'Mid-Day'),
+]
+
+SEARCH_QUERIES = [
+    'Mumbai murder case',
+    'Mumbai theft robbery',
+    'Mumbai kidnapping missing',
+    'Mumbai rape sexual assault',
+    'Mumbai extortion blackmail',
+    'Mumbai crime police arrest',
+    'Mumbai Bandra crime',
+    'Mumbai Andheri crime',
+    'Mumbai police case'
+]
+GOOGLE_NEWS_SEARCH_URL = "https://www.google.com/search?q={query}+Mumbai+crime&tbm=nws&num=20"
+
+PHASES = ['RSS', 'Web', 'Dynamic', 'Search']
+MIN_TARGET = 100   # Fallback phases only run below this many articles
+STOP_TARGET = 150  # Everything stops here
+
+
+def google_news_url(query):
+    return GOOGLE_NEWS_SEARCH_URL.format(query=query)
+
+
 class CrimeNewsScraper:
     def __init__(self):
+        init_start = time.monotonic()
         self.crime_types = {
             'murder': ['murder', 'killed', 'homicide', 'stabbed', 'shot dead', 'strangled', 'body found'],
             'theft': ['theft', 'stolen', 'burglary', 'robbery', 'loot', 'chain snatch', 'pickpocket', 'robbed'],
@@ -42,84 +115,97 @@ class CrimeNewsScraper:
             'Vasai', 'Mira Road', 'Bhayander', 'Versova', 'Jogeshwari', 'Sakinaka'
         ]
         
+        # Both keyword tables compiled into one single-pass matcher
+        self.matcher = KeywordMatcher()
+        self.matcher.add_group('crime', self.crime_types)
+        self.matcher.add_group('location', self.mumbai_areas, whole_words=True)
+        self.matcher.match('')  # compile now, before scraper threads share it
+        
         self.headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'}
         self.geolocator = Nominatim(user_agent="crimepulse_v2")
-        self.location_cache = {}
+        # Persistent across runs and shared with import_news_to_db.py
+        self.geocode_cache = GeocodeCache()
+        self.geocode = geopy_geocoder(self.geolocator)
         
-        # Setup Selenium
-        chrome_options = Options()
-        chrome_options.add_argument('--headless')
-        chrome_options.add_argument('--no-sandbox')
-        chrome_options.add_argument('--disable-dev-shm-usage')
-        chrome_options.add_argument('--disable-gpu')
-        chrome_options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64)')
+        # Conditional GETs + per-feed high-water marks, persisted between runs
+        self.fetcher = FeedFetcher(max_workers=1, timeout=15, headers=self.headers, state=SQLiteFeedState())
+        self.feed_stats = {'not_modified': 0, 'bytes_saved': 0, 'entries_skipped': 0}
+        # Fetch results whose state is saved after the output is written
+        self.feed_results = {}
         
-        print("🔧 Setting up Chrome driver...")
-        self.driver = webdriver.Chrome(
-            service=Service(ChromeDriverManager().install()),
-            options=chrome_options
+        # Page renderer for phases 3-4, created only if they run
+        # (SCRAPER_RENDERER=selenium starts headless Chrome at that point)
+        self._renderer = None
+        
+        # Sources are scraped concurrently: accepted articles, the duplicate
+        # index and the shared counters are only touched under this lock
+        self.lock = threading.Lock()
+        
+        # Accepted articles are appended to an NDJSON file as they are found
+        # (see add_article) rather than held in memory until the end
+        self.output_format = os.getenv("SCRAPER_OUTPUT_FORMAT", "ndjson")
+        self.output_path = os.path.join(os.path.dirname(__file__), 'crime_news_data.ndjson')
+        self.sink = None
+        self.carried_over = 0  # unimported articles kept from an earlier run
+        self.article_count = 0
+        self.crime_stats = {}
+        self.sources = set()
+        
+        # MinHash/LSH over title shingles: lookups only touch titles sharing a band
+        self.title_index = NearDuplicateIndex(
+            float(os.getenv("TITLE_DUPLICATE_THRESHOLD", DEFAULT_THRESHOLD))
         )
         
-        self.news_data = []
-        self.seen_titles = set()
+        # Wall times: startup, per phase, and per site as (phase, site, seconds)
+        self.timings = {'startup': time.monotonic() - init_start, 'phases': {}, 'sites': []}
+    
+    @property
+    def renderer(self):
+        with self.lock:
+            if self._renderer is None:
+                self._renderer = make_renderer(headers=self.headers)
+            return self._renderer
     
     def __del__(self):
-        """Close Selenium driver"""
+        """Close the renderer (and its browser, if one was started)"""
         try:
-            self.driver.quit()
+            if self._renderer is not None:
+                self._renderer.close()
         except:
             pass
     
     def classify_crime_type(self, text):
         """Classify crime type from text"""
-        text_lower = text.lower()
-        for crime_type, keywords in self.crime_types.items():
-            for keyword in keywords:
-                if keyword in text_lower:
-                    return crime_type
-        return None
+        return self.matcher.first(text, 'crime')
     
     def extract_location(self, text):
         """Extract Mumbai location from text"""
-        text_lower = text.lower()
-        found = [area for area in self.mumbai_areas if area.lower() in text_lower]
+        found = self.matcher.match(text)['location']
         return max(found, key=len) if found else "Mumbai"
     
     def geocode_location(self, location_name):
         """Get lat/lon coordinates"""
-        if location_name in self.location_cache:
-            return self.location_cache[location_name]
+        # Known areas come from the bundled gazetteer, without a network call
+        place = resolve_place(location_name)
+        if place:
+            return {'latitude': place['latitude'], 'longitude': place['longitude']}
         
         try:
-            time.sleep(1)
             full_location = f"{location_name}, Mumbai, Maharashtra, India"
-            location = self.geolocator.geocode(full_location, timeout=10)
+            location = self.geocode_cache.lookup(full_location, self.geocode, min_interval=1)
             
             if location:
-                coords = {'latitude': location.latitude, 'longitude': location.longitude}
-                self.location_cache[location_name] = coords
-                return coords
+                return {'latitude': location['latitude'], 'longitude': location['longitude']}
         except:
             pass
         
         # Default Mumbai coords
-        default = {'latitude': 19.0760, 'longitude': 72.8777}
-        self.location_cache[location_name] = default
-        return default
+        return {'latitude': 19.0760, 'longitude': 72.8777}
     
     def is_duplicate(self, title):
-        """Check if article is duplicate"""
-        title_normalized = re.sub(r'\W+', '', title.lower())
-        if title_normalized in self.seen_titles:
-            return True
-        
-        # Fuzzy check
-        for seen in self.seen_titles:
-            if fuzz.ratio(title_normalized, seen) > 85:
-                return True
-        
-        self.seen_titles.add(title_normalized)
-        return False
+        """Check if article is duplicate (exact or near-identical title)"""
+        with self.lock:
+            return self.title_index.is_duplicate(title)
     
     def scrape_rss_feed(self, feed_url, source_name, max_articles=50):
         """Scrape RSS feed"""
@@ -127,9 +213,20 @@ class CrimeNewsScraper:
         count = 0
         
         try:
-            feed = feedparser.parse(feed_url)
+            result = self.fetcher.fetch(feed_url)
+            if result['error']:
+                raise RuntimeError(result['error'])
+            with self.lock:
+                if result['not_modified']:
+                    self.feed_stats['not_modified'] += 1
+                    self.feed_stats['bytes_saved'] += result['bytes_saved']
+                else:
+                    self.feed_stats['entries_skipped'] += len(result['feed'].entries) - len(result['entries'])
+            if result['not_modified']:
+                print("  Unchanged since last run (304), skipped")
+                return 0
             
-            for entry in feed.entries[:max_articles]:
+            for entry in result['entries'][:max_articles]:
                 try:
                     title = entry.get('title', '')
                     if not title or self.is_duplicate(title):
@@ -140,8 +237,7 @@ class CrimeNewsScraper:
                     published = entry.get('published', datetime.now().strftime('%Y-%m-%d'))
                     
                     # Clean HTML from description
-                    if description:
-                        description = BeautifulSoup(description, 'html.parser').get_text(strip=True)
+                    description = strip_tags(description)
                     
                     full_text = f"{title} {description}"
                     crime_type = self.classify_crime_type(full_text)
@@ -150,7 +246,7 @@ class CrimeNewsScraper:
                         location = self.extract_location(full_text)
                         coords = self.geocode_location(location)
                         
-                        self.news_data.append({
+                        self.add_article({
                             'source': source_name,
                             'title': title,
                             'description': description,
@@ -169,27 +265,23 @@ class CrimeNewsScraper:
                     continue
             
             print(f"  Found {count} crime articles from {source_name}")
+            # Marked as seen only once the output is written (see run)
+            with self.lock:
+                self.feed_results[feed_url] = result
             return count
             
         except Exception as e:
             print(f"  ✗ Error: {str(e)}")
             return 0
     
-    def scrape_with_selenium(self, url, source_name, max_articles=30):
-        """Scrape using Selenium for JavaScript-heavy sites"""
-        print(f"\n🌐 Scraping {source_name} (Selenium)...")
+    def scrape_rendered(self, url, source_name, max_articles=30):
+        """Scrape a JavaScript-heavy listing page through the renderer"""
+        print(f"\n🌐 Scraping {source_name} ({self.renderer.name} renderer)...")
         count = 0
         
         try:
-            self.driver.get(url)
-            time.sleep(3)
-            
-            # Scroll to load more content
-            for _ in range(3):
-                self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                time.sleep(2)
-            
-            soup = BeautifulSoup(self.driver.page_source, 'html.parser')
+            # Returns as soon as article markup is present
+            soup = self.renderer.render(url, wait_for=ARTICLE_SELECTOR)
             
             # Try multiple selectors
             articles = (soup.find_all('article')[:max_articles] or 
@@ -222,7 +314,7 @@ class CrimeNewsScraper:
                         location = self.extract_location(full_text)
                         coords = self.geocode_location(location)
                         
-                        self.news_data.append({
+                        self.add_article({
                             'source': source_name,
                             'title': title,
                             'description': description,
@@ -254,7 +346,7 @@ class CrimeNewsScraper:
         
         try:
             response = requests.get(url, headers=self.headers, timeout=15)
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = parse_html(response.content)
             
             articles = (soup.find_all('article')[:max_articles] or 
                        soup.find_all('div', class_=re.compile('story|news|item'))[:max_articles] or
@@ -286,7 +378,7 @@ class CrimeNewsScraper:
                         location = self.extract_location(full_text)
                         coords = self.geocode_location(location)
                         
-                        self.news_data.append({
+                        self.add_article({
                             'source': source_name,
                             'title': title,
                             'description': description,
@@ -317,11 +409,7 @@ class CrimeNewsScraper:
         count = 0
         
         try:
-            search_url = f"https://www.google.com/search?q={query}+Mumbai+crime&tbm=nws&num=20"
-            self.driver.get(search_url)
-            time.sleep(2)
-            
-            soup = BeautifulSoup(self.driver.page_source, 'html.parser')
+            soup = self.renderer.render(google_news_url(query), wait_for='div.SoaBEf')
             articles = soup.find_all('div', class_='SoaBEf')[:max_results]
             
             for article in articles:
@@ -342,7 +430,7 @@ class CrimeNewsScraper:
                         location = self.extract_location(title)
                         coords = self.geocode_location(location)
                         
-                        self.news_data.append({
+                        self.add_article({
                             'source': 'Google News',
                             'title': title,
                             'description': '',
@@ -367,34 +455,127 @@ class CrimeNewsScraper:
             print(f"  ✗ Error: {str(e)}")
             return 0
     
+    def _open_sink(self):
+        """
+        Open the NDJSON output. Articles an earlier run wrote that the
+        importer has not finished with yet are kept and appended to.
+        """
+        append = os.path.exists(self.output_path) and not ImportCheckpoint(self.output_path).is_imported()
+        if append:
+            self.carried_over = sum(1 for _ in iter_ndjson_articles(self.output_path))
+            if self.carried_over:
+                print(f"  ⏩ Keeping {self.carried_over} articles not imported yet")
+        self.sink = NDJSONWriter(self.output_path, append=append)
+    
+    def add_article(self, article):
+        """Record an accepted article, flushing it to the NDJSON file at once"""
+        with self.lock:
+            if self.sink is None:
+                self._open_sink()
+            self.sink.write(article)
+            
+            self.article_count += 1
+            self.crime_stats[article['crime_type']] = self.crime_stats.get(article['crime_type'], 0) + 1
+            self.sources.add(article['source'])
+    
     def save_to_json(self, filename='crime_news_data.json'):
-        """Save data to JSON"""
-        crime_stats = {}
-        for article in self.news_data:
-            ct = article['crime_type']
-            crime_stats[ct] = crime_stats.get(ct, 0) + 1
+        """
+        Finish the output: close the NDJSON file and write its metadata
+        sidecar. With SCRAPER_OUTPUT_FORMAT=json the articles are also
+        streamed into the classic pretty-printed JSON document.
+        """
+        if self.sink is None:
+            self._open_sink()
+        self.sink.close()
         
-        output = {
-            'metadata': {
-                'scrape_date': datetime.now().isoformat(),
-                'total_articles': len(self.news_data),
-                'crime_breakdown': crime_stats,
-                'sources': list(set(a['source'] for a in self.news_data))
-            },
-            'articles': self.news_data
+        total = self.carried_over + self.article_count
+        metadata = {
+            'scrape_date': datetime.now().isoformat(),
+            'total_articles': total,
+            'carried_over': self.carried_over,
+            'crime_breakdown': self.crime_stats,
+            'sources': sorted(self.sources)
         }
+        self.sink.write_metadata(metadata)
+        filepath = self.output_path
         
-        filepath = os.path.join(os.path.dirname(__file__), filename)
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(output, f, indent=2, ensure_ascii=False)
+        if self.output_format == 'json':
+            filepath = os.path.join(os.path.dirname(__file__), filename)
+            with open(filepath, 'w', encoding='utf-8') as f:
+                metadata_json = json.dumps(metadata, indent=2, ensure_ascii=False).replace('\n', '\n  ')
+                f.write('{\n  "metadata": ' + metadata_json + ',\n  "articles": [')
+                for i, article in enumerate(iter_ndjson_articles(self.output_path)):
+                    article_json = json.dumps(article, indent=2, ensure_ascii=False).replace('\n', '\n    ')
+                    f.write((',' if i else '') + '\n    ' + article_json)
+                f.write('\n  ]\n}' if total else ']\n}')
         
-        print(f"\n💾 Saved {len(self.news_data)} articles to: {filename}")
+        print(f"\n💾 Saved {self.article_count} articles to: {os.path.basename(filepath)}"
+              + (f" ({total} in the file)" if self.carried_over else ""))
         print(f"\n📊 Crime Type Breakdown:")
-        for crime_type, count in crime_stats.items():
+        for crime_type, count in self.crime_stats.items():
             print(f"   {crime_type.upper()}: {count}")
         
         return filepath
     
+    def timed(self, phase, site, scrape, *args, **kwargs):
+        """Run one site's scrape, recording its wall time under phase"""
+        start = time.monotonic()
+        try:
+            return scrape(*args, **kwargs)
+        finally:
+            with self.lock:
+                self.timings['sites'].append((phase, site, time.monotonic() - start))
+    
+    def print_timings(self):
+        """Startup, per-phase and per-site wall times"""
+        print("⏱️  Timings:")
+        renderer = f"{self._renderer.name} renderer" if self._renderer else "no renderer needed"
+        print(f"   Startup: {self.timings['startup']:.2f}s ({renderer})")
+        if self._renderer is not None and self._renderer.startup_seconds:
+            print(f"   Browser startup: {self._renderer.startup_seconds:.2f}s")
+        for phase, elapsed in self.timings['phases'].items():
+            sites = [(site, seconds) for p, site, seconds in self.timings['sites'] if p == phase]
+            print(f"   {phase}: {elapsed:.2f}s over {len(sites)} site(s)")
+            for site, seconds in sorted(sites, key=lambda item: -item[1]):
+                print(f"      {seconds:6.2f}s  {site}")
+    
+    def build_jobs(self):
+        """
+        Every source as a scheduler job, in the old phase order. RSS feeds
+        run until STOP_TARGET articles; the other phases are fallbacks and
+        are skipped once MIN_TARGET is reached (see run_jobs).
+        """
+        jobs = []
+        for url, name in RSS_FEEDS:
+            jobs.append(job('RSS', name, url, partial(
+                self.timed, 'RSS', name, self.scrape_rss_feed, url, name, max_articles=100
+            ), skip_at=STOP_TARGET))
+        for url, name in WEB_SOURCES:
+            jobs.append(job('Web', name, url, partial(
+                self.timed, 'Web', name, self.scrape_with_beautifulsoup, url, name, max_articles=50
+            ), skip_at=MIN_TARGET))
+        for url, name in DYNAMIC_SOURCES:
+            jobs.append(job('Dynamic', name, url, partial(
+                self.timed, 'Dynamic', name, self.scrape_rendered, url, name, max_articles=50
+            ), skip_at=MIN_TARGET))
+        for query in SEARCH_QUERIES:
+            jobs.append(job('Search', query, google_news_url(query), partial(
+                self.timed, 'Search', query, self.scrape_google_news_search, query, max_results=30
+            ), skip_at=MIN_TARGET))
+        return jobs
+    
+    def run_jobs(self, scheduler):
+        """
+        Run the RSS jobs, then the fallback phases only once every feed has
+        finished: started alongside the feeds, fallbacks would be fetched
+        (and the renderer started) before the feeds could reach MIN_TARGET.
+        Returns the scheduler results for every job.
+        """
+        jobs = self.build_jobs()
+        results = scheduler.run([j for j in jobs if j['phase'] == 'RSS'])
+        # At MIN_TARGET every fallback is skipped without a request
+        return results + scheduler.run([j for j in jobs if j['phase'] != 'RSS'])
+    
     def run(self):
         """Main scraping process"""
         print("=" * 80)
@@ -403,125 +584,51 @@ class CrimeNewsScraper:
         
         start_time = time.time()
         
-        # 1. RSS FEEDS (Most reliable)
-        print("\n📡 Phase 1: RSS Feeds (Comprehensive)")
-        
-        # Main news RSS feeds
-        main_rss_feeds = [
-            # Mumbai/Maharashtra specific
-            ('https://timesofindia.indiatimes.com/rssfeeds/-2128838593.cms', 'TOI Mumbai'),
-            ('https://indianexpress.com/section/cities/mumbai/feed/', 'IE Mumbai'),
-            ('https://www.thehindu.com/news/cities/mumbai/?service=rss', 'Hindu Mumbai'),
-            ('https://www.thehindu.com/news/national/maharashtra/?service=rss', 'Hindu Maharashtra'),
-            ('https://www.hindustantimes.com/feeds/rss/mumbai/rssfeed.xml', 'HT Mumbai'),
-            
-            # National feeds (contain Mumbai stories)
-            ('https://feeds.feedburner.com/ndtvnews-india-news', 'NDTV India'),
-            ('https://indianexpress.com/section/india/feed/', 'IE India'),
-            ('https://www.thehindu.com/news/national/?service=rss', 'Hindu National'),
-            ('https://timesofindia.indiatimes.com/rssfeeds/296589292.cms', 'TOI India'),
-            ('https://www.hindustantimes.com/feeds/rss/india-news/rssfeed.xml', 'HT India'),
-            
-            # Crime-specific feeds
-            ('https://www.news18.com/rss/india.xml', 'News18 India'),
-            ('https://www.dnaindia.com/feeds/india.xml', 'DNA India'),
-            ('https://www.businesstoday.in/rss/latest-news', 'Business Today'),
-            
-            # Google News RSS (crime searches)
-            ('https://news.google.com/rss/search?q=Mumbai+murder&hl=en-IN&gl=IN&ceid=IN:en', 'Google News - Murder'),
-            ('https://news.google.com/rss/search?q=Mumbai+theft+robbery&hl=en-IN&gl=IN&ceid=IN:en', 'Google News - Theft'),
-            ('https://news.google.com/rss/search?q=Mumbai+kidnapping&hl=en-IN&gl=IN&ceid=IN:en', 'Google News - Kidnapping'),
-            ('https://news.google.com/rss/search?q=Mumbai+rape+assault&hl=en-IN&gl=IN&ceid=IN:en', 'Google News - Rape'),
-            ('https://news.google.com/rss/search?q=Mumbai+crime+police&hl=en-IN&gl=IN&ceid=IN:en', 'Google News - Crime'),
-            ('https://news.google.com/rss/search?q=Mumbai+extortion&hl=en-IN&gl=IN&ceid=IN:en', 'Google News - Extortion'),
-            ('https://news.google.com/rss/search?q=Maharashtra+murder&hl=en-IN&gl=IN&ceid=IN:en', 'Google News - MH Murder'),
-            ('https://news.google.com/rss/search?q=Maharashtra+crime&hl=en-IN&gl=IN&ceid=IN:en', 'Google News - MH Crime'),
-        ]
-        
-        for feed_url, source_name in main_rss_feeds:
-            try:
-                self.scrape_rss_feed(feed_url, source_name, max_articles=100)
-                time.sleep(1)
-                print(f"  📊 Total so far: {len(self.news_data)} articles")
-                
-                # Stop early if we have enough
-                if len(self.news_data) >= 150:
-                    print(f"  🎉 Reached 150 articles, moving to next phase...")
-                    break
-            except Exception as e:
-                print(f"  ✗ Failed {source_name}: {str(e)[:100]}")
+        # The feeds, then any fallback phases, run concurrently; each domain
+        # is fetched one request at a time with a pause between requests
+        # (SCRAPER_WORKERS=1 runs in order)
+        scheduler = ScrapeScheduler(
+            progress=lambda: self.article_count,
+            stop_at=STOP_TARGET,
+            max_workers=int(os.getenv('SCRAPER_WORKERS', 8)),
+            domain_interval=float(os.getenv('SCRAPER_DOMAIN_INTERVAL', 2))
+        )
+        print(f"\n📡 Scraping RSS feeds, then web pages, dynamic pages and Google News "
+              f"below {MIN_TARGET} articles ({scheduler.max_workers} workers)")
+        results = self.run_jobs(scheduler)
         
-        # 2. BEAUTIFULSOUP SCRAPING with better selectors
-        if len(self.news_data) < 100:
-            print("\n📰 Phase 2: Web Scraping with BeautifulSoup")
-            web_sources = [
-                ('https://timesofindia.indiatimes.com/city/mumbai/crime', 'TOI Crime'),
-                ('https://www.mid-day.com/mumbai/mumbai-crime-news', 'Mid-Day Crime'),
-                ('https://www.hindustantimes.com/cities/mumbai-news', 'HT Mumbai'),
-                ('https://www.freepressjournal.in/mumbai', 'FPJ Mumbai'),
-            ]
-            
-            for url, name in web_sources:
-                try:
-                    self.scrape_with_beautifulsoup(url, name, max_articles=50)
-                    time.sleep(2)
-                    print(f"  Total so far: {len(self.news_data)} articles")
-                except Exception as e:
-                    print(f"  ✗ Failed {name}: {str(e)}")
+        for phase in PHASES:
+            ran = [r for r in results if r['phase'] == phase and r['start'] is not None]
+            if ran:
+                self.timings['phases'][phase] = max(r['end'] for r in ran) - min(r['start'] for r in ran)
+        outcomes = {}
+        for result in results:
+            outcomes[result['status']] = outcomes.get(result['status'], 0) + 1
+            if result['status'] == 'failed':
+                print(f"  ✗ Failed {result['name']}: {result['error'][:100]}")
+        print(f"\n📋 Sources: " + ", ".join(f"{count} {status}" for status, count in outcomes.items()))
         
-        # 3. SELENIUM for dynamic content
-        if len(self.news_data) < 100:
-            print("\n🌐 Phase 3: Selenium Dynamic Scraping")
-            selenium_sources = [
-                ('https://www.news18.com/news/india/mumbai/', 'News18'),
-                ('https://www.freepressjournal.in/mumbai', 'FPJ'),
-                ('https://www.mid-day.com/mumbai/mumbai-crime-news', 'Mid-Day'),
-            ]
-            
-            for url, name in selenium_sources:
-                try:
-                    self.scrape_with_selenium(url, name, max_articles=50)
-                    time.sleep(2)
-                    print(f"  Total so far: {len(self.news_data)} articles")
-                except Exception as e:
-                    print(f"  ✗ Failed {name}: {str(e)}")
-        
-        # 4. GOOGLE NEWS searches for each crime type
-        if len(self.news_data) < 100:
-            print("\n🔍 Phase 4: Google News Search (Comprehensive)")
-            crime_queries = [
-                'Mumbai murder case',
-                'Mumbai theft robbery',
-                'Mumbai kidnapping missing',
-                'Mumbai rape sexual assault',
-                'Mumbai extortion blackmail',
-                'Mumbai crime police arrest',
-                'Mumbai Bandra crime',
-                'Mumbai Andheri crime',
-                'Mumbai police case'
-            ]
-            
-            for query in crime_queries:
-                try:
-                    self.scrape_google_news_search(query, max_results=30)
-                    time.sleep(3)
-                    print(f"  Total so far: {len(self.news_data)} articles")
-                    if len(self.news_data) >= 150:
-                        break
-                except Exception as e:
-                    print(f"  ✗ Failed search '{query}': {str(e)}")
+        stats = self.feed_stats
+        print(f"💾 Feed cache: {stats['not_modified']} unchanged (304), "
+              f"{stats['bytes_saved'] / 1024:.0f} KB and {stats['not_modified']} parses saved, "
+              f"{stats['entries_skipped']} already-seen entries skipped")
         
-        # Save results
+        # Save results, then advance the feeds' high-water marks: entries
+        # are only skipped next time once they are safely on disk
         filepath = self.save_to_json()
+        self.fetcher.save_state(self.feed_results)
         
         elapsed = time.time() - start_time
         print(f"\n✅ Scraping completed in {elapsed:.2f} seconds")
-        print(f"📈 Total unique articles collected: {len(self.news_data)}")
+        print(f"📈 Total unique articles collected: {self.article_count}")
+        geo = self.geocode_cache.stats
+        print(f"🗺️  Geocode cache: {geo['hits']} hits, {geo['misses']} misses, {geo['calls']} geocoder calls")
+        self.print_timings()
         
-        if len(self.news_data) >= 100:
+        if self.article_count >= 100:
             print("🎉 SUCCESS: Reached target of 100+ articles!")
         else:
-            print(f"⚠️  Note: Collected {len(self.news_data)} articles (target was 100+)")
+            print(f"⚠️  Note: Collected {self.article_count} articles (target was 100+)")
             print("   Tip: RSS feeds only have recent articles. For historical data,")
             print("   consider running this script multiple times over several days.")
         
@@ -0,0 +1,153 @@
+"""
+Page Renderers
+Turn a URL into parsed HTML for the scraper's dynamic-page phases.
+HttpRenderer (the default) fetches pages over plain HTTP and is safe to
+share between scraper threads; SeleniumRenderer drives one headless Chrome,
+started on first use, and waits for explicit conditions instead of fixed
+sleeps.
+
+Choose with SCRAPER_RENDERER=http|selenium.
+"""
+
+import os
+import threading
+import time
+import requests
+from requests.adapters import HTTPAdapter
+from html_parsing import parse_html
+
+try:
+    from selenium import webdriver
+    from selenium.common.exceptions import TimeoutException
+    from selenium.webdriver.chrome.options import Options
+    from selenium.webdriver.chrome.service import Service
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support import expected_conditions
+    from selenium.webdriver.support.ui import WebDriverWait
+    from webdriver_manager.chrome import ChromeDriverManager
+except ImportError:  # Only SeleniumRenderer needs these
+    webdriver = None
+
+DEFAULT_HEADERS = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64)'}
+# Elements that mark a news listing as rendered
+ARTICLE_SELECTOR = ('article, div[class*="article"], div[class*="story"], '
+                    'div[class*="news-item"], div[class*="card"]')
+
+
+class HttpRenderer:
+    """Plain HTTP: the HTML as served, without running any JavaScript"""
+
+    name = 'http'
+
+    def __init__(self, headers=None, timeout=15, pool_size=8):
+        self.headers = headers or DEFAULT_HEADERS
+        self.timeout = timeout
+        self.startup_seconds = 0.0
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+    def render(self, url, wait_for=None):
+        """
+        Parsed page. Static HTML cannot be waited on: if wait_for (a CSS
+        selector) is absent the page needs JavaScript and TimeoutError is raised.
+        """
+        response = self.session.get(url, headers=self.headers, timeout=self.timeout)
+        response.raise_for_status()
+        soup = parse_html(response.content)
+        if wait_for and soup.select_one(wait_for) is None:
+            raise TimeoutError(f"'{wait_for}' not in the static HTML (page needs JavaScript?)")
+        return soup
+
+    def close(self):
+        self.session.close()
+
+
+class SeleniumRenderer:
+    """Headless Chrome, launched on the first render()"""
+
+    name = 'selenium'
+
+    def __init__(self, headers=None, timeout=10, scrolls=3, scroll_timeout=2):
+        """
+        timeout bounds the wait for wait_for; each of up to `scrolls` scrolls
+        waits at most scroll_timeout seconds for the page to grow
+        """
+        if webdriver is None:
+            raise ImportError("SeleniumRenderer needs selenium and webdriver-manager installed")
+        self.user_agent = (headers or DEFAULT_HEADERS)['User-Agent']
+        self.timeout = timeout
+        self.scrolls = scrolls
+        self.scroll_timeout = scroll_timeout
+        self.startup_seconds = 0.0
+        self._driver = None
+        # One browser: concurrent callers take turns
+        self._lock = threading.Lock()
+
+    @property
+    def driver(self):
+        if self._driver is None:
+            options = Options()
+            options.add_argument('--headless')
+            options.add_argument('--no-sandbox')
+            options.add_argument('--disable-dev-shm-usage')
+            options.add_argument('--disable-gpu')
+            options.add_argument(f'--user-agent={self.user_agent}')
+
+            print("🔧 Setting up Chrome driver...")
+            start = time.monotonic()
+            self._driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=options)
+            self.startup_seconds = time.monotonic() - start
+            print(f"  Chrome ready in {self.startup_seconds:.1f}s")
+        return self._driver
+
+    def _page_height(self, driver):
+        return driver.execute_script("return document.body.scrollHeight")
+
+    def render(self, url, wait_for=None):
+        """Parsed page once wait_for (a CSS selector) is present, after lazy-load scrolling"""
+        with self._lock:
+            return self._render(url, wait_for)
+
+    def _render(self, url, wait_for):
+        driver = self.driver
+        driver.get(url)
+        try:
+            if wait_for:
+                WebDriverWait(driver, self.timeout).until(
+                    expected_conditions.presence_of_element_located((By.CSS_SELECTOR, wait_for))
+                )
+            else:
+                WebDriverWait(driver, self.timeout).until(
+                    lambda d: d.execute_script("return document.readyState") == 'complete'
+                )
+        except TimeoutException:
+            raise TimeoutError(f"'{wait_for or 'page load'}' not ready after {self.timeout}s")
+
+        # Scroll to trigger lazy loading, waiting only as long as the page keeps growing
+        for _ in range(self.scrolls):
+            height = self._page_height(driver)
+            driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+            try:
+                WebDriverWait(driver, self.scroll_timeout).until(lambda d: self._page_height(d) > height)
+            except TimeoutException:
+                break
+
+        return parse_html(driver.page_source)
+
+    def close(self):
+        if self._driver is not None:
+            self._driver.quit()
+            self._driver = None
+
+
+RENDERERS = {'http': HttpRenderer, 'selenium': SeleniumRenderer}
+
+
+def make_renderer(name=None, headers=None):
+    """Renderer by name (default: SCRAPER_RENDERER, else 'http')"""
+    name = name or os.getenv('SCRAPER_RENDERER', 'http')
+    if name not in RENDERERS:
+        raise ValueError(f"Unknown renderer '{name}' (choose from {', '.join(RENDERERS)})")
+    return RENDERERS[name](headers=headers)
@@ -0,0 +1,110 @@
+"""
+Response Cache
+In-process LRU cache for computed API responses, with a TTL and a data
+version: writers bump the version whenever crime_news receives new
+documents, and cached entries from an older version are never served
+"""
+
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+
+VERSIONS_COLLECTION = 'data_versions'
+DEFAULT_TTL_SECONDS = int(os.getenv('RESPONSE_CACHE_TTL', 300))
+DEFAULT_MAX_ENTRIES = int(os.getenv('RESPONSE_CACHE_SIZE', 256))
+VERSION_CHECK_SECONDS = float(os.getenv('DATA_VERSION_CHECK_SECONDS', 5))
+
+
+def bump_data_version(collection):
+    """Record that collection received new documents (call after inserts)"""
+    collection.database[VERSIONS_COLLECTION].update_one(
+        {'_id': collection.name},
+        {'$inc': {'version': 1}, '$currentDate': {'updated_at': True}},
+        upsert=True
+    )
+
+
+def etag_for(body):
+    """Strong ETag for a response body"""
+    return hashlib.blake2b(body, digest_size=16).hexdigest()
+
+
+class DataVersion:
+    """
+    Current data version of a collection, read from data_versions at most
+    once every check_interval seconds so cache hits stay cheap.
+    The version is (stored version, local generation): invalidate() moves
+    it on at once when this process learns of new data some other way
+    (e.g. a change stream), before the writer has bumped data_versions.
+    """
+
+    def __init__(self, collection, check_interval=VERSION_CHECK_SECONDS):
+        self.collection = collection
+        self.check_interval = check_interval
+        self._version = None
+        self._generation = 0
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+
+    def current(self, refresh=False):
+        """The version; refresh=True re-reads data_versions regardless of check_interval"""
+        with self._lock:
+            now = time.monotonic()
+            if refresh or self._version is None or now - self._checked_at >= self.check_interval:
+                doc = self.collection.database[VERSIONS_COLLECTION].find_one({'_id': self.collection.name})
+                self._version = doc.get('version', 0) if doc else 0
+                self._checked_at = now
+            return (self._version, self._generation)
+
+    def invalidate(self, *args):
+        """Treat everything cached so far as stale (usable as an event callback)"""
+        with self._lock:
+            self._generation += 1
+
+
+class ResponseCache:
+    """
+    Thread-safe LRU of response bodies keyed by endpoint and parameters.
+    An entry is a miss once it is older than ttl seconds or was stored for
+    a different data version.
+    """
+
+    def __init__(self, max_entries=DEFAULT_MAX_ENTRIES, ttl=DEFAULT_TTL_SECONDS):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries = OrderedDict()  # key -> (version, stored_at, body, etag)
+        self._lock = threading.Lock()
+        self.stats = {'hits': 0, 'misses': 0, 'evictions': 0}
+
+    def get(self, key, version):
+        """(body, etag) for a fresh entry of this version, or None"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] != version or time.monotonic() - entry[1] > self.ttl:
+                if entry is not None:
+                    del self._entries[key]
+                self.stats['misses'] += 1
+                return None
+            self._entries.move_to_end(key)
+            self.stats['hits'] += 1
+            return entry[2], entry[3]
+
+    def put(self, key, version, body):
+        """Store a body; returns its ETag"""
+        etag = etag_for(body)
+        with self._lock:
+            self._entries[key] = (version, time.monotonic(), body, etag)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.stats['evictions'] += 1
+        return etag
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
@@ -0,0 +1,185 @@
+"""
+Run Metrics
+Stage timers and counters for the ingestion jobs (auto_scraper, the news
+importer), broken down per source, written at the end of a run as a JSON
+report and optionally in Prometheus text format (for node_exporter's
+textfile collector or a Pushgateway).
+
+    metrics = RunMetrics('auto_scraper')
+    with metrics.timer('geocode', source=feed_url):
+        ...
+    metrics.count('inserted', source=feed_url)
+    metrics.finish()
+
+Stages run concurrently (feed downloads, image lookups) record each
+source's own time, so a stage total can exceed the run's wall time.
+
+RUN_REPORT_DIR: directory for <job>_run_report.json (default: current directory)
+RUN_METRICS_PROMETHEUS_DIR: also write <job>.prom (Prometheus text) there
+"""
+
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+RUN_REPORT_DIR = os.getenv('RUN_REPORT_DIR', '.')
+RUN_METRICS_PROMETHEUS_DIR = os.getenv('RUN_METRICS_PROMETHEUS_DIR')
+
+
+def escape_label(value):
+    """Prometheus label value escaping"""
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def prometheus_sample(name, labels, value):
+    """One exposition-format line: name{label="value",...} value"""
+    if labels:
+        pairs = ','.join(f'{key}="{escape_label(label)}"' for key, label in labels.items())
+        return f"{name}{{{pairs}}} {value}"
+    return f"{name} {value}"
+
+
+class RunMetrics:
+    def __init__(self, job):
+        self.job = job
+        self.started_at = datetime.now()
+        self.status = 'running'
+        self._start = time.monotonic()
+        self.duration = None
+        self.timings = {}   # (stage, source) -> [seconds, calls]
+        self.counters = {}  # (name, source) -> value
+        self._lock = threading.Lock()
+
+    def add_time(self, stage, seconds, source=None):
+        """Record time measured elsewhere (e.g. a feed's download time)"""
+        with self._lock:
+            timing = self.timings.setdefault((stage, source), [0.0, 0])
+            timing[0] += seconds
+            timing[1] += 1
+
+    @contextmanager
+    def timer(self, stage, source=None):
+        """Time the with-block under stage (and source); exceptions still count"""
+        start = time.monotonic()
+        try:
+            yield
+        finally:
+            self.add_time(stage, time.monotonic() - start, source)
+
+    def timed_iter(self, stage, iterable, source=None):
+        """Yield from iterable, recording the time spent producing each item"""
+        iterator = iter(iterable)
+        while True:
+            start = time.monotonic()
+            try:
+                item = next(iterator)
+            except StopIteration:
+                return
+            finally:
+                self.add_time(stage, time.monotonic() - start, source)
+            yield item
+
+    def count(self, name, value=1, source=None):
+        with self._lock:
+            key = (name, source)
+            self.counters[key] = self.counters.get(key, 0) + value
+
+    def finish(self, status='ok'):
+        """Stop the run clock, then write the JSON report (and Prometheus text if configured)"""
+        self.status = status
+        self.duration = time.monotonic() - self._start
+        paths = [self.write_json()]
+        if RUN_METRICS_PROMETHEUS_DIR:
+            paths.append(self.write_prometheus(os.path.join(RUN_METRICS_PROMETHEUS_DIR, f"{self.job}.prom")))
+        self.print_summary()
+        print(f"📝 Run report: {', '.join(paths)}")
+        return paths
+
+    def report(self):
+        """The run as a JSON-serialisable dict"""
+        duration = self.duration if self.duration is not None else time.monotonic() - self._start
+        stages = {}
+        for (stage, source), (seconds, calls) in sorted(self.timings.items(), key=lambda item: str(item[0])):
+            entry = stages.setdefault(stage, {'seconds': 0.0, 'calls': 0, 'sources': {}})
+            entry['seconds'] += seconds
+            entry['calls'] += calls
+            if source is not None:
+                entry['sources'][source] = {'seconds': round(seconds, 4), 'calls': calls}
+        for entry in stages.values():
+            entry['seconds'] = round(entry['seconds'], 4)
+
+        counters = {}
+        for (name, source), value in sorted(self.counters.items(), key=lambda item: str(item[0])):
+            entry = counters.setdefault(name, {'total': 0, 'sources': {}})
+            entry['total'] += value
+            if source is not None:
+                entry['sources'][source] = value
+
+        return {
+            'job': self.job,
+            'status': self.status,
+            'started_at': self.started_at.isoformat(),
+            'duration_seconds': round(duration, 4),
+            'stages': stages,
+            'counters': counters
+        }
+
+    def prometheus(self):
+        """The run in Prometheus text exposition format"""
+        report = self.report()
+        job = {'job': self.job}
+        lines = [
+            '# HELP ingestion_run_duration_seconds Wall time of the last run.',
+            '# TYPE ingestion_run_duration_seconds gauge',
+            prometheus_sample('ingestion_run_duration_seconds', job, report['duration_seconds']),
+            '# HELP ingestion_run_success Whether the last run finished normally.',
+            '# TYPE ingestion_run_success gauge',
+            prometheus_sample('ingestion_run_success', job, 1 if self.status == 'ok' else 0),
+            '# HELP ingestion_run_started_timestamp_seconds Start time of the last run.',
+            '# TYPE ingestion_run_started_timestamp_seconds gauge',
+            prometheus_sample('ingestion_run_started_timestamp_seconds', job, self.started_at.timestamp()),
+            '# HELP ingestion_stage_seconds Time spent per stage and source in the last run.',
+            '# TYPE ingestion_stage_seconds gauge'
+        ]
+        for (stage, source), (seconds, _) in sorted(self.timings.items(), key=lambda item: str(item[0])):
+            lines.append(prometheus_sample('ingestion_stage_seconds',
+                                           dict(job, stage=stage, source=source or ''), seconds))
+        lines += ['# HELP ingestion_stage_calls Timed calls per stage and source in the last run.',
+                  '# TYPE ingestion_stage_calls gauge']
+        for (stage, source), (_, calls) in sorted(self.timings.items(), key=lambda item: str(item[0])):
+            lines.append(prometheus_sample('ingestion_stage_calls',
+                                           dict(job, stage=stage, source=source or ''), calls))
+        lines += ['# HELP ingestion_items Counters per source in the last run.',
+                  '# TYPE ingestion_items gauge']
+        for (name, source), value in sorted(self.counters.items(), key=lambda item: str(item[0])):
+            lines.append(prometheus_sample('ingestion_items',
+                                           dict(job, name=name, source=source or ''), value))
+        return '\n'.join(lines) + '\n'
+
+    def _write(self, path, text):
+        # Write then rename, so a collector never reads half a file
+        temp_path = f"{path}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            f.write(text)
+        os.replace(temp_path, path)
+        return path
+
+    def write_json(self, path=None):
+        path = path or os.path.join(RUN_REPORT_DIR, f"{self.job}_run_report.json")
+        return self._write(path, json.dumps(self.report(), indent=2, ensure_ascii=False))
+
+    def write_prometheus(self, path):
+        return self._write(path, self.prometheus())
+
+    def print_summary(self, top_sources=3):
+        """Stages by total time, with their slowest sources"""
+        report = self.report()
+        print(f"\n⏱️  {self.job}: {report['duration_seconds']:.1f}s ({self.status})")
+        for stage, entry in sorted(report['stages'].items(), key=lambda item: item[1]['seconds'], reverse=True):
+            print(f"  {stage:10s} {entry['seconds']:8.2f}s  {entry['calls']:5d} calls")
+            slowest = sorted(entry['sources'].items(), key=lambda item: item[1]['seconds'], reverse=True)
+            for source, timing in slowest[:top_sources]:
+                print(f"    {timing['seconds']:8.2f}s  {source}")
@@ -1,13 +1,23 @@
-from flask import Flask, jsonify, request
+from flask import Flask, jsonify, request, Response, stream_with_context
 from flask_cors import CORS
 from flask_bcrypt import Bcrypt
 from flask_jwt_extended import JWTManager, create_access_token, jwt_required, get_jwt_identity
 import pymongo
+from bson import ObjectId
 import urllib.parse
+import math
 import os
+import atexit
+import queue
+from functools import wraps
 from dotenv import load_dotenv
 from datetime import datetime, timedelta
-from crime_analytics import CrimeAnalytics
+from crime_analytics import CrimeAnalytics, stats_pipeline
+from crime_geo import CLUSTER_MAX_ZOOM, bbox_filter, cluster_pipeline
+from db_schema import STATS_INDEX, ensure_indexes, has_index
+from response_cache import DataVersion, ResponseCache
+from crime_events import CrimeEventBroadcaster
+from server_metrics import MongoCommandMetrics, ServerMetrics, instrument_app
 
 # Load environment variables
 load_dotenv()
@@ -22,16 +32,89 @@ app.config['JWT_ACCESS_TOKEN_EXPIRES'] = timedelta(hours=24)
 bcrypt = Bcrypt(app)
 jwt = JWTManager(app)
 
+# Request latency/size/status and Mongo command timings, served on /metrics
+server_metrics = ServerMetrics()
+instrument_app(app, server_metrics)
+
 # MongoDB connection
 MONGODB_URI = os.getenv("MONGO_URI")
 if not MONGODB_URI:
     raise ValueError("MONGO_URI not found in environment variables")
 
-client = pymongo.MongoClient(MONGODB_URI)
+# One pooled client per process, shared by every request thread
+client = pymongo.MongoClient(
+    MONGODB_URI,
+    maxPoolSize=int(os.getenv('MONGO_MAX_POOL_SIZE', 50)),
+    minPoolSize=int(os.getenv('MONGO_MIN_POOL_SIZE', 0)),
+    maxIdleTimeMS=int(os.getenv('MONGO_MAX_IDLE_TIME_MS', 300000)),
+    event_listeners=[MongoCommandMetrics(server_metrics)]
+)
 db = client["fir_data"]
 collection = db["firs"]
 crime_news_collection = db["crime_news"]
 users_collection = db["users"]
+ensure_indexes(db)
+# A hint on a missing index fails the query, so /api/stats only hints when it exists
+stats_index_ready = has_index(crime_news_collection, STATS_INDEX)
+
+# Application-scoped analytics service reusing the pooled client
+analytics = CrimeAnalytics(client=client)
+atexit.register(client.close)
+
+# Analytics responses are cached until the TTL passes or crime_news gets new
+# documents (the scraper and importer bump its data version)
+analytics_cache = ResponseCache()
+crime_news_version = DataVersion(crime_news_collection)
+
+# Fields served by /api/crime-data (also the allowed values for ?fields=)
+CRIME_DATA_FIELDS = [
+    'latitude', 'longitude', 'crime_type', 'severity_level', 'location',
+    'incident_date', 'fir_number', 'title', 'description', 'image_url',
+    'source', 'news_url'
+]
+DEFAULT_PAGE_SIZE = 500
+MAX_PAGE_SIZE = 1000
+MAX_BBOX_POINTS = 2000
+
+# Push channel for newly inserted crimes (see /api/crime-data/stream)
+# Pushed inserts also invalidate the analytics cache, so the refresh a
+# client makes after an event never gets the pre-insert body
+crime_events = CrimeEventBroadcaster(crime_news_collection, CRIME_DATA_FIELDS + ['created_at'],
+                                     on_insert=crime_news_version.invalidate)
+SSE_HEARTBEAT_SECONDS = 15
+SSE_RETRY_MS = 10000
+
+def cached_analytics(view):
+    """
+    Serve a view from analytics_cache, keyed by path and query parameters.
+    Successful responses carry an ETag, so browsers revalidate with
+    If-None-Match and get a 304 while the data is unchanged. A request
+    with Cache-Control: no-cache re-reads the data version first, so it
+    sees writes made within the last DATA_VERSION_CHECK_SECONDS.
+    """
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        key = (request.path, tuple(sorted(request.args.items(multi=True))))
+        revalidate = 'no-cache' in request.headers.get('Cache-Control', '')
+        version = crime_news_version.current(refresh=revalidate)
+        
+        cached = analytics_cache.get(key, version)
+        if cached:
+            body, etag = cached
+            response = Response(body, mimetype='application/json')
+            response.headers['X-Cache'] = 'HIT'
+        else:
+            response = app.make_response(view(*args, **kwargs))
+            if response.status_code != 200:
+                return response
+            etag = analytics_cache.put(key, version, response.get_data())
+            response.headers['X-Cache'] = 'MISS'
+        
+        response.set_etag(etag)
+        response.headers['Cache-Control'] = 'no-cache'
+        return response.make_conditional(request)
+    
+    return wrapper
 
 # Authentication Routes
 @app.route('/api/auth/register', methods=['POST'])
@@ -175,30 +258,167 @@ def get_current_user():
             'error': str(e)
         }), 500
 
+def parse_crime_cursor(after):
+    """Turn an ?after= value (ObjectId hex or ISO timestamp) into an ObjectId"""
+    if ObjectId.is_valid(after):
+        return ObjectId(after)
+    # ObjectIds embed their creation time, so a timestamp maps onto the _id order
+    return ObjectId.from_datetime(datetime.fromisoformat(after.replace('Z', '+00:00')))
+
 @app.route('/api/crime-data', methods=['GET'])
 def get_crime_data():
+    """
+    Crime news for the map. Unpaginated responses carry last_id, the newest
+    id returned, for resuming /api/crime-data/stream from.
+    Optional: ?limit=&after= for cursor pagination (ordered by _id),
+    ?fields=a,b to project a subset, ?format=ndjson to stream one document per line
+    """
     try:
-        # Fetch all crime news data with images and coordinates
-        crimes = list(crime_news_collection.find({}, {
-            'latitude': 1,
-            'longitude': 1,
-            'crime_type': 1,
-            'severity_level': 1,
-            'location': 1,
-            'incident_date': 1,
-            'fir_number': 1,
-            'title': 1,
-            'description': 1,
-            'image_url': 1,
-            'source': 1,
-            'news_url': 1,
-            '_id': 0
-        }))
+        after = request.args.get('after')
+        limit = request.args.get('limit')
+        fields = request.args.get('fields')
+        stream = request.args.get('format') == 'ndjson'
+        
+        projection = CRIME_DATA_FIELDS
+        if fields:
+            projection = [f.strip() for f in fields.split(',') if f.strip()]
+            unknown = [f for f in projection if f not in CRIME_DATA_FIELDS]
+            if unknown:
+                return jsonify({
+                    'success': False,
+                    'error': f"Unknown field(s): {', '.join(unknown)}"
+                }), 400
         
-        return jsonify({
+        query = {}
+        if after:
+            try:
+                query = {'_id': {'$gt': parse_crime_cursor(after)}}
+            except ValueError:
+                return jsonify({
+                    'success': False,
+                    'error': 'Invalid cursor. Use an id from next_after or an ISO timestamp.'
+                }), 400
+        
+        paginated = bool(after or limit)
+        if paginated:
+            try:
+                limit = min(max(int(limit or DEFAULT_PAGE_SIZE), 1), MAX_PAGE_SIZE)
+            except ValueError:
+                return jsonify({
+                    'success': False,
+                    'error': 'limit must be an integer'
+                }), 400
+        
+        cursor = crime_news_collection.find(query, {field: 1 for field in projection})
+        if paginated or stream:
+            cursor = cursor.sort('_id', 1)
+        if paginated:
+            cursor = cursor.limit(limit)
+        
+        if stream:
+            def generate():
+                # Yield straight from the cursor; each line carries its id for resuming
+                for crime in cursor.batch_size(DEFAULT_PAGE_SIZE):
+                    crime['id'] = str(crime.pop('_id'))
+                    yield app.json.dumps(crime) + '\n'
+            
+            return Response(stream_with_context(generate()), mimetype='application/x-ndjson')
+        
+        crimes = []
+        last_id = newest_id = None
+        for crime in cursor:
+            last_id = crime.pop('_id')
+            newest_id = last_id if newest_id is None else max(newest_id, last_id)
+            crimes.append(crime)
+        
+        response = {
             'success': True,
             'data': crimes,
             'count': len(crimes)
+        }
+        if paginated:
+            # A short page means the end of the collection was reached
+            response['next_after'] = str(last_id) if len(crimes) == limit else None
+        else:
+            response['last_id'] = str(newest_id) if newest_id is not None else None
+        
+        return jsonify(response)
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+def parse_bbox(args):
+    """
+    Viewport query from minLat, minLon, maxLat and maxLon arguments, clamped
+    to valid coordinates. Raises ValueError with a message for the client.
+    """
+    try:
+        min_lat = float(args['minLat'])
+        min_lon = float(args['minLon'])
+        max_lat = float(args['maxLat'])
+        max_lon = float(args['maxLon'])
+    except (KeyError, ValueError):
+        raise ValueError('minLat, minLon, maxLat and maxLon are required numbers')
+    # NaN would slip through the clamps below (max(nan, -90) is nan)
+    if not all(math.isfinite(value) for value in (min_lat, min_lon, max_lat, max_lon)):
+        raise ValueError('minLat, minLon, maxLat and maxLon must be finite numbers')
+    
+    min_lat, max_lat = max(min_lat, -90.0), min(max_lat, 90.0)
+    min_lon, max_lon = max(min_lon, -180.0), min(max_lon, 180.0)
+    if min_lat >= max_lat or min_lon == max_lon:
+        raise ValueError('Empty bounding box')
+    
+    return bbox_filter(min_lat, min_lon, max_lat, max_lon)
+
+@app.route('/api/crime-data/bbox', methods=['GET'])
+def get_crime_data_bbox():
+    """
+    Crimes inside the visible map viewport.
+    Low zoom levels get server-side clusters, higher ones get raw points
+    """
+    try:
+        try:
+            query = parse_bbox(request.args)
+        except ValueError as e:
+            return jsonify({
+                'success': False,
+                'error': str(e)
+            }), 400
+        try:
+            zoom = float(request.args.get('zoom', CLUSTER_MAX_ZOOM + 1))
+            if not math.isfinite(zoom):
+                raise ValueError(zoom)
+            zoom = int(zoom)
+        except ValueError:
+            return jsonify({
+                'success': False,
+                'error': 'zoom must be a finite number'
+            }), 400
+        
+        
+        if zoom <= CLUSTER_MAX_ZOOM:
+            clusters = list(crime_news_collection.aggregate(cluster_pipeline(query, max(zoom, 0))))
+            return jsonify({
+                'success': True,
+                'mode': 'clusters',
+                'zoom': zoom,
+                'data': clusters,
+                'count': len(clusters)
+            })
+        
+        projection = {field: 1 for field in CRIME_DATA_FIELDS}
+        projection['_id'] = 0
+        crimes = list(crime_news_collection.find(query, projection).limit(MAX_BBOX_POINTS + 1))
+        
+        return jsonify({
+            'success': True,
+            'mode': 'points',
+            'zoom': zoom,
+            'data': crimes[:MAX_BBOX_POINTS],
+            'count': min(len(crimes), MAX_BBOX_POINTS),
+            'truncated': len(crimes) > MAX_BBOX_POINTS
         })
     except Exception as e:
         return jsonify({
@@ -206,25 +426,57 @@ def get_crime_data():
             'error': str(e)
         }), 500
 
+BBOX_ARGS = ('minLat', 'minLon', 'maxLat', 'maxLon')
+
 @app.route('/api/stats', methods=['GET'])
+@cached_analytics
 def get_stats():
+    """
+    Crime-type and severity counts.
+    Optional: ?since=&until= (ISO timestamps, on created_at) and
+    ?minLat=&minLon=&maxLat=&maxLon= to count one area
+    """
     try:
-        # Get crime statistics from crime_news collection
-        stats = list(crime_news_collection.aggregate([
-            {"$group": {"_id": "$crime_type", "count": {"$sum": 1}}},
-            {"$sort": {"count": -1}}
-        ]))
-        
-        severity_stats = list(crime_news_collection.aggregate([
-            {"$group": {"_id": "$severity_level", "count": {"$sum": 1}}},
-            {"$sort": {"count": -1}}
-        ]))
+        clauses = []
+        for arg, operator in (('since', '$gte'), ('until', '$lt')):
+            value = request.args.get(arg)
+            if value:
+                try:
+                    clauses.append({'created_at': {operator: datetime.fromisoformat(value.replace('Z', '+00:00'))}})
+                except ValueError:
+                    return jsonify({
+                        'success': False,
+                        'error': f"Invalid {arg} date. Use ISO format."
+                    }), 400
+        if any(arg in request.args for arg in BBOX_ARGS):
+            try:
+                clauses.append(parse_bbox(request.args))
+            except ValueError as e:
+                return jsonify({
+                    'success': False,
+                    'error': str(e)
+                }), 400
+        query = {'$and': clauses} if len(clauses) > 1 else (clauses[0] if clauses else {})
+        
+        # Unfiltered totals come from collection metadata instead of a count
+        pipeline, options = stats_pipeline(query, use_index=stats_index_ready)
+        try:
+            stats = next(crime_news_collection.aggregate(pipeline, **options))
+        except pymongo.errors.OperationFailure:
+            if not options:
+                raise
+            # STATS_INDEX was dropped after startup
+            stats = next(crime_news_collection.aggregate(pipeline))
+        if query:
+            total = stats['total'][0]['count'] if stats['total'] else 0
+        else:
+            total = crime_news_collection.estimated_document_count()
         
         return jsonify({
             'success': True,
-            'crime_types': stats,
-            'severity_levels': severity_stats,
-            'total_records': crime_news_collection.count_documents({})
+            'crime_types': stats['crime_types'],
+            'severity_levels': stats['severity_levels'],
+            'total_records': total
         })
     except Exception as e:
         return jsonify({
@@ -232,6 +484,69 @@ def get_stats():
             'error': str(e)
         }), 500
 
+def sse_event(crime):
+    """Format a crime document as a server-sent 'crime' event, id'd by its _id"""
+    crime = dict(crime)
+    crime['id'] = str(crime.pop('_id'))
+    return f"id: {crime['id']}\nevent: crime\ndata: {app.json.dumps(crime)}\n\n"
+
+@app.route('/api/crime-data/stream', methods=['GET'])
+def stream_crime_data():
+    """
+    Server-sent events: one 'crime' event per newly inserted crime.
+    Clients send the id of the last crime they have (Last-Event-ID on
+    reconnects, else ?after=, e.g. /api/crime-data's last_id) and first
+    receive everything inserted since. The cursor only bounds that replay:
+    live events are never filtered by it, so an ISO timestamp from a clock
+    running ahead cannot hide new crimes. Connections are long-lived, so
+    run gunicorn with threaded workers (e.g. -k gthread).
+    """
+    after = request.headers.get('Last-Event-ID') or request.args.get('after')
+    last_id = None
+    if after:
+        try:
+            last_id = parse_crime_cursor(after)
+        except ValueError:
+            return jsonify({
+                'success': False,
+                'error': 'Invalid cursor. Use an event id or an ISO timestamp.'
+            }), 400
+    
+    # Subscribe before replaying so nothing inserted in between is lost
+    subscriber = crime_events.subscribe()
+    
+    def generate():
+        # Ids the replay sent; live batches published meanwhile repeat some
+        replayed = set()
+        try:
+            yield f"retry: {SSE_RETRY_MS}\n\n"
+            if last_id is not None:
+                for crime in crime_events.replay(last_id).batch_size(DEFAULT_PAGE_SIZE):
+                    replayed.add(crime['_id'])
+                    yield sse_event(crime)
+            
+            while True:
+                try:
+                    crimes = subscriber.get(timeout=SSE_HEARTBEAT_SECONDS)
+                except queue.Empty:
+                    yield ": keep-alive\n\n"
+                    continue
+                if crimes is None:
+                    return  # Dropped as too slow; the browser reconnects and catches up
+                for crime in crimes:
+                    # Skip what the replay already sent
+                    if crime['_id'] in replayed:
+                        replayed.discard(crime['_id'])
+                        continue
+                    yield sse_event(crime)
+        finally:
+            crime_events.unsubscribe(subscriber)
+    
+    return Response(generate(), mimetype='text/event-stream', headers={
+        'Cache-Control': 'no-cache',
+        'X-Accel-Buffering': 'no'
+    })
+
 @app.route('/api/crime-data/new', methods=['GET'])
 def get_new_crime_data():
     """Get only new crime data since a given timestamp"""
@@ -281,12 +596,11 @@ def get_new_crime_data():
         }), 500
 
 @app.route('/api/analytics/hotspots', methods=['GET'])
+@cached_analytics
 def get_hotspots():
     """Get crime hotspots (high-risk areas)"""
     try:
-        analytics = CrimeAnalytics()
         hotspots = analytics.get_hotspots()
-        analytics.close()
         
         return jsonify({
             'success': True,
@@ -300,12 +614,11 @@ def get_hotspots():
         }), 500
 
 @app.route('/api/analytics/patterns', methods=['GET'])
+@cached_analytics
 def get_patterns():
     """Get crime time patterns"""
     try:
-        analytics = CrimeAnalytics()
         patterns = analytics.get_time_patterns()
-        analytics.close()
         
         return jsonify({
             'success': True,
@@ -325,9 +638,7 @@ def get_risk_score():
         lon = float(request.args.get('lon', 72.8777))
         radius = float(request.args.get('radius', 2))
         
-        analytics = CrimeAnalytics()
         risk = analytics.get_risk_score(lat, lon, radius)
-        analytics.close()
         
         return jsonify({
             'success': True,
@@ -340,14 +651,13 @@ def get_risk_score():
         }), 500
 
 @app.route('/api/analytics/trends', methods=['GET'])
+@cached_analytics
 def get_trends():
     """Get crime trends over time"""
     try:
         days = int(request.args.get('days', 30))
         
-        analytics = CrimeAnalytics()
         trends = analytics.get_crime_trends(days)
-        analytics.close()
         
         return jsonify({
             'success': True,
@@ -360,14 +670,13 @@ def get_trends():
         }), 500
 
 @app.route('/api/analytics/patrol-routes', methods=['GET'])
+@cached_analytics
 def get_patrol_routes():
     """Get suggested patrol routes for officers"""
     try:
         officer_count = int(request.args.get('officers', 5))
         
-        analytics = CrimeAnalytics()
         routes = analytics.get_patrol_suggestions(officer_count)
-        analytics.close()
         
         return jsonify({
             'success': True,
@@ -380,5 +689,10 @@ def get_patrol_routes():
             'error': str(e)
         }), 500
 
+@app.route('/metrics', methods=['GET'])
+def metrics():
+    """Prometheus scrape endpoint (this process's request and Mongo metrics)"""
+    return Response(server_metrics.prometheus(), mimetype='text/plain; version=0.0.4')
+
 if __name__ == '__main__':
     app.run(host='0.0.0.0', port=int(os.getenv('PORT', 5000)))
@@ -0,0 +1,153 @@
+"""
+Server Metrics
+Per-route request latency and response size histograms, status and error
+counts, and MongoDB command durations (through a pymongo CommandListener),
+rendered in Prometheus text format for the server's /metrics endpoint.
+
+Recording is a bisect and a few additions under one lock per observation.
+Routes are labelled by their rule ('/api/stats', not the full URL), so the
+number of series stays fixed. Streaming responses (NDJSON, SSE) are timed
+until their headers are sent and have no size.
+
+Each gunicorn worker process keeps its own numbers; scrape the workers
+individually or run a single process when exact totals matter.
+"""
+
+import threading
+import time
+from bisect import bisect_left
+from pymongo import monitoring
+from run_metrics import prometheus_sample
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+MONGO_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+UNMATCHED_ROUTE = '<unmatched>'
+
+
+class Histogram:
+    """Bucket counts (non-cumulative; cumulated when rendered), sum and count"""
+
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # last slot: above every bucket
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def samples(self, name, labels):
+        lines = []
+        cumulative = 0
+        for bound, count in zip(self.buckets, self.counts):
+            cumulative += count
+            lines.append(prometheus_sample(f"{name}_bucket", dict(labels, le=f"{bound:g}"), cumulative))
+        lines.append(prometheus_sample(f"{name}_bucket", dict(labels, le='+Inf'), self.count))
+        lines.append(prometheus_sample(f"{name}_sum", labels, round(self.sum, 6)))
+        lines.append(prometheus_sample(f"{name}_count", labels, self.count))
+        return lines
+
+
+class ServerMetrics:
+    def __init__(self):
+        self.latency = {}         # (route, method) -> Histogram
+        self.sizes = {}           # (route, method) -> Histogram
+        self.responses = {}       # (route, method, status) -> count
+        self.errors = {}          # (route, method) -> count of 5xx responses
+        self.mongo = {}           # command -> Histogram
+        self.mongo_failures = {}  # command -> count
+        self._lock = threading.Lock()
+
+    def observe_request(self, route, method, status, seconds, size=None):
+        key = (route, method)
+        with self._lock:
+            if key not in self.latency:
+                self.latency[key] = Histogram(LATENCY_BUCKETS)
+                self.sizes[key] = Histogram(SIZE_BUCKETS)
+            self.latency[key].observe(seconds)
+            if size is not None:
+                self.sizes[key].observe(size)
+            self.responses[key + (status,)] = self.responses.get(key + (status,), 0) + 1
+            if status >= 500:
+                self.errors[key] = self.errors.get(key, 0) + 1
+
+    def observe_command(self, command, seconds, failed=False):
+        with self._lock:
+            if command not in self.mongo:
+                self.mongo[command] = Histogram(MONGO_BUCKETS)
+            self.mongo[command].observe(seconds)
+            if failed:
+                self.mongo_failures[command] = self.mongo_failures.get(command, 0) + 1
+
+    def prometheus(self):
+        """Everything recorded so far, in Prometheus text exposition format"""
+        with self._lock:
+            lines = ['# HELP http_request_duration_seconds Time to produce a response, per route.',
+                     '# TYPE http_request_duration_seconds histogram']
+            for (route, method), histogram in sorted(self.latency.items()):
+                lines += histogram.samples('http_request_duration_seconds', {'route': route, 'method': method})
+
+            lines += ['# HELP http_response_size_bytes Response body size, per route.',
+                      '# TYPE http_response_size_bytes histogram']
+            for (route, method), histogram in sorted(self.sizes.items()):
+                lines += histogram.samples('http_response_size_bytes', {'route': route, 'method': method})
+
+            lines += ['# HELP http_responses_total Responses by route and status code.',
+                      '# TYPE http_responses_total counter']
+            for (route, method, status), count in sorted(self.responses.items()):
+                lines.append(prometheus_sample('http_responses_total',
+                                               {'route': route, 'method': method, 'status': status}, count))
+
+            lines += ['# HELP http_errors_total 5xx responses by route.',
+                      '# TYPE http_errors_total counter']
+            for (route, method), count in sorted(self.errors.items()):
+                lines.append(prometheus_sample('http_errors_total', {'route': route, 'method': method}, count))
+
+            lines += ['# HELP mongodb_command_duration_seconds MongoDB command round trips, per command.',
+                      '# TYPE mongodb_command_duration_seconds histogram']
+            for command, histogram in sorted(self.mongo.items()):
+                lines += histogram.samples('mongodb_command_duration_seconds', {'command': command})
+
+            lines += ['# HELP mongodb_command_failures_total Failed MongoDB commands, per command.',
+                      '# TYPE mongodb_command_failures_total counter']
+            for command, count in sorted(self.mongo_failures.items()):
+                lines.append(prometheus_sample('mongodb_command_failures_total', {'command': command}, count))
+        return '\n'.join(lines) + '\n'
+
+
+class MongoCommandMetrics(monitoring.CommandListener):
+    """Feeds every command's server-reported duration into ServerMetrics"""
+
+    def __init__(self, metrics):
+        self.metrics = metrics
+
+    def started(self, event):
+        pass
+
+    def succeeded(self, event):
+        self.metrics.observe_command(event.command_name, event.duration_micros / 1e6)
+
+    def failed(self, event):
+        self.metrics.observe_command(event.command_name, event.duration_micros / 1e6, failed=True)
+
+
+def instrument_app(app, metrics):
+    """Record latency, size and status of every request handled by app"""
+    from flask import g, request
+
+    @app.before_request
+    def start_timer():
+        g.metrics_start = time.perf_counter()
+
+    @app.after_request
+    def record_request(response):
+        start = g.pop('metrics_start', None)
+        if start is not None:
+            route = request.url_rule.rule if request.url_rule else UNMATCHED_ROUTE
+            size = None if response.is_streamed else response.calculate_content_length()
+            metrics.observe_request(route, request.method, response.status_code,
+                                    time.perf_counter() - start, size)
+        return response
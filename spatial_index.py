@@ -0,0 +1,118 @@
+"""
+Spatial Grid Index
+In-process uniform lat/lon grid for fast radius lookups over crime points
+"""
+
+import math
+from collections import defaultdict
+
+EARTH_RADIUS_KM = 6371
+KM_PER_DEGREE_LAT = 111.195  # 2 * pi * R / 360
+
+
+def haversine_km(lat1, lon1, lat2, lon2):
+    """Calculate distance between two coordinates in km"""
+    lat1_rad = math.radians(lat1)
+    lat2_rad = math.radians(lat2)
+    delta_lat = math.radians(lat2 - lat1)
+    delta_lon = math.radians(lon2 - lon1)
+
+    a = (math.sin(delta_lat / 2) ** 2 +
+         math.cos(lat1_rad) * math.cos(lat2_rad) *
+         math.sin(delta_lon / 2) ** 2)
+    c = 2 * math.asin(math.sqrt(a))
+
+    return EARTH_RADIUS_KM * c
+
+
+class SpatialGridIndex:
+    """
+    Buckets points into fixed-size lat/lon cells.
+    A radius query only visits the cells overlapping the query circle's
+    bounding box, then filters candidates with an exact haversine check.
+    """
+
+    def __init__(self, cell_deg=0.02):
+        # 0.02 deg is ~2.2 km of latitude, so the default 2 km risk radius
+        # touches a 3x3 block of cells
+        self.cell_deg = cell_deg
+        self.cells = defaultdict(list)
+        self.size = 0
+
+    def _cell(self, latitude, longitude):
+        return (math.floor(latitude / self.cell_deg),
+                math.floor(longitude / self.cell_deg))
+
+    def add(self, latitude, longitude, payload):
+        """Insert a point with an arbitrary payload"""
+        self.cells[self._cell(latitude, longitude)].append((latitude, longitude, payload))
+        self.size += 1
+
+    def with_points(self, points):
+        """
+        A new index with (latitude, longitude, payload) points added; this
+        one is left untouched (only the cells that change are copied)
+        """
+        index = SpatialGridIndex(self.cell_deg)
+        index.cells = defaultdict(list, self.cells)
+        index.size = self.size
+        copied = set()
+        for latitude, longitude, payload in points:
+            key = self._cell(latitude, longitude)
+            if key not in copied:
+                index.cells[key] = list(index.cells[key])
+                copied.add(key)
+            index.cells[key].append((latitude, longitude, payload))
+            index.size += 1
+        return index
+
+    def candidate_cells(self, latitude, longitude, radius_km):
+        """Return the keys of occupied cells overlapping the query radius"""
+        lat_delta = radius_km / KM_PER_DEGREE_LAT
+        min_lat = max(latitude - lat_delta, -90.0)
+        max_lat = min(latitude + lat_delta, 90.0)
+
+        # Longitude degrees shrink towards the poles; size the box for the
+        # widest point of the circle
+        max_abs_lat = max(abs(min_lat), abs(max_lat))
+        cos_lat = math.cos(math.radians(max_abs_lat))
+        if cos_lat < 1e-6:
+            lon_delta = 180.0
+        else:
+            lon_delta = min(radius_km / (KM_PER_DEGREE_LAT * cos_lat), 180.0)
+
+        row_min, col_min = self._cell(min_lat, longitude - lon_delta)
+        row_max, col_max = self._cell(max_lat, longitude + lon_delta)
+
+        box_cells = (row_max - row_min + 1) * (col_max - col_min + 1)
+        if box_cells > len(self.cells):
+            # Huge radius: cheaper to filter the occupied cells directly
+            return [key for key in self.cells
+                    if row_min <= key[0] <= row_max and col_min <= key[1] <= col_max]
+
+        keys = []
+        for row in range(row_min, row_max + 1):
+            for col in range(col_min, col_max + 1):
+                if (row, col) in self.cells:
+                    keys.append((row, col))
+        return keys
+
+    def candidates(self, latitude, longitude, radius_km):
+        """Return payloads of every point in the overlapping cells (unfiltered)"""
+        payloads = []
+        for key in self.candidate_cells(latitude, longitude, radius_km):
+            payloads.extend(payload for _, _, payload in self.cells[key])
+        return payloads
+
+    def query_radius(self, latitude, longitude, radius_km):
+        """Return (distance_km, payload) for every point within radius_km"""
+        results = []
+        for key in self.candidate_cells(latitude, longitude, radius_km):
+            for point_lat, point_lon, payload in self.cells[key]:
+                distance = haversine_km(latitude, longitude, point_lat, point_lon)
+                if distance <= radius_km:
+                    results.append((distance, payload))
+        return results
+
+    def __len__(self):
+        return self.size
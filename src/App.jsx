@@ -66,7 +66,6 @@ function App() {
     patrolRoutes: []
   })
   const [selectedCrimeTypes, setSelectedCrimeTypes] = useState(new Set())
-  const [lastFetchTime, setLastFetchTime] = useState(new Date().toISOString())
   
   // Authentication state
   const [user, setUser] = useState(null)
@@ -159,14 +158,16 @@ function App() {
     setSelectedCrimeTypes(new Set())
   }
 
-  const fetchAnalytics = async () => {
+  // fresh: ask the server to recheck its data version (after a live update)
+  const fetchAnalytics = async (fresh = false) => {
     try {
       const API_URL = import.meta.env.VITE_API_URL || 'http://localhost:5000'
+      const config = fresh ? { headers: { 'Cache-Control': 'no-cache' } } : {}
       const [hotspotsRes, patternsRes, trendsRes, patrolRes] = await Promise.all([
-        axios.get(`${API_URL}/api/analytics/hotspots`),
-        axios.get(`${API_URL}/api/analytics/patterns`),
-        axios.get(`${API_URL}/api/analytics/trends?days=30`),
-        axios.get(`${API_URL}/api/analytics/patrol-routes?officers=5`)
+        axios.get(`${API_URL}/api/analytics/hotspots`, config),
+        axios.get(`${API_URL}/api/analytics/patterns`, config),
+        axios.get(`${API_URL}/api/analytics/trends?days=30`, config),
+        axios.get(`${API_URL}/api/analytics/patrol-routes?officers=5`, config)
       ])
       
       setAnalytics({
@@ -180,6 +181,10 @@ function App() {
     }
   }
 
+  // Id of the newest crime loaded; the live stream resumes after it
+  // (null: nothing loaded, stream from now on)
+  const [streamAfter, setStreamAfter] = useState(undefined)
+
   useEffect(() => {
     // Fetch crime data from API
     const fetchData = async () => {
@@ -195,6 +200,7 @@ function App() {
         setCrimeData(crimeResponse.data.data)
         setStats(statsResponse.data)
         setLoading(false)
+        setStreamAfter(crimeResponse.data.last_id || null)
         
         // Fetch analytics after initial data load
         fetchAnalytics()
@@ -202,38 +208,60 @@ function App() {
         console.error('Error fetching data:', error)
         // Set loading to false even on error so map can render
         setLoading(false)
+        setStreamAfter(null)
       }
     }
 
     fetchData()
   }, [])
 
-  // Poll for new data every 60 seconds
+  // Live updates: the server pushes each new crime as a server-sent event.
+  // It starts after the newest crime of the initial load (a server id, so
+  // the browser clock plays no part); EventSource reconnects on its own and
+  // resumes from the last event id.
   useEffect(() => {
-    const pollInterval = setInterval(async () => {
+    if (streamAfter === undefined) return
+    const API_URL = import.meta.env.VITE_API_URL || 'http://localhost:5000'
+    const query = streamAfter ? `?after=${encodeURIComponent(streamAfter)}` : ''
+    const events = new EventSource(`${API_URL}/api/crime-data/stream${query}`)
+    let pending = []
+    let flushTimer = null
+
+    // New crimes arrive in bursts (one scraper run); apply them together
+    const flush = async () => {
+      const newCrimes = pending
+      pending = []
+      flushTimer = null
+      console.log(`🆕 Received ${newCrimes.length} new crime(s)`)
+      setCrimeData(prev => [...newCrimes.reverse(), ...prev])
+
       try {
-        const API_URL = import.meta.env.VITE_API_URL || 'http://localhost:5000'
-        const response = await axios.get(`${API_URL}/api/crime-data/new?since=${lastFetchTime}`)
-        
-        if (response.data.success && response.data.data.length > 0) {
-          const newCrimes = response.data.data
-          console.log(`🆕 Found ${newCrimes.length} new crime(s)`)
-          
-          setCrimeData(prev => [...newCrimes, ...prev])
-          
-          const statsResponse = await axios.get(`${API_URL}/api/stats`)
-          setStats(statsResponse.data)
-          
-          fetchAnalytics()
-          setLastFetchTime(response.data.timestamp)
-        }
+        // Bypass cached bodies from before the insert
+        const statsResponse = await axios.get(`${API_URL}/api/stats`, {
+          headers: { 'Cache-Control': 'no-cache' }
+        })
+        setStats(statsResponse.data)
+        fetchAnalytics(true)
       } catch (error) {
-        console.error('Error fetching new data:', error)
+        console.error('Error refreshing stats:', error)
       }
-    }, 60000) // 60 seconds
+    }
+
+    events.addEventListener('crime', (event) => {
+      pending.push(JSON.parse(event.data))
+      if (!flushTimer) {
+        flushTimer = setTimeout(flush, 2000)
+      }
+    })
+    events.onerror = () => {
+      console.warn('Live updates disconnected, reconnecting...')
+    }
 
-    return () => clearInterval(pollInterval)
-  }, [lastFetchTime])
+    return () => {
+      events.close()
+      clearTimeout(flushTimer)
+    }
+  }, [streamAfter])
 
   return (
     <Router>
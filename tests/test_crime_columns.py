@@ -0,0 +1,104 @@
+import os
+import sys
+import threading
+from datetime import datetime
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import crime_analytics
+from crime_analytics import CrimeAnalytics
+from crime_columns import CrimeColumns
+
+
+class ListCollection:
+    """The slice of a pymongo collection CrimeColumns uses: find by _id, sorted"""
+
+    full_name = 'fir_data.crime_news_test'
+
+    def __init__(self):
+        self.documents = []
+        self._lock = threading.Lock()
+
+    def insert(self, document):
+        with self._lock:
+            document['_id'] = len(self.documents) + 1
+            self.documents.append(document)
+
+    def find(self, query, projection=None):
+        last_id = query.get('_id', {}).get('$gt', 0)
+        with self._lock:
+            found = [dict(doc) for doc in self.documents if doc['_id'] > last_id]
+        return ListCursor(found)
+
+
+class CaughtUpCollection(ListCollection):
+    """Same column store, but its top-up query never finds new documents"""
+
+    def find(self, query, projection=None):
+        return ListCursor()
+
+
+class ListCursor(list):
+    def sort(self, key, direction):
+        return ListCursor(sorted(self, key=lambda doc: doc[key], reverse=direction < 0))
+
+
+def crime(i):
+    return {'latitude': 19.07 + (i % 10) * 0.001, 'longitude': 72.87, 'severity_level': 'High',
+            'crime_type': 'theft', 'location': 'Kurla', 'created_at': datetime.now()}
+
+
+def analytics_for(collection):
+    analytics = CrimeAnalytics.__new__(CrimeAnalytics)
+    analytics.collection = collection
+    return analytics
+
+
+def test_with_documents_leaves_the_snapshot_untouched():
+    first = CrimeColumns().with_documents([dict(crime(0), _id=1)])
+    second = first.with_documents([dict(crime(1), _id=1), dict(crime(2), _id=2)])
+    assert len(first) == 1 and len(first.grid) == 1
+    assert len(second) == 2 and len(second.grid) == 2
+    assert second.last_id == 2
+    assert sorted(second.grid.candidates(19.07, 72.87, 2)) == [0, 1]
+    assert first.grid.candidates(19.07, 72.87, 2) == [0]
+
+
+def test_risk_score_while_new_crimes_are_loaded():
+    collection = ListCollection()
+    collection.insert(crime(0))
+    crime_analytics._column_stores.pop(collection.full_name, None)
+    analytics = analytics_for(collection)
+    analytics._get_columns()
+    # Readers whose top-up found nothing read while the writer loads rows
+    reader = analytics_for(CaughtUpCollection())
+    errors = []
+    done = threading.Event()
+
+    def read():
+        while not done.is_set():
+            try:
+                result = reader.get_risk_score(19.07, 72.87)
+                assert result['nearby_crimes'] >= 1
+            except Exception as e:
+                errors.append(e)
+                return
+
+    def write():
+        # Top-ups of a few hundred rows keep the old grid-before-arrays window open
+        for i in range(1, 10001):
+            collection.insert(crime(i))
+            if i % 500 == 0:
+                analytics._get_columns()
+        done.set()
+
+    readers = [threading.Thread(target=read) for _ in range(4)]
+    writer = threading.Thread(target=write)
+    for thread in readers + [writer]:
+        thread.start()
+    for thread in readers + [writer]:
+        thread.join()
+
+    assert not errors
+    assert len(analytics._get_columns()) == 10001
+    assert analytics.get_risk_score(19.07, 72.87)['nearby_crimes'] == 10001
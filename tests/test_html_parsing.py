@@ -0,0 +1,26 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from html_parsing import strip_tags
+
+
+def test_bare_angle_brackets_are_text():
+    assert strip_tags('x < 5 and y > 3') == 'x < 5 and y > 3'
+    assert strip_tags('1<2 and 3>2') == '1<2 and 3>2'
+
+
+def test_tags_are_removed_and_entities_decoded():
+    description = ('<a href="https://news.example.com/1" target="_blank">Extortion case in Andheri</a>'
+                   '&nbsp;<font color="#6f6f6f">Mid-Day</font><p>Calls &amp; threats.</p>')
+    assert strip_tags(description) == 'Extortion case in Andheri Mid-Day Calls & threats.'
+
+
+def test_block_tags_separate_words():
+    assert strip_tags('<p>Robbery</p><p>in Kurla</p>') == 'Robbery in Kurla'
+    assert strip_tags('Chain<b>snatching</b>') == 'Chainsnatching'
+
+
+def test_declarations_scripts_and_comments_are_dropped():
+    assert strip_tags('<!DOCTYPE html><script>var a = 1 < 2;</script><!-- ad -->Theft') == 'Theft'
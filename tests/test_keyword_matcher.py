@@ -0,0 +1,41 @@
+import os
+import sys
+import threading
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from keyword_matcher import KeywordMatcher
+
+
+def matcher():
+    keywords = KeywordMatcher()
+    keywords.add_group('crime', {'theft': ['theft', 'chain snatch'], 'murder': ['murder', 'killed']})
+    keywords.add_group('location', [f"area {i}" for i in range(20000)] + ['Kurla', 'Dadar'], whole_words=True)
+    return keywords
+
+
+def test_labels_in_priority_order():
+    hits = matcher().match('Man killed after chain snatching in Dadar near Kurla')
+    assert hits == {'crime': ['theft', 'murder'], 'location': ['Kurla', 'Dadar']}
+
+
+def test_first_use_from_many_threads():
+    keywords = matcher()
+    start = threading.Barrier(8)
+    results, errors = [], []
+
+    def match():
+        start.wait()
+        try:
+            results.append(keywords.match('Theft reported in Kurla'))
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=match) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert not errors
+    assert results == [{'crime': ['theft'], 'location': ['Kurla']}] * 8
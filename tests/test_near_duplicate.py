@@ -0,0 +1,63 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from near_duplicate import NearDuplicateIndex, places_in, same_places
+
+
+def is_duplicate_pair(first, second):
+    index = NearDuplicateIndex()
+    index.add(first)
+    return index.find(second)[0] is not None
+
+
+def test_same_story_with_different_punctuation_is_duplicate():
+    assert is_duplicate_pair('Woman robbed of gold chain in Andheri, probe on',
+                             'Woman robbed of gold chain in Andheri; probe on')
+
+
+def test_syndicated_copy_with_small_wording_change_is_duplicate():
+    assert is_duplicate_pair('Two arrested for murder of businessman in Thane',
+                             '2 arrested for murder of businessman in Thane')
+
+
+def test_city_prefix_does_not_hide_duplicate():
+    assert is_duplicate_pair('Mumbai: Two arrested for murder of businessman over property dispute in Kurla',
+                             'Two arrested for murder of businessman over property dispute in Kurla')
+
+
+def test_same_crime_in_another_locality_is_kept():
+    assert not is_duplicate_pair('Man held for theft in Kurla', 'Man held for theft in Dadar')
+    assert not is_duplicate_pair('Youth stabbed to death in Malad', 'Youth stabbed to death in Powai')
+
+
+def test_long_titles_differing_only_by_locality_are_kept():
+    assert not is_duplicate_pair('Two arrested for murder of businessman over property dispute in Kurla',
+                                 'Two arrested for murder of businessman over property dispute in Powai')
+
+
+def test_is_duplicate_stores_new_titles():
+    index = NearDuplicateIndex()
+    assert not index.is_duplicate('Man held for theft in Kurla')
+    assert index.is_duplicate('Man held for theft in Kurla!')
+    assert not index.is_duplicate('Man held for theft in Dadar')
+    assert len(index) == 2
+
+
+def test_places_in_uses_canonical_names():
+    assert places_in('Robbery near BKC, Mumbai') == {'Bandra', 'Mumbai'}
+    assert places_in('Chain snatching reported') == frozenset()
+
+
+def test_same_places_allows_subsets_and_unknowns():
+    assert same_places(frozenset({'Kurla'}), frozenset({'Kurla', 'Mumbai'}))
+    assert not same_places(frozenset({'Kurla'}), frozenset({'Dadar'}))
+    assert same_places(None, frozenset({'Dadar'}))
+
+
+def test_signature_only_entries_still_match():
+    index = NearDuplicateIndex()
+    signature = index.hasher.signature('Youth stabbed to death in Malad')
+    index.add(None, key='https://example.com/1', signature=signature)
+    assert index.find('Youth stabbed to death in Malad')[0] == 'https://example.com/1'
@@ -0,0 +1,42 @@
+"""
+check_query_plans.py as a test: every hot query must be served by an index.
+Needs a mongod (QUERY_PLAN_MONGO_URI, default mongodb://localhost:27017);
+skipped when none is reachable.
+"""
+
+import os
+import sys
+
+import pymongo
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import check_query_plans as plans
+from db_schema import ensure_indexes
+
+
+@pytest.fixture(scope='module')
+def db():
+    client = pymongo.MongoClient(plans.MONGO_URI, serverSelectionTimeoutMS=2000)
+    try:
+        client.admin.command('ping')
+    except pymongo.errors.PyMongoError:
+        client.close()
+        pytest.skip(f"no mongod at {plans.MONGO_URI}")
+    client.drop_database(plans.SCRATCH_DB)
+    database = client[plans.SCRATCH_DB]
+    plans.seed(database)
+    assert ensure_indexes(database) == 0
+    yield database
+    client.drop_database(plans.SCRATCH_DB)
+    client.close()
+
+
+def test_every_hot_query_uses_an_index(db):
+    scans = {}
+    for name, explain in plans.hot_queries(db).items():
+        stages = plans.winning_stages(explain())
+        if not stages or 'COLLSCAN' in stages:
+            scans[name] = stages
+    assert not scans